@@ -1,11 +1,17 @@
+import hashlib
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 from django.contrib import messages
 from django.utils.html import format_html
 from django.utils import timezone
+from django.urls import path
+from django.http import JsonResponse
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
 from unfold.admin import ModelAdmin
 from unfold.decorators import display, action
+from apps.dashboard.models import DailyStats
 from .models import User
 from .forms import CustomUserCreationForm, CustomUserChangeForm
 from .utils import generate_temporary_password, mask_personal_id
@@ -17,7 +23,9 @@ def get_environment(request):
 
 
 def dashboard_callback(request, context):
-    """Dashboard customization callback."""
+    """Add the KPIs and daily series from the dashboard rollups. Admin only."""
+    if request.user.is_superuser or getattr(request.user, 'role', '') == 'admin':
+        context.update(DailyStats.objects.dashboard())
     return context
 
 
@@ -34,6 +42,11 @@ class UserAdmin(ModelAdmin, BaseUserAdmin):
     ordering = ['-created_at']
     actions = ['reset_password_action', 'delete_users']
     
+    # Settings for the lookup endpoint behind UserAutocompleteFilter
+    lookup_limit = 20
+    lookup_min_length = 2
+    lookup_cache_timeout = 60
+    
     def get_actions(self, request):
         """Remove the default delete action - only soft delete is allowed."""
         actions = super().get_actions(request)
@@ -51,6 +64,58 @@ class UserAdmin(ModelAdmin, BaseUserAdmin):
         # Always exclude deleted users from the list
         return qs.filter(is_deleted=False)
     
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search autocomplete widgets by indexed prefix and read only the
+        columns the dropdown shows, so encrypted fields are not loaded and
+        decrypted. The changelist search keeps the default behaviour.
+        """
+        match = request.resolver_match
+        if match and match.url_name == 'autocomplete':
+            if search_term:
+                queryset = queryset.search_prefix(search_term)
+            return queryset.only('id', 'first_name', 'last_name'), False
+        return super().get_search_results(request, queryset, search_term)
+    
+    def get_urls(self):
+        """Add the user lookup URL."""
+        urls = super().get_urls()
+        custom_urls = [
+            path('lookup/',
+                 self.admin_site.admin_view(self.lookup_view),
+                 name='accounts_user_lookup'),
+        ]
+        return custom_urls + urls
+    
+    def lookup_view(self, request):
+        """
+        Return users whose name, email or company starts with the search
+        term as JSON. Only the displayed columns are read, and results are
+        cached briefly since the same prefixes are typed over and over.
+        """
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        
+        term = ' '.join(request.GET.get('term', '').lower().split())
+        if len(term) < self.lookup_min_length:
+            return JsonResponse({'results': []})
+        
+        cache_key = 'admin-user-lookup:' + hashlib.md5(term.encode()).hexdigest()
+        results = cache.get(cache_key)
+        if results is None:
+            users = (
+                User.objects.filter(is_deleted=False)
+                .search_prefix(term)
+                .order_by('first_name', 'last_name')
+                .values_list('id', 'first_name', 'last_name', 'email')[:self.lookup_limit]
+            )
+            results = [
+                {'id': str(pk), 'text': f'{first_name} {last_name} ({email})'}
+                for pk, first_name, last_name, email in users
+            ]
+            cache.set(cache_key, results, self.lookup_cache_timeout)
+        return JsonResponse({'results': results})
+    
     @action(description=_('მომხმარებლების წაშლა'))
     def delete_users(self, request, queryset):
         """Delete selected users (soft delete - data preserved in database)."""
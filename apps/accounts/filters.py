@@ -0,0 +1,50 @@
+import uuid
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from .models import User
+
+
+class UserAutocompleteFilter(admin.SimpleListFilter):
+    """
+    Filter a changelist by user. Instead of listing every user in the
+    sidebar, the filter renders a search box that asks the user lookup
+    endpoint for matches, so only the selected user is loaded here.
+    Subclasses set user_field to the path of the user relation.
+    """
+    title = _('განმცხადებელი')
+    parameter_name = 'applicant'
+    template = 'admin/accounts/user/autocomplete_filter.html'
+    user_field = 'user'
+    
+    def lookups(self, request, model_admin):
+        user = self.selected_user()
+        return [(str(user.pk), str(user))] if user else []
+    
+    def has_output(self):
+        return True
+    
+    def selected_user(self):
+        """Return the user picked in the filter, or None."""
+        try:
+            user_id = uuid.UUID(self.value())
+        except (TypeError, ValueError):
+            return None
+        return User.objects.filter(pk=user_id).only('id', 'first_name', 'last_name').first()
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.user_field: self.value()})
+        return queryset
+    
+    def choices(self, changelist):
+        yield {
+            'selected': self.value() is None,
+            'query_string': changelist.get_query_string(remove=[self.parameter_name]),
+            'display': _('All'),
+        }
+        for lookup, title in self.lookup_choices:
+            yield {
+                'selected': True,
+                'query_string': changelist.get_query_string({self.parameter_name: lookup}),
+                'display': title,
+            }
@@ -1,8 +1,35 @@
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 
-class UserManager(BaseUserManager):
+# Columns searched by prefix; each has a lower(column) text_pattern_ops index
+PREFIX_SEARCH_FIELDS = ('first_name', 'last_name', 'email', 'company_name')
+
+
+class UserQuerySet(models.QuerySet):
+    """Custom QuerySet for User model."""
+    
+    def search_prefix(self, term):
+        """
+        Filter users whose name, email or company starts with every word of
+        the term, case-insensitively. The comparisons are written against
+        lower(column) so they can use the prefix indexes instead of scanning.
+        """
+        queryset = self.alias(**{
+            f'{field}_lower': Lower(field) for field in PREFIX_SEARCH_FIELDS
+        })
+        for word in term.lower().split():
+            condition = Q()
+            for field in PREFIX_SEARCH_FIELDS:
+                condition |= Q(**{f'{field}_lower__startswith': word})
+            queryset = queryset.filter(condition)
+        return queryset
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """Manager for unified User model."""
     
     def create_user(self, email, password=None, **extra_fields):
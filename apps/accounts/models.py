@@ -1,5 +1,7 @@
 import uuid
 from django.db import models
+from django.db.models.functions import Lower
+from django.contrib.postgres.indexes import OpClass
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import EmailValidator
@@ -143,6 +145,13 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name = _('მომხმარებელი')
         verbose_name_plural = _('მომხმარებლები')
         db_table = 'users'
+        # Prefix indexes for UserQuerySet.search_prefix
+        indexes = [
+            models.Index(OpClass(Lower('first_name'), name='text_pattern_ops'), name='users_first_name_prefix_idx'),
+            models.Index(OpClass(Lower('last_name'), name='text_pattern_ops'), name='users_last_name_prefix_idx'),
+            models.Index(OpClass(Lower('email'), name='text_pattern_ops'), name='users_email_prefix_idx'),
+            models.Index(OpClass(Lower('company_name'), name='text_pattern_ops'), name='users_company_prefix_idx'),
+        ]
     
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
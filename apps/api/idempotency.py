@@ -0,0 +1,79 @@
+import hashlib
+import json
+from functools import wraps
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.response import Response
+from rest_framework import status
+from .models import IdempotencyKey
+from .utils import error_response
+
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(request):
+    """
+    Hash the method, path and parsed body of a request.
+    The body is hashed in canonical form so that key order and whitespace
+    do not make a retry look like a different request.
+    """
+    body = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder)
+    payload = '\x1f'.join([request.method, request.path, body])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def idempotent(view_method):
+    """
+    Make a platform API view method idempotent through the Idempotency-Key header.
+    The first response for a key is stored per platform; retries within the
+    TTL get it back without running the view again. Requests without the
+    header are handled as before.
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.META.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return error_response(
+                'VALIDATION_ERROR',
+                f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters',
+                status.HTTP_400_BAD_REQUEST
+            )
+
+        fingerprint = request_fingerprint(request)
+        record, created = IdempotencyKey.objects.reserve(request.user, key, fingerprint)
+
+        if not created:
+            if record.request_fingerprint != fingerprint:
+                return error_response(
+                    'IDEMPOTENCY_KEY_REUSED',
+                    'Idempotency-Key was already used for a different request',
+                    status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+            if not record.is_completed:
+                return error_response(
+                    'IDEMPOTENCY_REQUEST_IN_PROGRESS',
+                    'A request with this Idempotency-Key is still being processed',
+                    status.HTTP_409_CONFLICT
+                )
+            response = Response(record.response_body, status=record.response_status)
+            response['Idempotent-Replayed'] = 'true'
+            return response
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception:
+            # Release the key so the client can retry
+            record.delete()
+            raise
+
+        if response.status_code >= 500:
+            record.delete()
+        else:
+            record.store_response(response)
+        return response
+
+    return wrapper
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.api.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = 'Deletes stored Idempotency-Key responses whose TTL has passed'
+
+    def handle(self, *args, **options):
+        deleted, _ = IdempotencyKey.objects.expired().delete()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired idempotency keys'))
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:19
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('bids', '0018_bid_fingerprints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('key', models.CharField(max_length=255, verbose_name='გასაღები')),
+                ('request_fingerprint', models.CharField(help_text='Hash of the method, path and body of the first request', max_length=64, verbose_name='მოთხოვნის ანაბეჭდი')),
+                ('response_status', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='პასუხის სტატუსი')),
+                ('response_body', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='პასუხი')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='შექმნის თარიღი')),
+                ('expires_at', models.DateTimeField(verbose_name='ვადის გასვლის თარიღი')),
+                ('platform', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='idempotency_keys', to='bids.platform', verbose_name='პლათფორმა')),
+            ],
+            options={
+                'verbose_name': 'იდემპოტენტურობის გასაღები',
+                'verbose_name_plural': 'იდემპოტენტურობის გასაღებები',
+                'db_table': 'api_idempotency_keys',
+                'indexes': [models.Index(fields=['expires_at'], name='api_idempot_expires_ff6124_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='idempotencykey',
+            constraint=models.UniqueConstraint(fields=('platform', 'key'), name='unique_idempotency_key_per_platform'),
+        ),
+    ]
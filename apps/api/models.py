@@ -0,0 +1,130 @@
+import uuid
+from datetime import timedelta
+from django.db import models, transaction, IntegrityError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.translation import gettext_lazy as _
+from django.utils import timezone
+from django.conf import settings
+
+
+class IdempotencyKeyManager(models.Manager):
+    """Manager for reserving and expiring idempotency keys."""
+
+    # Times to retry when the competing request releases the key mid-reservation
+    reserve_attempts = 3
+
+    def reserve(self, platform, key, request_fingerprint):
+        """
+        Claim a key for a new request.
+        Returns (record, created); created is False when a live record for the
+        same key already exists, either finished (replayable) or in progress.
+        """
+        for attempt in range(self.reserve_attempts):
+            now = timezone.now()
+            expires_at = now + timedelta(seconds=settings.API_IDEMPOTENCY_KEY_TTL)
+
+            try:
+                with transaction.atomic():
+                    record = self.create(
+                        platform=platform,
+                        key=key,
+                        request_fingerprint=request_fingerprint,
+                        expires_at=expires_at
+                    )
+                return record, True
+            except IntegrityError:
+                pass
+
+            # Take over an expired record in place; a concurrent request can win this race only once
+            taken_over = self.filter(platform=platform, key=key, expires_at__lte=now).update(
+                request_fingerprint=request_fingerprint,
+                response_status=None,
+                response_body=None,
+                created_at=now,
+                expires_at=expires_at
+            )
+            try:
+                return self.get(platform=platform, key=key), bool(taken_over)
+            except self.model.DoesNotExist:
+                # The competing request failed and released the key; claim it again
+                if attempt == self.reserve_attempts - 1:
+                    raise
+
+    def expired(self):
+        """Return records whose TTL has passed."""
+        return self.filter(expires_at__lte=timezone.now())
+
+
+class IdempotencyKey(models.Model):
+    """
+    First response to an API request sent with an Idempotency-Key header.
+    Stored per platform so that retries replay it instead of running again.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    platform = models.ForeignKey(
+        'bids.Platform',
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys',
+        verbose_name=_('პლათფორმა')
+    )
+    key = models.CharField(
+        _('გასაღები'),
+        max_length=255
+    )
+    request_fingerprint = models.CharField(
+        _('მოთხოვნის ანაბეჭდი'),
+        max_length=64,
+        help_text=_('Hash of the method, path and body of the first request')
+    )
+    response_status = models.PositiveSmallIntegerField(
+        _('პასუხის სტატუსი'),
+        null=True,
+        blank=True
+    )
+    response_body = models.JSONField(
+        _('პასუხი'),
+        null=True,
+        blank=True,
+        encoder=DjangoJSONEncoder
+    )
+    created_at = models.DateTimeField(
+        _('შექმნის თარიღი'),
+        default=timezone.now
+    )
+    expires_at = models.DateTimeField(
+        _('ვადის გასვლის თარიღი')
+    )
+
+    objects = IdempotencyKeyManager()
+
+    class Meta:
+        verbose_name = _('იდემპოტენტურობის გასაღები')
+        verbose_name_plural = _('იდემპოტენტურობის გასაღებები')
+        db_table = 'api_idempotency_keys'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['platform', 'key'],
+                name='unique_idempotency_key_per_platform'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.platform_id} - {self.key}"
+
+    @property
+    def is_completed(self):
+        """Check if the first request has finished and its response is stored."""
+        return self.response_status is not None
+
+    def store_response(self, response):
+        """Store the response of the first request for replay."""
+        self.response_status = response.status_code
+        self.response_body = response.data
+        self.save(update_fields=['response_status', 'response_body'])
@@ -1,7 +1,11 @@
+import uuid
+from django.core import signing
+from django.utils.dateparse import parse_datetime
 from rest_framework import serializers
 from apps.metadata.models import Currency, CargoType, TransportType, VolumeUnit
 from apps.shipments.models import Shipment
-from apps.bids.models import Bid
+from apps.bids.models import Bid, BidSubmission
+from apps.archive.models import ArchivedBid
 
 
 class CurrencySerializer(serializers.ModelSerializer):
@@ -134,37 +138,71 @@ class BidCreateSerializer(serializers.Serializer):
         help_text='Unique ID of the driver on your platform'
     )
     
-    def validate_currency(self, value):
-        """Validate that currency exists."""
-        try:
-            Currency.objects.get(code=value, is_active=True)
-        except Currency.DoesNotExist:
-            raise serializers.ValidationError('Invalid currency code')
-        return value
+    def get_shipment(self, data):
+        """Return the shipment the bid is submitted on."""
+        return self.context.get('shipment')
+    
+    def is_active_currency(self, code):
+        """Check if a currency code exists and is active."""
+        return Currency.objects.filter(code=code, is_active=True).exists()
     
     def validate(self, data):
         """Validate bid data against shipment."""
         # Get shipment from context
-        shipment = self.context.get('shipment')
+        shipment = self.get_shipment(data)
         if not shipment:
             raise serializers.ValidationError('Shipment not found')
         
-        # Get currency object
-        try:
-            currency = Currency.objects.get(code=data['currency'])
-        except Currency.DoesNotExist:
-            raise serializers.ValidationError({'currency': 'Invalid currency code'})
-        
-        # Check if currency matches shipment's preferred currency
-        if currency.id != shipment.preferred_currency_id:
-            raise serializers.ValidationError({
-                'currency': 'Currency must match shipment preferred currency'
-            })
+        # The shipment's preferred currency is already loaded, so a valid
+        # bid needs no currency query
+        currency = shipment.preferred_currency
+        if data['currency'] == currency.code and currency.is_active:
+            # Store currency object for later use
+            data['currency_obj'] = currency
+            return data
         
-        # Store currency object for later use
-        data['currency_obj'] = currency
+        # Tell an unknown currency apart from a mismatching one
+        if not self.is_active_currency(data['currency']):
+            raise serializers.ValidationError({'currency': 'Invalid currency code'})
         
-        return data
+        raise serializers.ValidationError({
+            'currency': 'Currency must match shipment preferred currency'
+        })
+
+
+class BidBatchItemSerializer(BidCreateSerializer):
+    """
+    Serializer for one bid of a batch submission.
+    Shipments and active currency codes are resolved in bulk by the view
+    and passed in the context as 'shipments' and 'active_currency_codes'.
+    """
+    
+    shipment_id = serializers.UUIDField(
+        help_text='ID of the shipment to bid on'
+    )
+    
+    def get_shipment(self, data):
+        """Return the shipment from the prefetched batch shipments."""
+        shipment = self.context['shipments'].get(data['shipment_id'])
+        if shipment is None:
+            raise serializers.ValidationError({'shipment_id': 'Shipment not found'})
+        data['shipment'] = shipment
+        return shipment
+    
+    def is_active_currency(self, code):
+        """Check a currency code against the prefetched active codes."""
+        return code in self.context['active_currency_codes']
+
+
+class BidBatchCreateSerializer(serializers.Serializer):
+    """Serializer for the envelope of a batch bid submission."""
+    
+    bids = serializers.ListField(
+        child=serializers.DictField(),
+        min_length=1,
+        max_length=100,
+        help_text='Bids to submit (max 100); each is validated separately'
+    )
 
 
 class BidResponseSerializer(serializers.ModelSerializer):
@@ -189,3 +227,124 @@ class BidResponseSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['id', 'shipment_id', 'status', 'created_at']
+
+
+class ArchivedBidSerializer(serializers.ModelSerializer):
+    """Serializer for bids of archived shipments."""
+    
+    currency = CurrencySerializer(read_only=True)
+    
+    class Meta:
+        model = ArchivedBid
+        fields = [
+            'id',
+            'display_id',
+            'shipment_id',
+            'company_name',
+            'price',
+            'currency',
+            'estimated_delivery_time',
+            'comment',
+            'contact_person',
+            'contact_phone',
+            'status',
+            'created_at',
+            'archived_at'
+        ]
+        read_only_fields = fields
+
+
+class BidStatusQuerySerializer(serializers.Serializer):
+    """Serializer for the batch bid status lookup."""
+    
+    bid_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        max_length=500,
+        help_text='Bid IDs to look up (max 500)'
+    )
+    driver_ids = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        required=False,
+        max_length=500,
+        help_text='Driver IDs whose bids to look up (max 500)'
+    )
+    changed_since = serializers.DateTimeField(
+        required=False,
+        help_text='Only return bids updated at or after this time'
+    )
+    cursor = serializers.CharField(
+        required=False,
+        help_text='next_cursor of the previous page, to continue after it'
+    )
+    
+    cursor_salt = 'api.bid-status-cursor'
+    
+    @classmethod
+    def encode_cursor(cls, bid):
+        """
+        Return an opaque cursor pointing after the given bid in (updated_at, id)
+        order. The timestamp keeps its microseconds, so bids sharing a second,
+        or one bulk UPDATE, are still told apart by their ID.
+        """
+        return signing.dumps({'t': bid.updated_at.isoformat(), 'id': str(bid.id)}, salt=cls.cursor_salt)
+    
+    def validate_cursor(self, value):
+        """Decode the cursor into (updated_at, id)."""
+        try:
+            position = signing.loads(value, salt=self.cursor_salt)
+            updated_at = parse_datetime(position['t'])
+            bid_id = uuid.UUID(position['id'])
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            raise serializers.ValidationError('Invalid cursor')
+        if updated_at is None:
+            raise serializers.ValidationError('Invalid cursor')
+        return updated_at, bid_id
+    
+    def validate(self, data):
+        """Require at least one filter so the lookup stays bounded."""
+        if not data.get('bid_ids') and not data.get('driver_ids') and not data.get('changed_since'):
+            raise serializers.ValidationError(
+                'Provide bid_ids, driver_ids or changed_since'
+            )
+        return data
+
+
+class BidStatusSerializer(serializers.ModelSerializer):
+    """Serializer for bid status entries."""
+    
+    driver_id = serializers.CharField(source='external_user_id', read_only=True)
+    
+    class Meta:
+        model = Bid
+        fields = [
+            'id',
+            'display_id',
+            'shipment_id',
+            'driver_id',
+            'status',
+            'updated_at'
+        ]
+        read_only_fields = ['id', 'display_id', 'shipment_id', 'status', 'updated_at']
+
+
+class BidSubmissionStatusSerializer(serializers.ModelSerializer):
+    """Serializer for the state of a queued bid submission."""
+    
+    tracking_id = serializers.UUIDField(source='id', read_only=True)
+    bid_status = serializers.CharField(source='bid.status', read_only=True, default=None)
+    
+    class Meta:
+        model = BidSubmission
+        fields = [
+            'tracking_id',
+            'shipment_id',
+            'status',
+            'error_code',
+            'error_message',
+            'bid_id',
+            'bid_status',
+            'created_at',
+            'processed_at'
+        ]
+        read_only_fields = fields
@@ -4,7 +4,11 @@ from .views import (
     ShipmentListAPIView,
     ShipmentDetailAPIView,
     BidCreateAPIView,
-    PlatformBidListAPIView
+    BidBatchCreateAPIView,
+    BidSubmissionStatusAPIView,
+    PlatformBidListAPIView,
+    PlatformBidHistoryAPIView,
+    PlatformBidStatusAPIView
 )
 
 
@@ -15,5 +19,9 @@ urlpatterns = [
     path('shipments/', ShipmentListAPIView.as_view(), name='shipment-list'),
     path('shipments/<uuid:pk>/', ShipmentDetailAPIView.as_view(), name='shipment-detail'),
     path('shipments/<uuid:pk>/bids/', BidCreateAPIView.as_view(), name='bid-create'),
+    path('bids/batch/', BidBatchCreateAPIView.as_view(), name='bid-batch-create'),
+    path('bid-submissions/<uuid:pk>/', BidSubmissionStatusAPIView.as_view(), name='bid-submission-status'),
     path('my-bids/', PlatformBidListAPIView.as_view(), name='my-bids'),
+    path('my-bids/history/', PlatformBidHistoryAPIView.as_view(), name='my-bids-history'),
+    path('my-bids/status/', PlatformBidStatusAPIView.as_view(), name='my-bids-status'),
 ]
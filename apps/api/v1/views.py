@@ -1,23 +1,33 @@
+import uuid
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.shortcuts import get_object_or_404
+from django.conf import settings
 from django.db.models import Q, Count
 # from django_ratelimit.decorators import ratelimit
 # from django.utils.decorators import method_decorator
 from apps.metadata.models import Currency, CargoType, TransportType, VolumeUnit
 from apps.shipments.models import Shipment
-from apps.bids.models import Bid
+from apps.bids.models import Bid, BidSubmission
+from apps.archive.models import ArchivedBid
 from .serializers import (
     MetadataSerializer,
     ShipmentListSerializer,
     ShipmentDetailSerializer,
     BidCreateSerializer,
-    BidResponseSerializer
+    BidBatchItemSerializer,
+    BidBatchCreateSerializer,
+    BidResponseSerializer,
+    ArchivedBidSerializer,
+    BidStatusQuerySerializer,
+    BidStatusSerializer,
+    BidSubmissionStatusSerializer
 )
 from .permissions import IsAuthenticatedPlatform
 from ..utils import success_response, error_response
+from ..idempotency import idempotent
 
 
 class MetadataAPIView(APIView):
@@ -199,14 +209,27 @@ class BidCreateAPIView(APIView):
         "contact_phone": "string",
         "driver_id": "string"
     }
+    
+    An optional Idempotency-Key header makes retries safe: the first
+    response for a key is replayed for repeated requests.
+    
+    In async ingestion mode (BID_INGESTION_MODE = 'async') the bid is only
+    validated and queued; the response is 202 with a tracking_id for
+    GET /api/v1/bid-submissions/{tracking_id}/.
     """
     
     permission_classes = [IsAuthenticatedPlatform]
     
+    @idempotent
     def post(self, request, pk):
         """Create a new bid on a shipment."""
-        # Get shipment (exclude shipments from soft-deleted users)
-        shipment = get_object_or_404(Shipment, pk=pk, user__is_deleted=False)
+        # Get shipment (exclude shipments from soft-deleted users); the
+        # preferred currency is joined so validation needs no extra query
+        shipment = get_object_or_404(
+            Shipment.objects.select_related('preferred_currency'),
+            pk=pk,
+            user__is_deleted=False
+        )
         
         # Validate request data
         serializer = BidCreateSerializer(
@@ -225,26 +248,13 @@ class BidCreateAPIView(APIView):
         currency = validated_data.pop('currency_obj')
         platform = request.user  # Platform instance from authentication
         
-        # Check if bid can be submitted
-        can_submit, error_code, error_message = Bid.objects.can_submit_bid(
-            shipment=shipment,
-            platform=platform,
-            price=validated_data['price'],
-            estimated_delivery_time=validated_data['estimated_delivery_time'],
-            currency=currency,
-            company_name=validated_data['company_name'],
-            external_user_id=validated_data['driver_id']
-        )
+        if settings.BID_INGESTION_MODE == 'async':
+            return self.enqueue(shipment, platform, currency, validated_data)
         
-        if not can_submit:
-            return error_response(
-                error_code,
-                error_message,
-                status.HTTP_409_CONFLICT
-            )
-        
-        # Create bid
-        bid = Bid.objects.create(
+        # Check and create the bid under a shared lock on the shipment, so it
+        # cannot land on a shipment being completed or cancelled concurrently
+        # (a concurrent identical bid is caught by the unique fingerprint)
+        bid, error_code, error_message = Bid.objects.submit_bid(
             shipment=shipment,
             platform=platform,
             company_name=validated_data['company_name'],
@@ -258,6 +268,13 @@ class BidCreateAPIView(APIView):
             status='pending'
         )
         
+        if bid is None:
+            return error_response(
+                error_code,
+                error_message,
+                status.HTTP_409_CONFLICT
+            )
+        
         # Return success response
         response_serializer = BidResponseSerializer(bid)
         return Response({
@@ -270,6 +287,174 @@ class BidCreateAPIView(APIView):
                 'created_at': bid.created_at.isoformat()
             }
         }, status=status.HTTP_201_CREATED)
+    
+    def enqueue(self, shipment, platform, currency, validated_data):
+        """Queue a validated bid for process_bid_queue and return 202."""
+        submission = BidSubmission.objects.create(
+            platform=platform,
+            shipment=shipment,
+            currency=currency,
+            payload={
+                'company_name': validated_data['company_name'],
+                'price': str(validated_data['price']),
+                'estimated_delivery_time': validated_data['estimated_delivery_time'],
+                'comment': validated_data.get('comment', ''),
+                'contact_person': validated_data['contact_person'],
+                'contact_phone': validated_data['contact_phone'],
+                'driver_id': validated_data['driver_id'],
+            }
+        )
+        return Response({
+            'success': True,
+            'message': 'Bid queued for processing',
+            'data': {
+                'tracking_id': str(submission.id),
+                'shipment_id': str(shipment.id),
+                'status': submission.status,
+                'created_at': submission.created_at.isoformat()
+            }
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class BidBatchCreateAPIView(APIView):
+    """
+    POST /api/v1/bids/batch/
+    
+    Submit many bids, on any number of shipments, in one request.
+    Shipments and currencies are resolved in bulk, the bid rules run with
+    set-based queries and admitted bids are inserted with one INSERT.
+    Requires platform authentication.
+    
+    Request body:
+    {
+        "bids": [
+            {
+                "shipment_id": "uuid",
+                ... same fields as POST /api/v1/shipments/{id}/bids/
+            },
+            ...
+        ] (max 100)
+    }
+    
+    Every bid gets a result at its index, with the same error codes as
+    single submission. An optional Idempotency-Key header makes retries safe.
+    """
+    
+    permission_classes = [IsAuthenticatedPlatform]
+    
+    @idempotent
+    def post(self, request):
+        """Create the bids of a batch."""
+        serializer = BidBatchCreateSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return error_response(
+                'VALIDATION_ERROR',
+                serializer.errors,
+                status.HTTP_400_BAD_REQUEST
+            )
+        
+        items = serializer.validated_data['bids']
+        platform = request.user  # Platform instance from authentication
+        
+        # Resolve all shipments and currency codes of the batch up front
+        shipment_ids = set()
+        for item in items:
+            try:
+                shipment_ids.add(uuid.UUID(str(item.get('shipment_id'))))
+            except ValueError:
+                pass
+        context = {
+            'shipments': Shipment.objects.select_related('preferred_currency').filter(
+                user__is_deleted=False
+            ).in_bulk(shipment_ids),
+            'active_currency_codes': set(Currency.objects.filter(
+                code__in={str(item.get('currency')) for item in items},
+                is_active=True
+            ).values_list('code', flat=True))
+        }
+        
+        results = [None] * len(items)
+        candidates = []
+        for index, item in enumerate(items):
+            item_serializer = BidBatchItemSerializer(data=item, context=context)
+            if item_serializer.is_valid():
+                candidates.append((index, item_serializer.validated_data))
+            else:
+                results[index] = self.error_result(index, 'VALIDATION_ERROR', item_serializer.errors)
+        
+        # Check and insert all valid bids together
+        bids = [
+            Bid(
+                shipment=data['shipment'],
+                platform=platform,
+                company_name=data['company_name'],
+                price=data['price'],
+                currency=data['currency_obj'],
+                estimated_delivery_time=data['estimated_delivery_time'],
+                comment=data.get('comment', ''),
+                contact_person=data['contact_person'],
+                contact_phone=data['contact_phone'],
+                external_user_id=data['driver_id'],
+                status='pending'
+            )
+            for index, data in candidates
+        ]
+        created = Bid.objects.submit_bids(platform, bids) if bids else []
+        for (index, data), (bid, error_code, error_message) in zip(candidates, created):
+            if bid is None:
+                results[index] = self.error_result(index, error_code, error_message)
+                continue
+            results[index] = {
+                'index': index,
+                'success': True,
+                'bid_id': str(bid.id),
+                'shipment_id': str(bid.shipment_id),
+                'status': bid.status,
+                'created_at': bid.created_at.isoformat()
+            }
+        
+        created_count = sum(1 for result in results if result['success'])
+        return success_response({
+            'results': results,
+            'created': created_count,
+            'failed': len(results) - created_count
+        })
+    
+    @staticmethod
+    def error_result(index, error_code, error_message):
+        """Return the result entry of a refused bid."""
+        return {
+            'index': index,
+            'success': False,
+            'error': {
+                'code': error_code,
+                'message': error_message
+            }
+        }
+
+
+class BidSubmissionStatusAPIView(generics.RetrieveAPIView):
+    """
+    GET /api/v1/bid-submissions/{tracking_id}/
+    
+    Returns the processing state of a bid queued in async ingestion mode:
+    queued, created (with the bid and its current status) or failed (with
+    the same error code a synchronous submission would have returned).
+    Requires platform authentication.
+    """
+    
+    serializer_class = BidSubmissionStatusSerializer
+    permission_classes = [IsAuthenticatedPlatform]
+    
+    def get_queryset(self):
+        """Return submissions of the authenticated platform."""
+        return BidSubmission.objects.filter(platform=self.request.user).select_related('bid')
+    
+    def retrieve(self, request, *args, **kwargs):
+        """Return the submission state."""
+        serializer = self.get_serializer(self.get_object())
+        return success_response(serializer.data)
 
 
 class PlatformBidListAPIView(generics.ListAPIView):
@@ -310,3 +495,91 @@ class PlatformBidListAPIView(generics.ListAPIView):
         
         serializer = self.get_serializer(queryset, many=True)
         return success_response({'bids': serializer.data})
+
+
+class PlatformBidHistoryAPIView(PlatformBidListAPIView):
+    """
+    GET /api/v1/my-bids/history/
+    
+    Returns bids of the authenticated platform on archived shipments
+    (closed longer than ARCHIVE_AFTER_DAYS), newest first.
+    Requires platform authentication.
+    """
+    serializer_class = ArchivedBidSerializer
+    
+    def get_queryset(self):
+        """Return archived bids for the current platform."""
+        return ArchivedBid.objects.filter(platform=self.request.user).select_related(
+            'currency'
+        ).order_by('-created_at')
+
+
+class PlatformBidStatusAPIView(APIView):
+    """
+    POST /api/v1/my-bids/status/
+    
+    Returns the current status of selected bids of the authenticated platform
+    in a single indexed query, for reconciliation without paging through
+    the whole bid history.
+    Requires platform authentication.
+    
+    Request body (at least one filter is required):
+    {
+        "bid_ids": ["uuid", ...] (optional, max 500),
+        "driver_ids": ["string", ...] (optional, max 500),
+        "changed_since": "datetime" (optional)
+    }
+    
+    Results are ordered by updated_at and ID. When has_more is true, repeat
+    the same request with cursor set to next_cursor to get the next page.
+    """
+    
+    permission_classes = [IsAuthenticatedPlatform]
+    max_results = 500
+    
+    def post(self, request):
+        """Return statuses of the requested bids."""
+        serializer = BidStatusQuerySerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return error_response(
+                'VALIDATION_ERROR',
+                serializer.errors,
+                status.HTTP_400_BAD_REQUEST
+            )
+        
+        validated_data = serializer.validated_data
+        queryset = Bid.objects.filter(platform=request.user)
+        
+        # Bids matching either the given IDs or the given drivers
+        lookup = Q()
+        if validated_data.get('bid_ids'):
+            lookup |= Q(id__in=validated_data['bid_ids'])
+        if validated_data.get('driver_ids'):
+            lookup |= Q(external_user_id__in=validated_data['driver_ids'])
+        if lookup:
+            queryset = queryset.filter(lookup)
+        
+        if validated_data.get('changed_since'):
+            queryset = queryset.filter(updated_at__gte=validated_data['changed_since'])
+        
+        # Keyset continuation: strictly after the last bid of the previous page
+        if validated_data.get('cursor'):
+            updated_at, bid_id = validated_data['cursor']
+            queryset = queryset.filter(
+                Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=bid_id)
+            )
+        
+        bids = list(
+            queryset.only(
+                'id', 'display_id', 'shipment_id', 'external_user_id', 'status', 'updated_at'
+            ).order_by('updated_at', 'id')[:self.max_results + 1]
+        )
+        has_more = len(bids) > self.max_results
+        bids = bids[:self.max_results]
+        
+        return success_response({
+            'bids': BidStatusSerializer(bids, many=True).data,
+            'has_more': has_more,
+            'next_cursor': BidStatusQuerySerializer.encode_cursor(bids[-1]) if has_more else None
+        })
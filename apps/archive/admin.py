@@ -0,0 +1,110 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from unfold.admin import ModelAdmin, TabularInline
+from unfold.decorators import display
+from .models import ArchivedShipment, ArchivedBid
+
+
+class ArchivedBidInline(TabularInline):
+    """Read-only bids of an archived shipment."""
+    
+    model = ArchivedBid
+    extra = 0
+    can_delete = False
+    
+    fields = ['display_id', 'platform', 'company_name', 'price', 'currency', 'estimated_delivery_time',
+              'status', 'created_at']
+    readonly_fields = fields
+    
+    verbose_name = _('შეთავაზება')
+    verbose_name_plural = _('შეთავაზებები')
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('platform', 'currency')
+    
+    def has_add_permission(self, request, obj=None):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ArchivedShipment)
+class ArchivedShipmentAdmin(ModelAdmin):
+    """Admin interface for archived shipments (read-only)."""
+    
+    list_display = ['display_id', 'route_display', 'user', 'status', 'closed_at_display', 'archived_at']
+    list_filter = ['status', 'archived_at']
+    search_fields = ['display_id', 'pickup_location', 'delivery_location']
+    ordering = ['-created_at']
+    list_select_related = ['user']
+    inlines = [ArchivedBidInline]
+    
+    def get_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+    
+    def get_readonly_fields(self, request, obj=None):
+        return self.get_fields(request, obj)
+    
+    @display(description=_('მარშრუტი'))
+    def route_display(self, obj):
+        return str(obj)
+    
+    @display(description=_('დახურვის თარიღი'))
+    def closed_at_display(self, obj):
+        return obj.completed_at or obj.cancelled_at
+    
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # Clients see only their own archived shipments, as in the shipments admin
+        if not request.user.is_superuser and getattr(request.user, 'role', '') == 'client':
+            return qs.filter(user=request.user)
+        return qs
+    
+    def has_add_permission(self, request):
+        """Shipments are archived by the archive_closed_shipments command."""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        """Archived shipments are read-only."""
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        """Only Admins can delete archived shipments."""
+        return request.user.is_superuser or getattr(request.user, 'role', '') == 'admin'
+
+
+@admin.register(ArchivedBid)
+class ArchivedBidAdmin(ModelAdmin):
+    """Admin interface for archived bids (read-only)."""
+    
+    list_display = ['display_id', 'company_name', 'platform', 'price', 'currency', 'status', 'created_at',
+                    'archived_at']
+    list_filter = ['status', 'archived_at']
+    search_fields = ['display_id', 'company_name', 'platform__company_name']
+    ordering = ['-created_at']
+    list_select_related = ['platform', 'currency']
+    
+    def get_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+    
+    def get_readonly_fields(self, request, obj=None):
+        return self.get_fields(request, obj)
+    
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if not request.user.is_superuser and getattr(request.user, 'role', '') == 'client':
+            return qs.filter(shipment__user=request.user)
+        return qs
+    
+    def has_add_permission(self, request):
+        """Bids are archived together with their shipment."""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        """Archived bids are read-only."""
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        """Archived bids are deleted together with their shipment."""
+        return False
@@ -0,0 +1,86 @@
+from datetime import timedelta
+from django.db import models, transaction, connection
+from django.db.models import Q
+from django.utils import timezone
+from django.conf import settings
+
+
+def copy_rows_sql(source, target, key_column):
+    """
+    Build an INSERT ... SELECT copying rows of source into target.
+    Columns present in both tables are copied as they are and archived_at is
+    set from the first parameter; the second parameter is the array of
+    key_column values to copy.
+    """
+    target_columns = {field.column for field in target._meta.concrete_fields}
+    columns = [
+        connection.ops.quote_name(field.column)
+        for field in source._meta.concrete_fields
+        if field.column in target_columns
+    ]
+    column_list = ', '.join(columns)
+    return (
+        f'INSERT INTO {connection.ops.quote_name(target._meta.db_table)} ({column_list}, "archived_at") '
+        f'SELECT {column_list}, %s FROM {connection.ops.quote_name(source._meta.db_table)} '
+        f'WHERE {connection.ops.quote_name(key_column)} = ANY(%s)'
+    )
+
+
+class ArchivedShipmentManager(models.Manager):
+    """Manager for moving closed shipments out of the hot tables."""
+    
+    def default_cutoff(self):
+        """Return the close time before which shipments are archived."""
+        return timezone.now() - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+    
+    def archivable(self, cutoff=None):
+        """Return completed and cancelled shipments closed at or before cutoff."""
+        from apps.shipments.models import Shipment
+        
+        if cutoff is None:
+            cutoff = self.default_cutoff()
+        return Shipment.objects.filter(
+            Q(status='completed', completed_at__lte=cutoff) |
+            Q(status='cancelled', cancelled_at__lte=cutoff)
+        )
+    
+    def archive_batch(self, cutoff=None, limit=500):
+        """
+        Move up to limit archivable shipments and their bids to the archive.
+        Rows are copied with one INSERT ... SELECT per table and then deleted
+        from the hot tables in the same transaction, so a shipment is always
+        readable from exactly one place. The deletes are plain DELETE
+        statements too, dependent rows first, so no row is loaded into Python
+        whatever the number of bids. Shipments locked by another archiver are
+        skipped. Returns (shipments, bids) moved.
+        """
+        from apps.shipments.models import Shipment
+        from apps.bids.models import Bid, BidSubmission, RejectedBidCache
+        from .models import ArchivedBid
+        
+        with transaction.atomic():
+            shipment_ids = list(
+                self.archivable(cutoff)
+                .select_for_update(skip_locked=True)
+                .order_by()
+                .values_list('pk', flat=True)[:limit]
+            )
+            if not shipment_ids:
+                return 0, 0
+            
+            archived_at = timezone.now()
+            with connection.cursor() as cursor:
+                cursor.execute(copy_rows_sql(Shipment, self.model, 'id'), [archived_at, shipment_ids])
+                cursor.execute(copy_rows_sql(Bid, ArchivedBid, 'shipment_id'), [archived_at, shipment_ids])
+                bids = cursor.rowcount
+            
+            hot = Shipment._base_manager.filter(pk__in=shipment_ids)
+            # Clear the selected bid first so the bids can be deleted before their shipments
+            hot.update(selected_bid=None)
+            # Nothing listens to their deletion, so the cascade is done by hand
+            # rather than by the deletion collector
+            for model in (BidSubmission, RejectedBidCache, Bid):
+                model._base_manager.filter(shipment_id__in=shipment_ids)._raw_delete(self.db)
+            hot._raw_delete(self.db)
+        
+        return len(shipment_ids), bids
@@ -0,0 +1,91 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:35
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('bids', '0020_platform_deletion_jobs'),
+        ('metadata', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedBid',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('display_id', models.PositiveIntegerField(null=True, unique=True, verbose_name='Display ID')),
+                ('company_name', models.CharField(max_length=200, verbose_name='კომპანიის დასახელება')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='ფასი')),
+                ('estimated_delivery_time', models.IntegerField(verbose_name='მიწოდების დრო (საათებში)')),
+                ('comment', models.TextField(blank=True, null=True, verbose_name='კომენტარი')),
+                ('contact_person', models.CharField(max_length=100, verbose_name='საკონტაქტო პირი')),
+                ('contact_phone', models.CharField(max_length=20, verbose_name='საკონტაქტო ტელეფონი')),
+                ('external_user_id', models.CharField(blank=True, max_length=100, null=True, verbose_name='გარე მომხმარებლის ID')),
+                ('status', models.CharField(choices=[('pending', 'მოლოდინში'), ('accepted', 'მიღებული'), ('rejected', 'უარყოფილი')], max_length=20, verbose_name='სტატუსი')),
+                ('created_at', models.DateTimeField(verbose_name='შექმნის თარიღი')),
+                ('updated_at', models.DateTimeField(verbose_name='განახლების თარიღი')),
+                ('is_deleted', models.BooleanField(default=False, verbose_name='წაშლილია')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='წაშლის თარიღი')),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='დაარქივების თარიღი')),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='metadata.currency', verbose_name='ვალუტა')),
+                ('deleted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='წაშალა')),
+                ('platform', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_bids', to='bids.platform', verbose_name='პლათფორმა')),
+            ],
+            options={
+                'verbose_name': 'დაარქივებული ბიდი',
+                'verbose_name_plural': 'დაარქივებული ბიდები',
+                'db_table': 'archived_bids',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedShipment',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('display_id', models.PositiveIntegerField(null=True, unique=True, verbose_name='Display ID')),
+                ('pickup_location', models.TextField(verbose_name='ტვირთის აღების ადგილი')),
+                ('pickup_date', models.DateTimeField(verbose_name='ტვირთის აღების თარიღი და დრო')),
+                ('delivery_location', models.TextField(verbose_name='ტვირთის ჩაბარების ადგილი')),
+                ('cargo_volume', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='ტვირთის მოცულობა')),
+                ('additional_conditions', models.TextField(blank=True, null=True, verbose_name='დამატებითი პირობები')),
+                ('status', models.CharField(choices=[('active', 'აქტიური'), ('completed', 'დასრულებული'), ('cancelled', 'გაუქმებული')], max_length=20, verbose_name='სტატუსი')),
+                ('created_at', models.DateTimeField(verbose_name='შექმნის თარიღი')),
+                ('updated_at', models.DateTimeField(verbose_name='განახლების თარიღი')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='დასრულების თარიღი')),
+                ('cancelled_at', models.DateTimeField(blank=True, null=True, verbose_name='გაუქმების თარიღი')),
+                ('is_deleted', models.BooleanField(default=False, verbose_name='წაშლილია')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='წაშლის თარიღი')),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='დაარქივების თარიღი')),
+                ('cargo_type', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='metadata.cargotype', verbose_name='ტვირთის ტიპი')),
+                ('deleted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='წაშალა')),
+                ('preferred_currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='metadata.currency', verbose_name='სასურველი ვალუტა')),
+                ('selected_bid', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='archive.archivedbid', verbose_name='არჩეული ბიდი')),
+                ('transport_type', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='metadata.transporttype', verbose_name='ტრანსპორტის ტიპი')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_shipments', to=settings.AUTH_USER_MODEL, verbose_name='განმცხადებელი')),
+                ('volume_unit', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='metadata.volumeunit', verbose_name='მოცულობის ერთეული')),
+            ],
+            options={
+                'verbose_name': 'დაარქივებული განაცხადი',
+                'verbose_name_plural': 'დაარქივებული განაცხადები',
+                'db_table': 'archived_shipments',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='archivedbid',
+            name='shipment',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bids', to='archive.archivedshipment', verbose_name='განაცხადი'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedbid',
+            index=models.Index(fields=['platform', 'created_at'], name='archived_bi_platfor_f35e9b_idx'),
+        ),
+    ]
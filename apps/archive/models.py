@@ -0,0 +1,245 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from django.utils import timezone
+from django.conf import settings
+from apps.shipments.models import Shipment
+from apps.bids.models import Bid
+from .managers import ArchivedShipmentManager
+
+
+class ArchivedShipment(models.Model):
+    """
+    Completed or cancelled shipment moved out of the shipments table.
+    Columns match Shipment so rows are copied with INSERT ... SELECT; the
+    primary key and display ID are kept, so archived shipments are found by
+    the same identifiers as before.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        editable=False
+    )
+    display_id = models.PositiveIntegerField(
+        _('Display ID'),
+        null=True,
+        unique=True
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_shipments',
+        verbose_name=_('განმცხადებელი')
+    )
+    pickup_location = models.TextField(
+        _('ტვირთის აღების ადგილი')
+    )
+    pickup_date = models.DateTimeField(
+        _('ტვირთის აღების თარიღი და დრო')
+    )
+    delivery_location = models.TextField(
+        _('ტვირთის ჩაბარების ადგილი')
+    )
+    cargo_type = models.ForeignKey(
+        'metadata.CargoType',
+        on_delete=models.PROTECT,
+        related_name='+',
+        verbose_name=_('ტვირთის ტიპი')
+    )
+    cargo_volume = models.DecimalField(
+        _('ტვირთის მოცულობა'),
+        max_digits=10,
+        decimal_places=2
+    )
+    volume_unit = models.ForeignKey(
+        'metadata.VolumeUnit',
+        on_delete=models.PROTECT,
+        related_name='+',
+        verbose_name=_('მოცულობის ერთეული')
+    )
+    transport_type = models.ForeignKey(
+        'metadata.TransportType',
+        on_delete=models.PROTECT,
+        related_name='+',
+        verbose_name=_('ტრანსპორტის ტიპი')
+    )
+    preferred_currency = models.ForeignKey(
+        'metadata.Currency',
+        on_delete=models.PROTECT,
+        related_name='+',
+        verbose_name=_('სასურველი ვალუტა')
+    )
+    additional_conditions = models.TextField(
+        _('დამატებითი პირობები'),
+        blank=True,
+        null=True
+    )
+    status = models.CharField(
+        _('სტატუსი'),
+        max_length=20,
+        choices=Shipment.STATUS_CHOICES
+    )
+    # Archived bids are copied after their shipment, so the reference is not enforced
+    selected_bid = models.ForeignKey(
+        'ArchivedBid',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=_('არჩეული ბიდი')
+    )
+    created_at = models.DateTimeField(
+        _('შექმნის თარიღი')
+    )
+    updated_at = models.DateTimeField(
+        _('განახლების თარიღი')
+    )
+    completed_at = models.DateTimeField(
+        _('დასრულების თარიღი'),
+        null=True,
+        blank=True
+    )
+    cancelled_at = models.DateTimeField(
+        _('გაუქმების თარიღი'),
+        null=True,
+        blank=True
+    )
+    is_deleted = models.BooleanField(
+        _('წაშლილია'),
+        default=False
+    )
+    deleted_at = models.DateTimeField(
+        _('წაშლის თარიღი'),
+        null=True,
+        blank=True
+    )
+    deleted_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=_('წაშალა')
+    )
+    archived_at = models.DateTimeField(
+        _('დაარქივების თარიღი'),
+        default=timezone.now
+    )
+    
+    objects = ArchivedShipmentManager()
+    
+    class Meta:
+        verbose_name = _('დაარქივებული განაცხადი')
+        verbose_name_plural = _('დაარქივებული განაცხადები')
+        db_table = 'archived_shipments'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.pickup_location} → {self.delivery_location}"
+
+
+class ArchivedBid(models.Model):
+    """
+    Bid of an archived shipment, moved out of the bids table with it.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        editable=False
+    )
+    display_id = models.PositiveIntegerField(
+        _('Display ID'),
+        null=True,
+        unique=True
+    )
+    shipment = models.ForeignKey(
+        ArchivedShipment,
+        on_delete=models.CASCADE,
+        related_name='bids',
+        verbose_name=_('განაცხადი')
+    )
+    platform = models.ForeignKey(
+        'bids.Platform',
+        on_delete=models.CASCADE,
+        related_name='archived_bids',
+        verbose_name=_('პლათფორმა')
+    )
+    company_name = models.CharField(
+        _('კომპანიის დასახელება'),
+        max_length=200
+    )
+    price = models.DecimalField(
+        _('ფასი'),
+        max_digits=10,
+        decimal_places=2
+    )
+    currency = models.ForeignKey(
+        'metadata.Currency',
+        on_delete=models.PROTECT,
+        related_name='+',
+        verbose_name=_('ვალუტა')
+    )
+    estimated_delivery_time = models.IntegerField(
+        _('მიწოდების დრო (საათებში)')
+    )
+    comment = models.TextField(
+        _('კომენტარი'),
+        blank=True,
+        null=True
+    )
+    contact_person = models.CharField(
+        _('საკონტაქტო პირი'),
+        max_length=100
+    )
+    contact_phone = models.CharField(
+        _('საკონტაქტო ტელეფონი'),
+        max_length=20
+    )
+    external_user_id = models.CharField(
+        _('გარე მომხმარებლის ID'),
+        max_length=100,
+        blank=True,
+        null=True
+    )
+    status = models.CharField(
+        _('სტატუსი'),
+        max_length=20,
+        choices=Bid.STATUS_CHOICES
+    )
+    created_at = models.DateTimeField(
+        _('შექმნის თარიღი')
+    )
+    updated_at = models.DateTimeField(
+        _('განახლების თარიღი')
+    )
+    is_deleted = models.BooleanField(
+        _('წაშლილია'),
+        default=False
+    )
+    deleted_at = models.DateTimeField(
+        _('წაშლის თარიღი'),
+        null=True,
+        blank=True
+    )
+    deleted_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=_('წაშალა')
+    )
+    archived_at = models.DateTimeField(
+        _('დაარქივების თარიღი'),
+        default=timezone.now
+    )
+    
+    class Meta:
+        verbose_name = _('დაარქივებული ბიდი')
+        verbose_name_plural = _('დაარქივებული ბიდები')
+        db_table = 'archived_bids'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['platform', 'created_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.company_name} - {self.price} {self.currency.code}"
@@ -5,28 +5,19 @@ from django.utils.translation import gettext_lazy as _
 from django.contrib import messages
 from django.urls import reverse
 from django.utils import timezone
+from django.conf import settings
 from unfold.admin import ModelAdmin, TabularInline
 from unfold.decorators import display, action
-from .models import Platform, PlatformAPIKey, Bid, RejectedBidCache
-from apps.accounts.models import User
+from .models import Platform, PlatformAPIKey, Bid, RejectedBidCache, BidSubmission, PlatformDeletionJob
+from apps.accounts.filters import UserAutocompleteFilter
+from apps.common.admin_mixins import ChangelistQuerysetMixin, EstimatedCountMixin
 
 
 
 
-class ShipmentUserFilter(admin.SimpleListFilter):
-    title = _('განმცხადებელი')
-    parameter_name = 'applicant'
-
-    def lookups(self, request, model_admin):
-        # Get distinct users who have shipments related to bids, excluding deleted users
-        user_ids = Bid.objects.values_list('shipment__user', flat=True).distinct()
-        users = User.objects.filter(id__in=user_ids, is_deleted=False).order_by('first_name', 'last_name')
-        return [(u.id, str(u)) for u in users]
-
-    def queryset(self, request, queryset):
-        if self.value():
-            return queryset.filter(shipment__user__id=self.value())
-        return queryset
+class ShipmentUserFilter(UserAutocompleteFilter):
+    """Filter bids by the user who made the shipment. Admin only."""
+    user_field = 'shipment__user'
 
 
 class PlatformAPIKeyInline(TabularInline):
@@ -47,11 +38,11 @@ class PlatformAPIKeyInline(TabularInline):
 
 
 @admin.register(Platform)
-class PlatformAdmin(ModelAdmin):
+class PlatformAdmin(ChangelistQuerysetMixin, ModelAdmin):
     """Admin interface for Platform model."""
     
     list_display = ['company_name', 'contact_person', 'contact_email', 'contact_phone', 
-                    'is_active_badge', 'api_keys_count', 'bids_count', 'created_at']
+                    'is_active_badge', 'api_keys_count', 'bids_count', 'bid_stats', 'win_rate', 'created_at']
     list_filter = ['is_active', 'created_at']
     search_fields = ['company_name', 'contact_email', 'contact_person', 'contact_phone']
     ordering = ['-created_at']
@@ -95,27 +86,33 @@ class PlatformAdmin(ModelAdmin):
     def get_queryset(self, request):
         """Filter out soft-deleted platforms from the admin list."""
         qs = super().get_queryset(request)
-        return qs.filter(is_deleted=False)
+        qs = qs.filter(is_deleted=False)
+        if self.is_changelist_request(request):
+            # All count columns come from one aggregate query
+            qs = qs.with_bid_stats()
+        return qs
 
     def _perform_soft_delete(self, request, queryset):
-        deleted_count = 0
-        bids_rejected_count = 0
+        pending_count = Bid.objects.filter(platform__in=queryset, status='pending').count()
         
-        for platform in queryset:
-            # Reject all pending bids from this platform
-            pending_bids = Bid.objects.filter(platform=platform, status='pending')
-            for bid in pending_bids:
-                bid.reject()
-                bids_rejected_count += 1
-            
-            # Soft delete the platform
-            platform.is_deleted = True
-            platform.deleted_at = timezone.now()
-            platform.deleted_by = request.user
-            platform.is_active = False  # Also deactivate
-            platform.save()
-            
-            deleted_count += 1
+        # Too many bids to reject within the request: hand over to a background job
+        if pending_count > settings.PLATFORM_SOFT_DELETE_SYNC_LIMIT:
+            job = PlatformDeletionJob.objects.create(requested_by=request.user, total_bids=pending_count)
+            job.platforms.set(queryset)
+            url = reverse('admin:bids_platformdeletionjob_change', args=[job.pk])
+            self.message_user(
+                request,
+                format_html(
+                    '{} <a href="{}">{}</a>',
+                    _(f'{pending_count} მიმდინარე ბიდის გაუქმება ფონურ რეჟიმში დაიწყება.'),
+                    url,
+                    _('პროგრესის ნახვა')
+                ),
+                messages.INFO
+            )
+            return
+        
+        deleted_count, bids_rejected_count = queryset.soft_delete(request.user)
             
         self.message_user(
             request,
@@ -133,15 +130,14 @@ class PlatformAdmin(ModelAdmin):
             self._perform_soft_delete(request, queryset)
             return
 
-        # Check for active bids
-        platforms_with_bids = []
-        for platform in queryset:
-            pending_count = platform.bids.filter(status='pending').count()
-            if pending_count > 0:
-                platforms_with_bids.append({
-                    'platform': platform,
-                    'count': pending_count
-                })
+        # Check for active bids (one grouped query for the whole selection)
+        platforms_with_bids = [
+            {
+                'platform': platform,
+                'count': platform.pending_count
+            }
+            for platform in queryset.with_pending_bids_count().filter(pending_count__gt=0)
+        ]
         
         # If there are platforms with active bids, show confirmation
         if platforms_with_bids:
@@ -178,18 +174,28 @@ class PlatformAdmin(ModelAdmin):
     
     @display(description=_('API გასაღებები'))
     def api_keys_count(self, obj):
-        total = obj.api_keys.count()
-        active = obj.api_keys.filter(is_active=True).count()
-        return format_html('{} ({} აქტიური)', total, active)
+        return format_html('{} ({} აქტიური)', obj.api_key_total, obj.active_api_key_total)
     
-    @display(description=_('ბიდები'))
+    @display(description=_('ბიდები'), ordering='bid_total')
     def bids_count(self, obj):
-        count = obj.bids.count()
+        count = obj.bid_total
         if count > 0:
-            url = reverse('admin:bids_bid_changelist') + f'?broker__id__exact={obj.pk}'
+            url = reverse('admin:bids_bid_changelist') + f'?platform__id__exact={obj.pk}'
             return format_html('<a href="{}">{}</a>', url, count)
         return '0'
     
+    @display(description=_('მოლოდინში / მიღებული'))
+    def bid_stats(self, obj):
+        return f"{obj.pending_bid_total} / {obj.accepted_bid_total}"
+    
+    @display(description=_('მოგების მაჩვენებელი'))
+    def win_rate(self, obj):
+        """Share of decided (accepted or rejected) bids that were accepted."""
+        decided = obj.accepted_bid_total + obj.rejected_bid_total
+        if not decided:
+            return '-'
+        return f"{obj.accepted_bid_total * 100 / decided:.0f}%"
+    
     @action(description=_('გააქტიურება'))
     def activate_platforms(self, request, queryset):
         updated = queryset.update(is_active=True)
@@ -235,7 +241,7 @@ class PlatformAdmin(ModelAdmin):
 
 
 @admin.register(Bid)
-class BidAdmin(ModelAdmin):
+class BidAdmin(EstimatedCountMixin, ChangelistQuerysetMixin, ModelAdmin):
     """Admin interface for Bid model."""
     
     list_display = ['display_id', 'shipment_info', 'platform_link', 'company_name', 
@@ -361,6 +367,15 @@ class BidAdmin(ModelAdmin):
         # Exclude soft-deleted bids
         qs = qs.filter(is_deleted=False)
         
+        if self.is_changelist_request(request):
+            # Join what the list columns show and load nothing else
+            qs = qs.select_related('shipment', 'platform', 'currency').only(
+                'id', 'display_id', 'company_name', 'price', 'estimated_delivery_time', 'status', 'created_at',
+                'shipment__pickup_location', 'shipment__delivery_location',
+                'platform__company_name',
+                'currency__symbol'
+            )
+        
         # If the logged-in user is a regular User (client), show only bids on their shipments
         if not request.user.is_superuser and getattr(request.user, 'role', '') == 'client':
             return qs.filter(shipment__user=request.user, shipment__is_deleted=False)
@@ -417,7 +432,7 @@ class BidAdmin(ModelAdmin):
 
 
 @admin.register(RejectedBidCache)
-class RejectedBidCacheAdmin(ModelAdmin):
+class RejectedBidCacheAdmin(EstimatedCountMixin, ChangelistQuerysetMixin, ModelAdmin):
     """Admin interface for RejectedBidCache model (read-only)."""
     
     list_display = ['id_short', 'shipment_link', 'platform_link', 'price', 
@@ -435,14 +450,26 @@ class RejectedBidCacheAdmin(ModelAdmin):
     
     @display(description=_('განაცხადი'))
     def shipment_link(self, obj):
-        url = reverse('admin:shipments_shipment_change', args=[obj.shipment.pk])
+        url = reverse('admin:shipments_shipment_change', args=[obj.shipment_id])
         return format_html('<a href="{}">{}</a>', url, str(obj.shipment))
     
     @display(description=_('პლათფორმა'))
     def platform_link(self, obj):
-        url = reverse('admin:bids_platform_change', args=[obj.platform.pk])
+        url = reverse('admin:bids_platform_change', args=[obj.platform_id])
         return format_html('<a href="{}">{}</a>', url, obj.platform.company_name)
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if self.is_changelist_request(request):
+            # Join what the list columns show and load nothing else
+            qs = qs.select_related('shipment', 'platform', 'currency').only(
+                'id', 'price', 'estimated_delivery_time', 'rejected_at',
+                'shipment__pickup_location', 'shipment__delivery_location',
+                'platform__company_name',
+                'currency__code', 'currency__symbol'
+            )
+        return qs
+    
     def has_add_permission(self, request):
         """Cache entries are created automatically."""
         return False
@@ -454,3 +481,56 @@ class RejectedBidCacheAdmin(ModelAdmin):
     def has_change_permission(self, request, obj=None):
         """Cache entries are read-only."""
         return False
+
+
+@admin.register(BidSubmission)
+class BidSubmissionAdmin(ModelAdmin):
+    """Admin interface for the asynchronous bid ingestion queue (read-only)."""
+    
+    list_display = ['id_short', 'platform', 'shipment_id', 'status', 'error_code', 'created_at', 'processed_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['id', 'platform__company_name']
+    ordering = ['-created_at']
+    list_select_related = ['platform']
+    
+    fields = ['id', 'platform', 'shipment', 'currency', 'payload', 'status', 'error_code',
+              'error_message', 'bid', 'created_at', 'processed_at']
+    readonly_fields = fields
+    
+    @display(description=_('ID'))
+    def id_short(self, obj):
+        return str(obj.id)[:8]
+    
+    def has_add_permission(self, request):
+        """Submissions are created through the API."""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        """Submissions are read-only."""
+        return False
+
+
+@admin.register(PlatformDeletionJob)
+class PlatformDeletionJobAdmin(ModelAdmin):
+    """Admin interface for background platform deletions (read-only)."""
+    
+    list_display = ['created_at', 'requested_by', 'status', 'progress_display', 'started_at', 'finished_at']
+    list_filter = ['status']
+    ordering = ['-created_at']
+    list_select_related = ['requested_by']
+    
+    fields = ['platforms', 'requested_by', 'status', 'progress_display', 'total_bids', 'rejected_bids',
+              'error', 'created_at', 'started_at', 'updated_at', 'finished_at']
+    readonly_fields = fields
+    
+    @display(description=_('პროგრესი'))
+    def progress_display(self, obj):
+        return f'{obj.progress}% ({obj.rejected_bids}/{obj.total_bids})'
+    
+    def has_add_permission(self, request):
+        """Jobs are created by the platform soft delete action."""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        """Jobs are read-only."""
+        return False
@@ -0,0 +1,150 @@
+import statistics
+import threading
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from apps.accounts.models import User
+from apps.metadata.models import Currency, CargoType, TransportType, VolumeUnit
+from apps.bids.models import Platform, Bid
+from apps.shipments.models import Shipment
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures bid submission throughput on one shipment under concurrent '
+        'submitters, with an acceptance in the middle, and checks that no '
+        'pending bid is left on the completed shipment. Creates its own '
+        'fixtures and deletes them afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--submitters',
+            type=int,
+            default=8,
+            help='Concurrent submitting threads'
+        )
+        parser.add_argument(
+            '--bids',
+            type=int,
+            default=50,
+            help='Bids submitted by each thread'
+        )
+        parser.add_argument(
+            '--accept-after',
+            type=float,
+            default=0.5,
+            help='Share of submissions after which a bid is accepted (0 disables acceptance)'
+        )
+
+    def handle(self, *args, **options):
+        suffix = uuid.uuid4().hex[:8]
+        user = User.objects.create_user(
+            email=f'benchmark-{suffix}@example.invalid',
+            first_name='Benchmark',
+            last_name='User',
+            personal_id=f'9{int(suffix, 16) % 10 ** 10:010d}'
+        )
+        platform = Platform.objects.create(
+            company_name=f'Benchmark {suffix}',
+            contact_email=f'benchmark-{suffix}@example.invalid',
+            contact_phone='+995000000000'
+        )
+        currency = Currency.objects.filter(is_active=True).first() or Currency.objects.create(
+            code='GEL', name='Lari', symbol='₾'
+        )
+        shipment = Shipment.objects.create(
+            user=user,
+            pickup_location='Benchmark',
+            pickup_date=timezone.now() + timedelta(days=1),
+            delivery_location='Benchmark',
+            cargo_type=CargoType.objects.first() or CargoType.objects.create(name='Benchmark'),
+            cargo_volume=Decimal('1'),
+            volume_unit=VolumeUnit.objects.first() or VolumeUnit.objects.create(name='Benchmark', abbreviation='bm'),
+            transport_type=TransportType.objects.first() or TransportType.objects.create(name='Benchmark'),
+            preferred_currency=currency
+        )
+
+        try:
+            self.run_benchmark(shipment, platform, currency, options)
+        finally:
+            shipment.delete()
+            platform.delete()
+            user.delete()
+
+    def run_benchmark(self, shipment, platform, currency, options):
+        total = options['submitters'] * options['bids']
+        accept_at = int(total * options['accept_after'])
+        latencies = []
+        outcomes = {}
+        submitted = threading.Semaphore(0)
+        results_lock = threading.Lock()
+        acceptance = {}
+
+        def submit(number):
+            try:
+                for index in range(options['bids']):
+                    started = time.monotonic()
+                    bid, error_code, error_message = Bid.objects.submit_bid(
+                        shipment=shipment,
+                        platform=platform,
+                        company_name='Benchmark',
+                        price=Decimal(1000 + index),
+                        currency=currency,
+                        estimated_delivery_time=1,
+                        contact_person='Benchmark',
+                        contact_phone='+995000000000',
+                        external_user_id=f'benchmark-{number}',
+                        status='pending'
+                    )
+                    with results_lock:
+                        latencies.append(time.monotonic() - started)
+                        outcome = 'created' if bid else error_code
+                        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                    submitted.release()
+            finally:
+                connection.close()
+
+        def accept():
+            try:
+                for _ in range(accept_at):
+                    submitted.acquire()
+                bid = Bid.objects.filter(shipment=shipment, status='pending').first()
+                started = time.monotonic()
+                Shipment.objects.get(pk=shipment.pk).mark_completed(bid)
+                acceptance['duration'] = time.monotonic() - started
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=submit, args=(number,)) for number in range(options['submitters'])]
+        if accept_at:
+            threads.append(threading.Thread(target=accept))
+
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        latencies.sort()
+        self.stdout.write(f'Submissions: {total} from {options["submitters"]} threads in {elapsed:.2f}s '
+                          f'({total / elapsed:.0f}/s)')
+        self.stdout.write(f'Latency: p50 {statistics.median(latencies) * 1000:.1f}ms, '
+                          f'p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f}ms, '
+                          f'max {latencies[-1] * 1000:.1f}ms')
+        self.stdout.write('Outcomes: ' + ', '.join(f'{key} {value}' for key, value in sorted(outcomes.items())))
+
+        if not accept_at:
+            return
+
+        self.stdout.write(f'Acceptance took {acceptance["duration"] * 1000:.1f}ms including lock wait')
+        stray = Bid.objects.filter(shipment=shipment, status='pending').count()
+        if stray:
+            self.stdout.write(self.style.ERROR(f'{stray} pending bids left on the completed shipment'))
+        else:
+            self.stdout.write(self.style.SUCCESS('No pending bids left on the completed shipment'))
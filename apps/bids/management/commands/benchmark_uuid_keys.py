@@ -0,0 +1,77 @@
+import time
+import uuid
+from django.core.management.base import BaseCommand
+from django.db import connection
+from apps.common.ids import uuid7
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares insert throughput and primary key index size of random (v4) and '
+        'time-ordered (v7) UUID keys, using temporary tables shaped like bids. '
+        'Nothing is left behind in the database.'
+    )
+
+    generators = {
+        'uuid4': uuid.uuid4,
+        'uuid7': uuid7,
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=200000,
+            help='Rows inserted per key type'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows inserted per statement'
+        )
+
+    def handle(self, *args, **options):
+        results = {}
+        for name, generator in self.generators.items():
+            results[name] = self.run_benchmark(name, generator, options['rows'], options['batch_size'])
+
+        for name, (elapsed, index_size, table_size) in results.items():
+            self.stdout.write(
+                f'{name}: {options["rows"] / elapsed:.0f} rows/s, '
+                f'primary key index {index_size / 1024 / 1024:.1f} MB, '
+                f'table {table_size / 1024 / 1024:.1f} MB'
+            )
+
+        random_elapsed, random_index, _ = results['uuid4']
+        ordered_elapsed, ordered_index, _ = results['uuid7']
+        self.stdout.write(self.style.SUCCESS(
+            f'uuid7 inserts {random_elapsed / ordered_elapsed:.2f}x as fast as uuid4 '
+            f'with a {ordered_index / random_index * 100:.0f}% sized primary key index'
+        ))
+
+    def run_benchmark(self, name, generator, rows, batch_size):
+        """Insert rows into a fresh temporary table; return (seconds, index bytes, table bytes)."""
+        table = f'benchmark_{name}_keys'
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {table}')
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE {table} ('
+                'id uuid PRIMARY KEY, shipment_id uuid NOT NULL, price numeric(10, 2) NOT NULL, '
+                'status varchar(20) NOT NULL, created_at timestamp with time zone NOT NULL DEFAULT now())'
+            )
+
+            started = time.monotonic()
+            for offset in range(0, rows, batch_size):
+                count = min(batch_size, rows - offset)
+                cursor.execute(
+                    f'INSERT INTO {table} (id, shipment_id, price, status) '
+                    "SELECT id, %s, 100, 'pending' FROM unnest(%s::uuid[]) AS id",
+                    [uuid.uuid4(), [generator() for _ in range(count)]]
+                )
+            elapsed = time.monotonic() - started
+
+            cursor.execute(f"SELECT pg_relation_size('{table}_pkey'), pg_relation_size('{table}')")
+            index_size, table_size = cursor.fetchone()
+            cursor.execute(f'DROP TABLE {table}')
+        return elapsed, index_size, table_size
@@ -0,0 +1,53 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.bids.partitions import (
+    DEFAULT_PARTITION, ensure_partitions, month_start, next_month, partition_stats, drop_partition
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the monthly bids partitions of the coming months and drops expired ones: '
+        'partitions of months that ended --days ago and no longer hold bids, because '
+        'archive_closed_shipments moved them out. Lists the partitions with their estimated '
+        'rows and size. Safe to re-run; meant to be scheduled (e.g. cron).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ahead',
+            type=int,
+            default=settings.BID_PARTITIONS_AHEAD,
+            help='Months after the current one to create partitions for'
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.ARCHIVE_AFTER_DAYS,
+            help='Drop empty partitions of months that ended at least this many days ago'
+        )
+
+    def handle(self, *args, **options):
+        months = [month_start(timezone.now())]
+        for _ in range(options['ahead']):
+            months.append(next_month(months[-1]))
+        for name in ensure_partitions(months):
+            self.stdout.write(f'Created {name}')
+
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        dropped = kept = 0
+        for name, month, rows, size in partition_stats():
+            if month is not None and next_month(month) <= cutoff:
+                if drop_partition(name):
+                    dropped += 1
+                    self.stdout.write(f'Dropped {name}')
+                    continue
+                kept += 1
+            label = 'default' if name == DEFAULT_PARTITION else f'{month:%Y-%m}'
+            self.stdout.write(f'{name} ({label}): ~{rows} rows, {size / 1024 / 1024:.1f} MB')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{dropped} expired partitions dropped, {kept} kept because they still hold bids'
+        ))
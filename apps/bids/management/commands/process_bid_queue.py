@@ -0,0 +1,40 @@
+import time
+from django.core.management.base import BaseCommand
+from apps.bids.models import BidSubmission
+
+
+class Command(BaseCommand):
+    help = 'Creates bids from the asynchronous ingestion queue in micro-batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Submissions claimed per transaction'
+        )
+        parser.add_argument(
+            '--follow',
+            action='store_true',
+            help='Keep polling the queue instead of exiting once it is empty'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait between polls of an empty queue with --follow'
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            processed = BidSubmission.objects.process_batch(options['batch_size'])
+            total += processed
+            if processed:
+                self.stdout.write(f'Processed {processed} submissions')
+                continue
+            if not options['follow']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Queue drained, {total} submissions processed'))
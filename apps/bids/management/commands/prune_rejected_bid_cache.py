@@ -0,0 +1,67 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection
+from apps.bids.models import RejectedBidCache
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes rejected bid cache entries of shipments that are no longer active, '
+        'in batches, and reports the table size before and after'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Entries deleted per statement'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0,
+            help='Seconds to pause between batches to limit load'
+        )
+        parser.add_argument(
+            '--vacuum',
+            action='store_true',
+            help='Run VACUUM ANALYZE on the table afterwards so the freed space is reused'
+        )
+
+    def table_size(self):
+        """Return the total size of the cache table, with indexes and TOAST, in bytes."""
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_total_relation_size(%s)', [RejectedBidCache._meta.db_table])
+            return cursor.fetchone()[0]
+
+    def format_size(self, size):
+        for unit in ('B', 'kB', 'MB', 'GB'):
+            if size < 1024 or unit == 'GB':
+                return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+            size /= 1024
+
+    def handle(self, *args, **options):
+        size_before = self.table_size()
+        rows_before = RejectedBidCache.objects.count()
+
+        deleted_total = 0
+        while True:
+            deleted = RejectedBidCache.objects.prune_batch(options['batch_size'])
+            if not deleted:
+                break
+            deleted_total += deleted
+            self.stdout.write(f'Deleted {deleted} entries')
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        if options['vacuum']:
+            with connection.cursor() as cursor:
+                cursor.execute(f'VACUUM ANALYZE {connection.ops.quote_name(RejectedBidCache._meta.db_table)}')
+
+        size_after = self.table_size()
+        self.stdout.write(f'Rows: {rows_before} -> {rows_before - deleted_total}')
+        self.stdout.write(f'Table size: {self.format_size(size_before)} -> {self.format_size(size_after)}')
+        if deleted_total and not options['vacuum']:
+            self.stdout.write('Deleted space is reused after autovacuum; run with --vacuum to reclaim it now')
+        self.stdout.write(self.style.SUCCESS(f'{deleted_total} cache entries pruned'))
@@ -0,0 +1,79 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from apps.bids.models import PlatformDeletionJob
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs queued background platform soft deletes, rejecting their bids in chunks. '
+        'Running jobs that stopped making progress (e.g. their worker was killed) are resumed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Pending bids rejected per transaction'
+        )
+        parser.add_argument(
+            '--follow',
+            action='store_true',
+            help='Keep polling for new jobs instead of exiting once none are queued'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between polls with --follow'
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=15,
+            help='Minutes without progress after which a running job is taken over'
+        )
+
+    def claim_job(self, stale_after):
+        """
+        Mark the oldest queued job, or running job without progress for
+        stale_after, as running; concurrent workers skip it.
+        """
+        stale_before = timezone.now() - stale_after
+        with transaction.atomic():
+            job = (
+                PlatformDeletionJob.objects.select_for_update(skip_locked=True)
+                .filter(Q(status='queued') | Q(status='running', updated_at__lt=stale_before))
+                .order_by('created_at')
+                .first()
+            )
+            if job is not None:
+                job.status = 'running'
+                job.save(update_fields=['status', 'updated_at'])
+        return job
+
+    def handle(self, *args, **options):
+        while True:
+            job = self.claim_job(timedelta(minutes=options['stale_after']))
+            if job is None:
+                if not options['follow']:
+                    break
+                time.sleep(options['interval'])
+                continue
+
+            try:
+                job.run(chunk_size=options['chunk_size'])
+            except Exception as exc:
+                job.status = 'failed'
+                job.error = str(exc)
+                job.save(update_fields=['status', 'error'])
+                self.stderr.write(self.style.ERROR(f'Job {job.pk} failed: {exc}'))
+                continue
+
+            self.stdout.write(self.style.SUCCESS(
+                f'Job {job.pk} completed, {job.rejected_bids} bids rejected'
+            ))
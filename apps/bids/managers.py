@@ -1,62 +1,490 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
+from apps.common.locks import lock_shipments
 
 
-class BidManager(models.Manager):
+# Unique index that refuses an exact duplicate bid (BidKey.Meta.constraints)
+FINGERPRINT_CONSTRAINT = 'unique_bid_fingerprint'
+
+
+def is_fingerprint_conflict(error):
+    """Check if an IntegrityError was raised by the unique bid fingerprint index."""
+    diag = getattr(error.__cause__, 'diag', None)
+    return getattr(diag, 'constraint_name', None) == FINGERPRINT_CONSTRAINT
+
+
+# Messages for the error codes returned by bid admission checks
+BID_ERROR_MESSAGES = {
+    'SHIPMENT_NOT_ACTIVE': _('განაცხადზე შეთავაზებების მიღება აღარ არის შესაძლებელი'),
+    'CURRENCY_MISMATCH': _('ვალუტა უნდა ემთხვეოდეს განაცხადის ვალუტას'),
+    'BID_DUPLICATE': _('იგივე პარამეტრებით შეთავაზება უკვე გაკეთებული და უარყოფილია'),
+    'BID_EXACT_DUPLICATE': _('ზუსტად ასეთი შეთავაზება უკვე არსებობს'),
+    'BID_PRICE_DUPLICATE': _('იგივე ფასის შემთხვევაში მიწოდების დრო უნდა იყოს ნაკლები'),
+    'PLATFORM_INACTIVE': _('პლათფორმა აღარ არის აქტიური'),
+    'SHIPMENT_NOT_FOUND': _('განაცხადი ვერ მოიძებნა'),
+}
+
+
+class BidQuerySet(models.QuerySet):
+    """QuerySet for Bid model with set-based status changes."""
+    
+    def reject_pending(self, cache=True):
+        """
+        Reject the pending bids of this queryset.
+        The bids are locked and read once, rejected with a single UPDATE and
+        their parameters cached with a single bulk INSERT; parameter sets
+        already in the cache are skipped by its unique fingerprint.
+        Pass cache=False when the shipments are being closed: closed shipments
+        accept no bids, so their cache entries would never be read.
+        Returns (rejected: int, cached: int), where cached is the number of
+        distinct parameter sets now present in the cache.
+        """
+        from django.utils import timezone
+        from .models import RejectedBidCache
+        
+        with transaction.atomic():
+            bids = list(
+                self.filter(status='pending')
+                .select_for_update(of=('self',))
+                .select_related(None)
+                .order_by()
+                .only(
+                    'id', 'shipment_id', 'platform_id', 'price',
+                    'estimated_delivery_time', 'currency_id', 'external_user_id'
+                )
+            )
+            if not bids:
+                return 0, 0
+            
+            rejected = self.model._base_manager.filter(
+                pk__in=[bid.pk for bid in bids]
+            ).update(status='rejected', updated_at=timezone.now())
+            
+            if not cache:
+                return rejected, 0
+            
+            # One cache entry per distinct parameter set
+            entries = {}
+            for bid in bids:
+                key = (
+                    bid.shipment_id, bid.platform_id, bid.price,
+                    bid.estimated_delivery_time, bid.currency_id, bid.external_user_id
+                )
+                entries.setdefault(key, RejectedBidCache.for_bid(bid))
+            RejectedBidCache.objects.bulk_create(entries.values(), ignore_conflicts=True)
+        
+        return rejected, len(entries)
+
+
+class BidManager(models.Manager.from_queryset(BidQuerySet)):
     """Custom manager for Bid model with business logic."""
     
+    @staticmethod
+    def _fingerprint_values(shipment, platform, price, estimated_delivery_time, currency, company_name, external_user_id):
+        """Return the field values bid fingerprints are computed from."""
+        return {
+            'shipment_id': shipment.pk,
+            'platform_id': platform.pk,
+            'price': price,
+            'estimated_delivery_time': estimated_delivery_time,
+            'currency_id': currency.pk,
+            'company_name': company_name,
+            'external_user_id': external_user_id,
+        }
+    
     def can_submit_bid(self, shipment, platform, price, estimated_delivery_time, currency, company_name, external_user_id=None):
         """
         Check if a bid can be submitted.
+        The status and currency rules need no query; the duplicate and
+        same-price rules are evaluated together in a single query, using
+        the fingerprint indexes for the exact duplicate lookups. The same
+        query re-reads the shipment status, so a caller holding the shipment
+        lock (see submit_bid) sees a shipment closed in the meantime.
         Returns (can_submit: bool, error_code: str, error_message: str)
         """
         # Check if shipment is active
         if shipment.status != 'active':
-            return False, 'SHIPMENT_NOT_ACTIVE', _('განაცხადზე შეთავაზებების მიღება აღარ არის შესაძლებელი')
+            return False, 'SHIPMENT_NOT_ACTIVE', BID_ERROR_MESSAGES['SHIPMENT_NOT_ACTIVE']
         
         # Check if currency matches shipment's preferred currency
         if currency.id != shipment.preferred_currency_id:
-            return False, 'CURRENCY_MISMATCH', _('ვალუტა უნდა ემთხვეოდეს განაცხადის ვალუტას')
+            return False, 'CURRENCY_MISMATCH', BID_ERROR_MESSAGES['CURRENCY_MISMATCH']
         
-        # Check for exact duplicate of rejected bid
+        # Run the duplicate and same-price checks in a single query
+        from apps.shipments.models import Shipment
         from .models import RejectedBidCache
-        duplicate_exists = RejectedBidCache.objects.filter(
-            shipment=shipment,
+        values = self._fingerprint_values(
+            shipment, platform, price, estimated_delivery_time, currency, company_name, external_user_id
+        )
+        last_bid = self.filter(
+            shipment=OuterRef('pk'),
             platform=platform,
-            price=price,
-            estimated_delivery_time=estimated_delivery_time,
-            currency=currency,
+            company_name=company_name,
             external_user_id=external_user_id
-        ).exists()
+        ).order_by('-created_at')
+        checks = Shipment.objects.filter(pk=shipment.pk).annotate(
+            # Exact duplicate of a rejected bid
+            rejected_duplicate=Exists(RejectedBidCache.objects.filter(
+                fingerprint=RejectedBidCache.fingerprint_for(values)
+            )),
+            # Exact duplicate in existing bids (pending, accepted, rejected)
+            exact_duplicate=Exists(self.filter(
+                fingerprint=self.model.fingerprint_for(values)
+            )),
+            # Previous bid from the same company
+            last_price=Subquery(last_bid.values('price')[:1]),
+            last_delivery_time=Subquery(last_bid.values('estimated_delivery_time')[:1])
+        ).values('status', 'rejected_duplicate', 'exact_duplicate', 'last_price', 'last_delivery_time').get()
+        
+        if checks['status'] != 'active':
+            return False, 'SHIPMENT_NOT_ACTIVE', BID_ERROR_MESSAGES['SHIPMENT_NOT_ACTIVE']
+        
+        if checks['rejected_duplicate']:
+            return False, 'BID_DUPLICATE', BID_ERROR_MESSAGES['BID_DUPLICATE']
+        
+        if checks['exact_duplicate']:
+            return False, 'BID_EXACT_DUPLICATE', BID_ERROR_MESSAGES['BID_EXACT_DUPLICATE']
+        
+        # Check if the price is the same as the previous bid from the same company
+        if checks['last_price'] is not None and checks['last_price'] == price:
+            if estimated_delivery_time >= checks['last_delivery_time']:
+                return False, 'BID_PRICE_DUPLICATE', BID_ERROR_MESSAGES['BID_PRICE_DUPLICATE']
+        
+        return True, None, None
+    
+    def create_bid(self, **fields):
+        """
+        Insert a bid that passed can_submit_bid.
+        An identical bid inserted concurrently trips the unique fingerprint
+        index; that conflict is reported as BID_EXACT_DUPLICATE. Any other
+        integrity error (e.g. the shipment was removed meanwhile) is raised.
+        Returns (bid, error_code, error_message)
+        """
+        try:
+            with transaction.atomic():
+                return self.create(**fields), None, None
+        except IntegrityError as error:
+            if not is_fingerprint_conflict(error):
+                raise
+            return None, 'BID_EXACT_DUPLICATE', BID_ERROR_MESSAGES['BID_EXACT_DUPLICATE']
+    
+    def submit_bid(self, **fields):
+        """
+        Check and insert a bid while holding a shared lock on its shipment.
+        Submissions to the same shipment do not wait for each other, but a
+        shipment being completed or cancelled (which takes the exclusive lock)
+        cannot change status between the checks and the INSERT, so no pending
+        bid can slip in after the remaining bids were rejected.
+        Returns (bid, error_code, error_message)
+        """
+        shipment = fields['shipment']
+        with transaction.atomic():
+            lock_shipments([shipment.pk], shared=True)
+            can_submit, error_code, error_message = self.can_submit_bid(
+                shipment=shipment,
+                platform=fields['platform'],
+                price=fields['price'],
+                estimated_delivery_time=fields['estimated_delivery_time'],
+                currency=fields['currency'],
+                company_name=fields['company_name'],
+                external_user_id=fields.get('external_user_id')
+            )
+            if not can_submit:
+                return None, error_code, error_message
+            return self.create_bid(**fields)
+    
+    def submit_bids(self, platform, bids):
+        """
+        Check and insert unsaved bids of one platform as a batch.
+        Takes shared locks on all their shipments (see submit_bid), re-reads
+        the shipment statuses under the locks and runs can_submit_bids and
+        create_bids. A shipment removed since it was looked up counts as no
+        longer active.
+        Returns a list of (bid, error_code, error_message), one per bid.
+        """
+        from apps.shipments.models import Shipment
+        
+        with transaction.atomic():
+            shipment_ids = {bid.shipment_id for bid in bids}
+            lock_shipments(shipment_ids, shared=True)
+            statuses = dict(Shipment.objects.filter(pk__in=shipment_ids).values_list('pk', 'status'))
+            for bid in bids:
+                bid.shipment.status = statuses.get(bid.shipment_id)
+            
+            checks = self.can_submit_bids(platform, [
+                {
+                    'shipment': bid.shipment,
+                    'price': bid.price,
+                    'estimated_delivery_time': bid.estimated_delivery_time,
+                    'currency': bid.currency,
+                    'company_name': bid.company_name,
+                    'external_user_id': bid.external_user_id,
+                }
+                for bid in bids
+            ])
+            
+            results = [(None, error_code, error_message) for can_submit, error_code, error_message in checks]
+            admitted = [index for index, (can_submit, error_code, error_message) in enumerate(checks) if can_submit]
+            if admitted:
+                created = self.create_bids([bids[index] for index in admitted])
+                for index, result in zip(admitted, created):
+                    results[index] = result
+        
+        return results
+    
+    def can_submit_bids(self, platform, candidates):
+        """
+        Check many bids of one platform against the can_submit_bid rules.
+        Each candidate is a mapping with shipment, price,
+        estimated_delivery_time, currency, company_name and external_user_id.
+        The rules run with three set-based queries whatever the batch size,
+        and a candidate is also checked against the earlier candidates of the
+        same batch.
+        Returns a list of (can_submit, error_code, error_message), one per candidate.
+        """
+        from .models import RejectedBidCache
+        results = [None] * len(candidates)
+        pending = []
         
-        if duplicate_exists:
-            return False, 'BID_DUPLICATE', _('იგივე პარამეტრებით შეთავაზება უკვე გაკეთებული და უარყოფილია')
+        # Status and currency rules need no query
+        for index, candidate in enumerate(candidates):
+            shipment = candidate['shipment']
+            if shipment.status != 'active':
+                results[index] = (False, 'SHIPMENT_NOT_ACTIVE', BID_ERROR_MESSAGES['SHIPMENT_NOT_ACTIVE'])
+            elif candidate['currency'].id != shipment.preferred_currency_id:
+                results[index] = (False, 'CURRENCY_MISMATCH', BID_ERROR_MESSAGES['CURRENCY_MISMATCH'])
+            else:
+                values = self._fingerprint_values(platform=platform, **candidate)
+                pending.append((
+                    index,
+                    candidate,
+                    RejectedBidCache.fingerprint_for(values),
+                    self.model.fingerprint_for(values)
+                ))
+        
+        if not pending:
+            return results
+        
+        # Exact duplicates of rejected and existing bids
+        rejected_fingerprints = set(RejectedBidCache.objects.filter(
+            fingerprint__in=[item[2] for item in pending]
+        ).values_list('fingerprint', flat=True))
+        existing_fingerprints = set(self.filter(
+            fingerprint__in=[item[3] for item in pending]
+        ).values_list('fingerprint', flat=True))
+        
+        # Latest bid of every (shipment, company, driver) in the batch
+        shipment_ids = {item[1]['shipment'].pk for item in pending}
+        company_names = {item[1]['company_name'] for item in pending}
+        driver_ids = {item[1]['external_user_id'] for item in pending}
+        drivers = Q(external_user_id__in=driver_ids - {None})
+        if None in driver_ids:
+            drivers |= Q(external_user_id__isnull=True)
+        last_bids = {
+            (row['shipment_id'], row['company_name'], row['external_user_id']): (
+                row['price'], row['estimated_delivery_time']
+            )
+            for row in self.filter(
+                drivers,
+                platform=platform,
+                shipment_id__in=shipment_ids,
+                company_name__in=company_names
+            ).order_by(
+                'shipment_id', 'company_name', 'external_user_id', '-created_at'
+            ).distinct(
+                'shipment_id', 'company_name', 'external_user_id'
+            ).values('shipment_id', 'company_name', 'external_user_id', 'price', 'estimated_delivery_time')
+        }
+        
+        for index, candidate, rejected_fingerprint, fingerprint in pending:
+            if rejected_fingerprint in rejected_fingerprints:
+                results[index] = (False, 'BID_DUPLICATE', BID_ERROR_MESSAGES['BID_DUPLICATE'])
+                continue
+            
+            if fingerprint in existing_fingerprints:
+                results[index] = (False, 'BID_EXACT_DUPLICATE', BID_ERROR_MESSAGES['BID_EXACT_DUPLICATE'])
+                continue
+            
+            key = (candidate['shipment'].pk, candidate['company_name'], candidate['external_user_id'])
+            last_bid = last_bids.get(key)
+            if last_bid is not None and last_bid[0] == candidate['price']:
+                if candidate['estimated_delivery_time'] >= last_bid[1]:
+                    results[index] = (False, 'BID_PRICE_DUPLICATE', BID_ERROR_MESSAGES['BID_PRICE_DUPLICATE'])
+                    continue
+            
+            # Later candidates in the batch see this one as an existing bid
+            existing_fingerprints.add(fingerprint)
+            last_bids[key] = (candidate['price'], candidate['estimated_delivery_time'])
+            results[index] = (True, None, None)
+        
+        return results
+    
+    def create_bids(self, bids):
+        """
+        Insert bids that passed can_submit_bids with a single bulk INSERT.
+        If a concurrent request inserted one of them first, the batch falls
+        back to create_bid per bid so only the conflicting bids are refused.
+        Other integrity errors are raised.
+        Returns a list of (bid, error_code, error_message), one per bid.
+        """
+        try:
+            with transaction.atomic():
+                return [(bid, None, None) for bid in self.bulk_create(bids)]
+        except IntegrityError as error:
+            if not is_fingerprint_conflict(error):
+                raise
+            return [
+                self.create_bid(**{
+                    field.attname: getattr(bid, field.attname)
+                    for field in self.model._meta.concrete_fields
+                    if field.attname not in ('display_id', 'fingerprint')
+                })
+                for bid in bids
+            ]
 
-        # Check for exact duplicate in existing bids (pending, accepted, rejected)
-        if self.filter(
-            shipment=shipment,
-            platform=platform,
-            price=price,
-            estimated_delivery_time=estimated_delivery_time,
-            currency=currency,
-            company_name=company_name,
-            external_user_id=external_user_id
-        ).exists():
-            return False, 'BID_EXACT_DUPLICATE', _('ზუსტად ასეთი შეთავაზება უკვე არსებობს')
 
-        # Check if the price is the same as the previous bid from the same company
-        last_bid = self.filter(
-            shipment=shipment,
-            platform=platform,
-            company_name=company_name,
-            external_user_id=external_user_id
-        ).order_by('-created_at').first()
+class BidSubmissionManager(models.Manager):
+    """Manager for the asynchronous bid ingestion queue."""
+    
+    def process_batch(self, batch_size=100):
+        """
+        Turn the oldest queued submissions into bids.
+        The rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED so several
+        consumers can drain the queue side by side. The bids are checked and
+        inserted per platform through BidManager.submit_bids. Submissions of
+        a platform deactivated or deleted since they were queued fail with
+        PLATFORM_INACTIVE, and those on a shipment of a deleted user with
+        SHIPMENT_NOT_FOUND, as the synchronous API would refuse them.
+        Returns the number of submissions processed.
+        """
+        from django.utils import timezone
+        from .models import Bid
+        
+        with transaction.atomic():
+            submissions = list(
+                self.select_for_update(skip_locked=True, of=('self',))
+                .select_related('platform', 'shipment__user', 'currency')
+                .filter(status='queued')
+                .order_by('created_at')[:batch_size]
+            )
+            if not submissions:
+                return 0
+            
+            # Lock every shipment of the batch at once, in a consistent order
+            lock_shipments({submission.shipment_id for submission in submissions}, shared=True)
+            
+            # The rules are per platform, so group while keeping queue order
+            by_platform = {}
+            for submission in submissions:
+                platform = submission.platform
+                if not platform.is_active or platform.is_deleted:
+                    submission.fail('PLATFORM_INACTIVE')
+                elif submission.shipment.user.is_deleted:
+                    submission.fail('SHIPMENT_NOT_FOUND')
+                else:
+                    by_platform.setdefault(submission.platform_id, []).append(submission)
+            
+            for platform_submissions in by_platform.values():
+                results = Bid.objects.submit_bids(
+                    platform_submissions[0].platform,
+                    [submission.build_bid() for submission in platform_submissions]
+                )
+                for submission, (bid, error_code, error_message) in zip(platform_submissions, results):
+                    if bid is None:
+                        submission.fail(error_code, error_message)
+                    else:
+                        submission.status = 'created'
+                        submission.bid = bid
+            
+            now = timezone.now()
+            for submission in submissions:
+                submission.processed_at = now
+            self.bulk_update(
+                submissions,
+                ['status', 'error_code', 'error_message', 'bid', 'processed_at']
+            )
+        
+        return len(submissions)
+
+
+class RejectedBidCacheManager(models.Manager):
+    """Manager for RejectedBidCache model with pruning."""
+    
+    def prunable(self):
+        """Return entries of shipments that no longer accept bids."""
+        return self.exclude(shipment__status='active')
+    
+    def prune_batch(self, batch_size=5000):
+        """
+        Delete up to batch_size prunable entries with a single DELETE.
+        Returns the number of deleted entries.
+        """
+        batch = self.prunable().order_by().values('pk')[:batch_size]
+        deleted, by_model = self.filter(pk__in=models.Subquery(batch)).delete()
+        return deleted
+
 
-        if last_bid and last_bid.price == price:
-            if estimated_delivery_time >= last_bid.estimated_delivery_time:
-                return False, 'BID_PRICE_DUPLICATE', _('იგივე ფასის შემთხვევაში მიწოდების დრო უნდა იყოს ნაკლები')
+class PlatformQuerySet(models.QuerySet):
+    """QuerySet for Platform model with set-based soft delete."""
+    
+    def soft_delete(self, deleted_by):
+        """
+        Soft delete the platforms and reject their pending bids.
+        Runs the bulk rejection and a single platform UPDATE, so the cost
+        does not depend on the number of platforms or bids.
+        Returns (deleted: int, rejected: int)
+        """
+        from django.utils import timezone
+        from .models import Bid
         
-        return True, None, None
+        with transaction.atomic():
+            rejected, cached = Bid.objects.filter(platform__in=self).reject_pending()
+            now = timezone.now()
+            deleted = self.update(
+                is_deleted=True,
+                deleted_at=now,
+                deleted_by=deleted_by,
+                is_active=False,
+                updated_at=now
+            )
+        return deleted, rejected
+    
+    def with_pending_bids_count(self):
+        """Annotate every platform with the number of its pending bids in one grouped query."""
+        return self.annotate(
+            pending_count=models.Count('bids', filter=Q(bids__status='pending'))
+        )
+    
+    def with_bid_stats(self):
+        """
+        Annotate every platform with its API key and bid statistics in one query:
+        api_key_total, active_api_key_total, bid_total, pending_bid_total,
+        accepted_bid_total and rejected_bid_total.
+        Bids are counted with conditional aggregates over a single join; API
+        keys are counted in subqueries so that the two joins do not multiply
+        each other's rows.
+        """
+        from .models import PlatformAPIKey
+        
+        keys = PlatformAPIKey.objects.filter(platform=OuterRef('pk')).order_by().values('platform')
+        return self.annotate(
+            api_key_total=Coalesce(
+                Subquery(keys.annotate(count=Count('pk')).values('count')), 0
+            ),
+            active_api_key_total=Coalesce(
+                Subquery(keys.annotate(count=Count('pk', filter=Q(is_active=True))).values('count')), 0
+            ),
+            bid_total=Count('bids'),
+            pending_bid_total=Count('bids', filter=Q(bids__status='pending')),
+            accepted_bid_total=Count('bids', filter=Q(bids__status='accepted')),
+            rejected_bid_total=Count('bids', filter=Q(bids__status='rejected'))
+        )
+
+
+class PlatformManager(models.Manager.from_queryset(PlatformQuerySet)):
+    """Default manager for Platform model."""
 
 
 class ActivePlatformManager(models.Manager):
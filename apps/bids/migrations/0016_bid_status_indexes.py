@@ -0,0 +1,21 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bids', '0015_alter_bid_display_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['platform', 'updated_at'], name='bids_platfor_dd97f8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['platform', 'external_user_id'], name='bids_platfor_0812b3_idx'),
+        ),
+    ]
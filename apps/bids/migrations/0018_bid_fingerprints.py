@@ -0,0 +1,68 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:16
+
+import apps.common.fields
+from django.db import migrations, models
+
+
+# Same digest as FingerprintField.compute: values joined with chr(31),
+# NULL written as \N, numeric(10,2) prices in their two-decimal text form.
+BACKFILL_FINGERPRINTS_SQL = r"""
+UPDATE bids SET fingerprint = encode(sha256(convert_to(concat_ws(chr(31),
+    shipment_id::text, platform_id::text, price::text, estimated_delivery_time::text,
+    currency_id::text, company_name, COALESCE(external_user_id, '\N')
+), 'UTF8')), 'hex');
+
+-- Bids duplicated before the fingerprint existed: only the oldest keeps it
+UPDATE bids SET fingerprint = NULL
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY fingerprint ORDER BY created_at, id) AS position
+    FROM bids
+) AS ranked
+WHERE bids.id = ranked.id AND ranked.position > 1;
+
+UPDATE rejected_bids_cache SET fingerprint = encode(sha256(convert_to(concat_ws(chr(31),
+    shipment_id::text, platform_id::text, price::text, estimated_delivery_time::text,
+    currency_id::text, COALESCE(external_user_id, '\N')
+), 'UTF8')), 'hex');
+
+-- Cache entries duplicated through NULL external_user_id are redundant
+DELETE FROM rejected_bids_cache
+USING (
+    SELECT id, row_number() OVER (PARTITION BY fingerprint ORDER BY rejected_at, id) AS position
+    FROM rejected_bids_cache
+) AS ranked
+WHERE rejected_bids_cache.id = ranked.id AND ranked.position > 1;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bids', '0017_display_id_sequence'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='rejectedbidcache',
+            name='unique_rejected_bid',
+        ),
+        migrations.AddField(
+            model_name='bid',
+            name='fingerprint',
+            field=apps.common.fields.FingerprintField(help_text='Hash of the parameters that identify an exact duplicate bid', null=True, source_fields=('shipment_id', 'platform_id', 'price', 'estimated_delivery_time', 'currency_id', 'company_name', 'external_user_id'), verbose_name='ანაბეჭდი'),
+        ),
+        migrations.AddField(
+            model_name='rejectedbidcache',
+            name='fingerprint',
+            field=apps.common.fields.FingerprintField(help_text='Hash of the parameters that identify a rejected bid', null=True, source_fields=('shipment_id', 'platform_id', 'price', 'estimated_delivery_time', 'currency_id', 'external_user_id'), verbose_name='ანაბეჭდი'),
+        ),
+        migrations.RunSQL(BACKFILL_FINGERPRINTS_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='bid',
+            constraint=models.UniqueConstraint(condition=models.Q(('fingerprint__isnull', False)), fields=('fingerprint',), name='unique_bid_fingerprint'),
+        ),
+        migrations.AddConstraint(
+            model_name='rejectedbidcache',
+            constraint=models.UniqueConstraint(fields=('fingerprint',), name='unique_rejected_bid_fingerprint'),
+        ),
+    ]
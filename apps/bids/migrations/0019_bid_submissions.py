@@ -0,0 +1,39 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metadata', '0001_initial'),
+        ('shipments', '0006_display_id_sequence'),
+        ('bids', '0018_bid_fingerprints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BidSubmission',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('payload', models.JSONField(help_text='Validated bid fields as submitted through the API', verbose_name='მონაცემები')),
+                ('status', models.CharField(choices=[('queued', 'რიგში'), ('created', 'შექმნილი'), ('failed', 'ვერ შეიქმნა')], default='queued', max_length=20, verbose_name='სტატუსი')),
+                ('error_code', models.CharField(blank=True, max_length=50, null=True, verbose_name='შეცდომის კოდი')),
+                ('error_message', models.CharField(blank=True, max_length=255, null=True, verbose_name='შეცდომის აღწერა')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='შექმნის თარიღი')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='დამუშავების თარიღი')),
+                ('bid', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='submissions', to='bids.bid', verbose_name='ბიდი')),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='bid_submissions', to='metadata.currency', verbose_name='ვალუტა')),
+                ('platform', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bid_submissions', to='bids.platform', verbose_name='პლათფორმა')),
+                ('shipment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bid_submissions', to='shipments.shipment', verbose_name='განაცხადი')),
+            ],
+            options={
+                'verbose_name': 'ბიდის მიწოდება',
+                'verbose_name_plural': 'ბიდების მიწოდებები',
+                'db_table': 'bid_submissions',
+                'indexes': [models.Index(condition=models.Q(('status', 'queued')), fields=['created_at'], name='bid_submissions_queued_idx')],
+            },
+        ),
+    ]
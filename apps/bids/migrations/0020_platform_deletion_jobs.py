@@ -0,0 +1,38 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('bids', '0019_bid_submissions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformDeletionJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('queued', 'რიგში'), ('running', 'მიმდინარე'), ('completed', 'დასრულებული'), ('failed', 'შეცდომა')], default='queued', max_length=20, verbose_name='სტატუსი')),
+                ('total_bids', models.PositiveIntegerField(default=0, verbose_name='ბიდები სულ')),
+                ('rejected_bids', models.PositiveIntegerField(default=0, verbose_name='უარყოფილი ბიდები')),
+                ('error', models.TextField(blank=True, null=True, verbose_name='შეცდომა')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='შექმნის თარიღი')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='დაწყების თარიღი')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='დასრულების თარიღი')),
+                ('platforms', models.ManyToManyField(related_name='deletion_jobs', to='bids.platform', verbose_name='პლათფორმები')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='platform_deletion_jobs', to=settings.AUTH_USER_MODEL, verbose_name='მოითხოვა')),
+            ],
+            options={
+                'verbose_name': 'პლათფორმების წაშლის დავალება',
+                'verbose_name_plural': 'პლათფორმების წაშლის დავალებები',
+                'db_table': 'platform_deletion_jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bids', '0022_bid_bids_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='platformdeletionjob',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='Refreshed after every chunk; a running job not refreshed for long was interrupted', verbose_name='განახლების თარიღი'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:40
+
+from datetime import timezone as dt_timezone
+import apps.common.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Besides the months already holding bids, partitions are created for the
+# current month and this many after it; the default partition takes the rows
+# of any other month until maintain_bid_partitions creates one for it
+MONTHS_AHEAD = 3
+
+
+def rebuild_table(schema_editor, model, partitioned):
+    """
+    Replace the bids table by a copy that is range partitioned by month on
+    created_at, or by a plain one. Rows and the display_id sequence are kept;
+    the primary key, indexes and foreign keys are recreated from the model
+    state, with the names Django gives them.
+    """
+    quote = schema_editor.quote_name
+    table = model._meta.db_table
+    previous = f'{table}_previous'
+    created_at = quote(model._meta.get_field('created_at').column)
+    display_id = model._meta.get_field('display_id')
+    
+    # The sequence is owned by the column, so it would be dropped with the old table
+    schema_editor.execute(f'ALTER SEQUENCE {quote(display_id.sequence_name)} OWNED BY NONE')
+    schema_editor.execute(f'ALTER TABLE {quote(table)} RENAME TO {quote(previous)}')
+    schema_editor.execute(
+        f'CREATE TABLE {quote(table)} (LIKE {quote(previous)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        + (f' PARTITION BY RANGE ({created_at})' if partitioned else '')
+    )
+    
+    if partitioned:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT date_trunc('month', {created_at} AT TIME ZONE 'UTC') FROM {quote(previous)} "
+                "UNION SELECT generate_series("
+                "date_trunc('month', now() AT TIME ZONE 'UTC'), "
+                "date_trunc('month', now() AT TIME ZONE 'UTC') + %s * interval '1 month', "
+                "interval '1 month')",
+                [MONTHS_AHEAD]
+            )
+            months = sorted(row[0].replace(tzinfo=dt_timezone.utc) for row in cursor.fetchall())
+        for month in months:
+            following = month.replace(year=month.year + month.month // 12, month=month.month % 12 + 1)
+            schema_editor.execute(
+                f'CREATE TABLE {quote(f"{table}_p{month:%Y_%m}")} PARTITION OF {quote(table)} '
+                'FOR VALUES FROM (%s) TO (%s)',
+                [month, following]
+            )
+        schema_editor.execute(f'CREATE TABLE {quote(f"{table}_default")} PARTITION OF {quote(table)} DEFAULT')
+    
+    columns = ', '.join(quote(field.column) for field in model._meta.local_concrete_fields)
+    schema_editor.execute(f'INSERT INTO {quote(table)} ({columns}) SELECT {columns} FROM {quote(previous)}')
+    schema_editor.execute(f'DROP TABLE {quote(previous)}')
+    schema_editor.execute(
+        f'ALTER SEQUENCE {quote(display_id.sequence_name)} OWNED BY {quote(table)}.{quote(display_id.column)}'
+    )
+    
+    # Every unique index of a partitioned table must contain the partition key
+    primary_key = [quote(model._meta.pk.column)] + ([created_at] if partitioned else [])
+    schema_editor.execute(f'ALTER TABLE {quote(table)} ADD PRIMARY KEY ({", ".join(primary_key)})')
+    for field in model._meta.local_fields:
+        if field.remote_field and field.db_constraint:
+            schema_editor.execute(schema_editor._create_fk_sql(model, field, '_fk_%(to_table)s_%(to_column)s'))
+    for sql in schema_editor._model_indexes_sql(model):
+        schema_editor.execute(sql)
+
+
+def partition_bids(apps, schema_editor):
+    rebuild_table(schema_editor, apps.get_model('bids', 'Bid'), partitioned=True)
+
+
+def unpartition_bids(apps, schema_editor):
+    rebuild_table(schema_editor, apps.get_model('bids', 'Bid'), partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bids', '0023_platformdeletionjob_updated_at'),
+        ('shipments', '0009_alter_shipment_selected_bid'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bidsubmission',
+            name='bid',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='submissions', to='bids.bid', verbose_name='ბიდი'),
+        ),
+        migrations.RemoveConstraint(
+            model_name='bid',
+            name='unique_bid_fingerprint',
+        ),
+        migrations.AlterField(
+            model_name='bid',
+            name='display_id',
+            field=apps.common.fields.SequenceField(db_index=True, editable=False, null=True, verbose_name='Display ID'),
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['fingerprint'], name='bids_fingerp_925424_idx'),
+        ),
+        migrations.RunPython(partition_bids, unpartition_bids),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:40
+
+from django.db import migrations, models
+
+
+# One bid_keys row per bid. Moving a bid to another partition (an UPDATE of
+# created_at) runs as a DELETE and an INSERT, so its row is deleted and
+# inserted again; the foreign keys to bid_keys are deferred and do not see it.
+SYNC_KEYS_SQL = '''
+CREATE FUNCTION bids_sync_keys() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO bid_keys (bid_id, display_id, fingerprint) VALUES (NEW.id, NEW.display_id, NEW.fingerprint);
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE bid_keys SET bid_id = NEW.id, display_id = NEW.display_id, fingerprint = NEW.fingerprint
+        WHERE bid_id = OLD.id;
+    ELSE
+        DELETE FROM bid_keys WHERE bid_id = OLD.id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+INSERT INTO bid_keys (bid_id, display_id, fingerprint) SELECT id, display_id, fingerprint FROM bids;
+
+CREATE TRIGGER bids_sync_keys AFTER INSERT OR DELETE ON bids
+    FOR EACH ROW EXECUTE FUNCTION bids_sync_keys();
+CREATE TRIGGER bids_sync_keys_on_update AFTER UPDATE OF id, display_id, fingerprint ON bids
+    FOR EACH ROW
+    WHEN ((OLD.id, OLD.display_id, OLD.fingerprint) IS DISTINCT FROM (NEW.id, NEW.display_id, NEW.fingerprint))
+    EXECUTE FUNCTION bids_sync_keys();
+'''
+
+DROP_SYNC_KEYS_SQL = '''
+DROP TRIGGER bids_sync_keys_on_update ON bids;
+DROP TRIGGER bids_sync_keys ON bids;
+DROP FUNCTION bids_sync_keys();
+'''
+
+# Columns that reference bids and are checked against bid_keys instead
+REFERENCES = [
+    ('shipments', 'Shipment', 'selected_bid'),
+    ('bids', 'BidSubmission', 'bid'),
+]
+
+
+def add_references(apps, schema_editor):
+    quote = schema_editor.quote_name
+    keys = apps.get_model('bids', 'BidKey')._meta
+    for app_label, model_name, field_name in REFERENCES:
+        model = apps.get_model(app_label, model_name)
+        schema_editor.execute(
+            f'ALTER TABLE {quote(model._meta.db_table)} '
+            f'ADD FOREIGN KEY ({quote(model._meta.get_field(field_name).column)}) '
+            f'REFERENCES {quote(keys.db_table)} ({quote(keys.pk.column)}) DEFERRABLE INITIALLY DEFERRED'
+        )
+
+
+def remove_references(apps, schema_editor):
+    quote = schema_editor.quote_name
+    keys = apps.get_model('bids', 'BidKey')._meta
+    connection = schema_editor.connection
+    for app_label, model_name, field_name in REFERENCES:
+        model = apps.get_model(app_label, model_name)
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+        for name, constraint in constraints.items():
+            if constraint['foreign_key'] == (keys.db_table, keys.pk.column):
+                schema_editor.execute(f'ALTER TABLE {quote(model._meta.db_table)} DROP CONSTRAINT {quote(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bids', '0024_partition_bids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BidKey',
+            fields=[
+                ('bid_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('display_id', models.PositiveIntegerField(null=True, unique=True, verbose_name='Display ID')),
+                ('fingerprint', models.CharField(max_length=64, null=True, verbose_name='ანაბეჭდი')),
+            ],
+            options={
+                'verbose_name': 'ბიდის გასაღები',
+                'verbose_name_plural': 'ბიდების გასაღებები',
+                'db_table': 'bid_keys',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='bidkey',
+            constraint=models.UniqueConstraint(condition=models.Q(('fingerprint__isnull', False)), fields=('fingerprint',), name='unique_bid_fingerprint'),
+        ),
+        migrations.RunSQL(SYNC_KEYS_SQL, DROP_SYNC_KEYS_SQL),
+        migrations.RunPython(add_references, remove_references),
+    ]
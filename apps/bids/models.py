@@ -1,13 +1,19 @@
 import uuid
 import secrets
+from decimal import Decimal
 from django.db import models
-from django.db.models import Max
+from django.contrib.postgres.indexes import BrinIndex
 from django.contrib.auth.hashers import make_password, check_password
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 from django.conf import settings
-from .managers import BidManager, ActivePlatformManager
+from apps.common.fields import FingerprintField, SequenceField
+from apps.common.ids import uuid7
+from .managers import (
+    BID_ERROR_MESSAGES, BidManager, BidSubmissionManager, RejectedBidCacheManager, PlatformManager,
+    ActivePlatformManager
+)
 
 
 class Platform(models.Model):
@@ -69,7 +75,7 @@ class Platform(models.Model):
         verbose_name=_('წაშალა')
     )
     
-    objects = models.Manager()
+    objects = PlatformManager()
     active = ActivePlatformManager()
     
     class Meta:
@@ -93,7 +99,7 @@ class PlatformAPIKey(models.Model):
     """
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
     platform = models.ForeignKey(
@@ -160,6 +166,9 @@ class PlatformAPIKey(models.Model):
 class Bid(models.Model):
     """
     Bid submitted by a broker on a shipment.
+    The table is range partitioned by month on created_at (see partitions.py),
+    so its primary key in the database is (id, created_at); the keys that must
+    be unique across all partitions are kept unique in BidKey.
     """
     STATUS_CHOICES = [
         ('pending', _('მოლოდინში')),
@@ -169,14 +178,14 @@ class Bid(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
-    display_id = models.PositiveIntegerField(
+    display_id = SequenceField(
         _('Display ID'),
         editable=False,
         null=True,
-        unique=True
+        db_index=True
     )
     shipment = models.ForeignKey(
         'shipments.Shipment',
@@ -232,6 +241,15 @@ class Bid(models.Model):
         null=True,
         help_text=_('ID from the external platform to identify the specific broker')
     )
+    fingerprint = FingerprintField(
+        _('ანაბეჭდი'),
+        null=True,
+        source_fields=[
+            'shipment_id', 'platform_id', 'price', 'estimated_delivery_time',
+            'currency_id', 'company_name', 'external_user_id'
+        ],
+        help_text=_('Hash of the parameters that identify an exact duplicate bid')
+    )
     status = models.CharField(
         _('სტატუსი'),
         max_length=20,
@@ -275,17 +293,22 @@ class Bid(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['shipment', 'platform', 'status']),
+            models.Index(fields=['platform', 'updated_at']),
+            models.Index(fields=['platform', 'external_user_id']),
+            # Exact duplicate lookups; uniqueness is enforced by BidKey
+            models.Index(fields=['fingerprint']),
+            # Small, append-friendly index for created_at range scans (dashboard rollups)
+            BrinIndex(fields=['created_at'], name='bids_created_at_brin'),
         ]
     
     def __str__(self):
         return f"{self.company_name} - {self.price} {self.currency.code}"
-
-    def save(self, *args, **kwargs):
-        if self.display_id is None:
-            max_id = Bid.objects.aggregate(Max('display_id'))['display_id__max']
-            self.display_id = (max_id or 0) + 1
-        super().save(*args, **kwargs)
     
+    @classmethod
+    def fingerprint_for(cls, values):
+        """Return the fingerprint of a mapping of field values."""
+        return cls._meta.get_field('fingerprint').compute(values)
+
     def accept(self):
         """Mark bid as accepted."""
         self.status = 'accepted'
@@ -299,25 +322,59 @@ class Bid(models.Model):
         self.save(update_fields=['status', 'updated_at'])
         
         # Cache rejected bid to prevent exact duplicates
-        RejectedBidCache.objects.get_or_create(
-            shipment=self.shipment,
-            platform=self.platform,
-            price=self.price,
-            estimated_delivery_time=self.estimated_delivery_time,
-            currency=self.currency,
-            external_user_id=self.external_user_id,
-            defaults={'rejected_at': timezone.now()}
-        )
+        RejectedBidCache.objects.bulk_create([RejectedBidCache.for_bid(self)], ignore_conflicts=True)
+
+
+class BidKey(models.Model):
+    """
+    Keys of bids that must be unique across all partitions of bids.
+    A unique index of a partitioned table has to include the partition key,
+    so bids cannot enforce these itself. A trigger on bids (migration 0025)
+    keeps one row per bid here, and shipments.selected_bid and
+    bid_submissions.bid reference bid_id instead of bids.
+    """
+    bid_id = models.UUIDField(
+        primary_key=True
+    )
+    display_id = models.PositiveIntegerField(
+        _('Display ID'),
+        null=True,
+        unique=True
+    )
+    fingerprint = models.CharField(
+        _('ანაბეჭდი'),
+        max_length=64,
+        null=True
+    )
+    
+    class Meta:
+        verbose_name = _('ბიდის გასაღები')
+        verbose_name_plural = _('ბიდების გასაღებები')
+        db_table = 'bid_keys'
+        constraints = [
+            # Rows left without a fingerprint (duplicates that predate it) are not indexed
+            models.UniqueConstraint(
+                fields=['fingerprint'],
+                condition=models.Q(fingerprint__isnull=False),
+                name='unique_bid_fingerprint'
+            )
+        ]
+    
+    def __str__(self):
+        return str(self.bid_id)
 
 
 class RejectedBidCache(models.Model):
     """
     Cache of rejected bid parameters to prevent exact duplicate resubmissions.
-    Stores the combination of: shipment + broker + price + delivery_time + currency
+    Stores the combination of: shipment + broker + price + delivery_time + currency,
+    deduplicated through a unique fingerprint of those columns.
+    Entries are only needed while the shipment is active; the rest are
+    removed by the prune_rejected_bid_cache command.
     """
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
     shipment = models.ForeignKey(
@@ -353,21 +410,286 @@ class RejectedBidCache(models.Model):
         null=True,
         help_text=_('ID from the external platform to identify the specific broker')
     )
+    fingerprint = FingerprintField(
+        _('ანაბეჭდი'),
+        null=True,
+        source_fields=[
+            'shipment_id', 'platform_id', 'price', 'estimated_delivery_time',
+            'currency_id', 'external_user_id'
+        ],
+        help_text=_('Hash of the parameters that identify a rejected bid')
+    )
     rejected_at = models.DateTimeField(
         _('უარყოფის თარიღი'),
         auto_now_add=True
     )
     
+    objects = RejectedBidCacheManager()
+    
     class Meta:
         verbose_name = _('უარყოფილი ბიდის კეში')
         verbose_name_plural = _('უარყოფილი ბიდების კეში')
         db_table = 'rejected_bids_cache'
         constraints = [
             models.UniqueConstraint(
-                fields=['shipment', 'platform', 'price', 'estimated_delivery_time', 'currency', 'external_user_id'],
-                name='unique_rejected_bid'
+                fields=['fingerprint'],
+                name='unique_rejected_bid_fingerprint'
             )
         ]
     
     def __str__(self):
         return f"Rejected: {self.platform.company_name} - {self.shipment.id}"
+    
+    @classmethod
+    def fingerprint_for(cls, values):
+        """Return the fingerprint of a mapping of field values."""
+        return cls._meta.get_field('fingerprint').compute(values)
+    
+    @classmethod
+    def for_bid(cls, bid):
+        """Return an unsaved cache entry with the parameters of a bid."""
+        return cls(
+            shipment_id=bid.shipment_id,
+            platform_id=bid.platform_id,
+            price=bid.price,
+            estimated_delivery_time=bid.estimated_delivery_time,
+            currency_id=bid.currency_id,
+            external_user_id=bid.external_user_id
+        )
+
+
+class BidSubmission(models.Model):
+    """
+    Bid submission waiting in the asynchronous ingestion queue.
+    Created by the API in async ingestion mode after cheap validation;
+    process_bid_queue applies the bid rules and creates the bids in
+    micro-batches. The ID doubles as the tracking ID returned to platforms.
+    """
+    STATUS_CHOICES = [
+        ('queued', _('რიგში')),
+        ('created', _('შექმნილი')),
+        ('failed', _('ვერ შეიქმნა')),
+    ]
+    
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid7,
+        editable=False
+    )
+    platform = models.ForeignKey(
+        Platform,
+        on_delete=models.CASCADE,
+        related_name='bid_submissions',
+        verbose_name=_('პლათფორმა')
+    )
+    shipment = models.ForeignKey(
+        'shipments.Shipment',
+        on_delete=models.CASCADE,
+        related_name='bid_submissions',
+        verbose_name=_('განაცხადი')
+    )
+    currency = models.ForeignKey(
+        'metadata.Currency',
+        on_delete=models.PROTECT,
+        related_name='bid_submissions',
+        verbose_name=_('ვალუტა')
+    )
+    payload = models.JSONField(
+        _('მონაცემები'),
+        help_text=_('Validated bid fields as submitted through the API')
+    )
+    status = models.CharField(
+        _('სტატუსი'),
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='queued'
+    )
+    error_code = models.CharField(
+        _('შეცდომის კოდი'),
+        max_length=50,
+        blank=True,
+        null=True
+    )
+    error_message = models.CharField(
+        _('შეცდომის აღწერა'),
+        max_length=255,
+        blank=True,
+        null=True
+    )
+    # bids is partitioned, so the reference is checked against bid_keys
+    bid = models.ForeignKey(
+        Bid,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_constraint=False,
+        related_name='submissions',
+        verbose_name=_('ბიდი')
+    )
+    created_at = models.DateTimeField(
+        _('შექმნის თარიღი'),
+        auto_now_add=True
+    )
+    processed_at = models.DateTimeField(
+        _('დამუშავების თარიღი'),
+        null=True,
+        blank=True
+    )
+    
+    objects = BidSubmissionManager()
+    
+    class Meta:
+        verbose_name = _('ბიდის მიწოდება')
+        verbose_name_plural = _('ბიდების მიწოდებები')
+        db_table = 'bid_submissions'
+        indexes = [
+            # Only the queue head is scanned by the consumer
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status='queued'),
+                name='bid_submissions_queued_idx'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.platform_id} - {self.shipment_id} ({self.status})"
+    
+    def build_bid(self):
+        """Return an unsaved pending bid from the submitted fields."""
+        return Bid(
+            shipment=self.shipment,
+            platform=self.platform,
+            company_name=self.payload['company_name'],
+            price=Decimal(self.payload['price']),
+            currency=self.currency,
+            estimated_delivery_time=self.payload['estimated_delivery_time'],
+            comment=self.payload.get('comment', ''),
+            contact_person=self.payload['contact_person'],
+            contact_phone=self.payload['contact_phone'],
+            external_user_id=self.payload['driver_id'],
+            status='pending'
+        )
+    
+    def fail(self, error_code, error_message=None):
+        """Mark the submission failed (unsaved); the message defaults to the one of error_code."""
+        self.status = 'failed'
+        self.error_code = error_code
+        self.error_message = error_message or BID_ERROR_MESSAGES[error_code]
+
+
+class PlatformDeletionJob(models.Model):
+    """
+    Background soft delete of platforms with too many pending bids to
+    reject within an admin request. Run by the run_platform_deletion_jobs
+    command, which rejects the bids in chunks and records progress.
+    """
+    STATUS_CHOICES = [
+        ('queued', _('რიგში')),
+        ('running', _('მიმდინარე')),
+        ('completed', _('დასრულებული')),
+        ('failed', _('შეცდომა')),
+    ]
+    
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    platforms = models.ManyToManyField(
+        Platform,
+        related_name='deletion_jobs',
+        verbose_name=_('პლათფორმები')
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='platform_deletion_jobs',
+        verbose_name=_('მოითხოვა')
+    )
+    status = models.CharField(
+        _('სტატუსი'),
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='queued'
+    )
+    total_bids = models.PositiveIntegerField(
+        _('ბიდები სულ'),
+        default=0
+    )
+    rejected_bids = models.PositiveIntegerField(
+        _('უარყოფილი ბიდები'),
+        default=0
+    )
+    error = models.TextField(
+        _('შეცდომა'),
+        blank=True,
+        null=True
+    )
+    created_at = models.DateTimeField(
+        _('შექმნის თარიღი'),
+        auto_now_add=True
+    )
+    started_at = models.DateTimeField(
+        _('დაწყების თარიღი'),
+        null=True,
+        blank=True
+    )
+    finished_at = models.DateTimeField(
+        _('დასრულების თარიღი'),
+        null=True,
+        blank=True
+    )
+    updated_at = models.DateTimeField(
+        _('განახლების თარიღი'),
+        auto_now=True,
+        help_text=_('Refreshed after every chunk; a running job not refreshed for long was interrupted')
+    )
+    
+    class Meta:
+        verbose_name = _('პლათფორმების წაშლის დავალება')
+        verbose_name_plural = _('პლათფორმების წაშლის დავალებები')
+        db_table = 'platform_deletion_jobs'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.created_at:%Y-%m-%d %H:%M} ({self.status})"
+    
+    @property
+    def progress(self):
+        """Return the share of rejected bids as a percentage."""
+        if not self.total_bids:
+            return 100 if self.status == 'completed' else 0
+        return min(100, round(self.rejected_bids * 100 / self.total_bids))
+    
+    def run(self, chunk_size=1000):
+        """
+        Soft delete the platforms of this job.
+        The platforms are deactivated first so they stop submitting bids,
+        then their pending bids are rejected in chunks, each in its own
+        transaction, and finally the platforms are marked deleted.
+        Every step can be repeated, so an interrupted job is resumed by
+        running it again; each chunk refreshes updated_at.
+        """
+        self.status = 'running'
+        self.started_at = self.started_at or timezone.now()
+        self.save(update_fields=['status', 'started_at', 'updated_at'])
+        
+        platforms = Platform.objects.filter(deletion_jobs=self)
+        platforms.update(is_active=False, updated_at=timezone.now())
+        
+        pending_bids = Bid.objects.filter(platform__in=platforms, status='pending')
+        while True:
+            chunk = list(pending_bids.order_by().values_list('pk', flat=True)[:chunk_size])
+            if not chunk:
+                break
+            rejected, cached = Bid.objects.filter(pk__in=chunk).reject_pending()
+            self.rejected_bids += rejected
+            self.save(update_fields=['rejected_bids', 'updated_at'])
+        
+        platforms.soft_delete(self.requested_by)
+        
+        self.status = 'completed'
+        self.finished_at = timezone.now()
+        self.save(update_fields=['status', 'finished_at', 'updated_at'])
@@ -0,0 +1,135 @@
+from datetime import datetime, timezone as dt_timezone
+from django.db import connection, transaction
+from .models import Bid
+
+
+# bids is range partitioned on created_at, one partition per UTC month named
+# bids_pYYYY_MM, plus a default partition for the rows of months without one
+# (see migration 0024)
+PARENT_TABLE = Bid._meta.db_table
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+
+
+def month_start(value):
+    """Return the first instant of the UTC month containing value."""
+    value = value.astimezone(dt_timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def next_month(month):
+    """Return the first instant of the month after month."""
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def partition_name(month):
+    """Return the table name of the partition for month."""
+    return f'{PARENT_TABLE}_p{month:%Y_%m}'
+
+
+def partition_month(name):
+    """Return the month of a monthly partition name, or None for the default partition."""
+    if name == DEFAULT_PARTITION:
+        return None
+    return datetime.strptime(name[-7:], '%Y_%m').replace(tzinfo=dt_timezone.utc)
+
+
+def existing_partitions():
+    """Return the names of the attached partitions."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = %s::regclass',
+            [PARENT_TABLE]
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def create_partition(month):
+    """
+    Create the partition for month. A partition cannot be added while the
+    default partition holds rows of its range, so those rows are moved out
+    and inserted again through bids in the same transaction; the trigger
+    deletes and re-adds their bid_keys rows on the way.
+    """
+    quote = connection.ops.quote_name
+    name = partition_name(month)
+    bounds = [month, next_month(month)]
+    created_at = quote(Bid._meta.get_field('created_at').column)
+    in_range = f'{created_at} >= %s AND {created_at} < %s'
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'SELECT EXISTS (SELECT 1 FROM {quote(DEFAULT_PARTITION)} WHERE {in_range})', bounds)
+        stray = cursor.fetchone()[0]
+        if stray:
+            moving = quote(f'{name}_moving')
+            cursor.execute(f'CREATE TEMPORARY TABLE {moving} (LIKE {quote(PARENT_TABLE)})')
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {quote(DEFAULT_PARTITION)} WHERE {in_range} RETURNING *) '
+                f'INSERT INTO {moving} SELECT * FROM moved',
+                bounds
+            )
+        cursor.execute(
+            f'CREATE TABLE {quote(name)} PARTITION OF {quote(PARENT_TABLE)} FOR VALUES FROM (%s) TO (%s)',
+            bounds
+        )
+        if stray:
+            cursor.execute(f'INSERT INTO {quote(PARENT_TABLE)} SELECT * FROM {moving}')
+            cursor.execute(f'DROP TABLE {moving}')
+
+
+def ensure_partitions(months):
+    """
+    Create the partitions for months (any instants within them) that do not
+    exist yet. Creating a partition locks the parent table, so the catalog is
+    checked first and the common case takes no lock.
+    Returns the names of the created partitions.
+    """
+    existing = existing_partitions()
+    missing = sorted(
+        month for month in {month_start(month) for month in months}
+        if partition_name(month) not in existing
+    )
+    for month in missing:
+        create_partition(month)
+    return [partition_name(month) for month in missing]
+
+
+def partition_stats():
+    """
+    Return (name, month, estimated rows, total bytes) for each attached
+    partition, oldest first and the default partition (month None) last.
+    Row counts come from the planner statistics.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname, child.reltuples::bigint, pg_total_relation_size(child.oid) '
+            'FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = %s::regclass',
+            [PARENT_TABLE]
+        )
+        rows = cursor.fetchall()
+
+    stats = [(name, partition_month(name), max(rows_estimate, 0), size) for name, rows_estimate, size in rows]
+    return sorted(stats, key=lambda row: row[1] or datetime.max.replace(tzinfo=dt_timezone.utc))
+
+
+def drop_partition(name):
+    """
+    Detach and drop a monthly partition if it holds no bids; its bids leave
+    with their shipments when those are archived. Returns whether it was
+    dropped. The check runs after the detach, which locks the partition, so
+    no bid can move in between.
+    """
+    quote = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {quote(PARENT_TABLE)} DETACH PARTITION {quote(name)}')
+        cursor.execute(f'SELECT EXISTS (SELECT 1 FROM {quote(name)})')
+        if cursor.fetchone()[0]:
+            transaction.set_rollback(True)
+            return False
+        cursor.execute(f'DROP TABLE {quote(name)}')
+    return True
@@ -0,0 +1,25 @@
+from apps.common.paginators import EstimatedCountPaginator
+
+
+class ChangelistQuerysetMixin:
+    """
+    Let get_queryset tell the changelist apart from the other admin views,
+    so the list can use a lean, joined queryset while the change view and
+    object lookups keep loading full rows.
+    """
+    
+    def is_changelist_request(self, request):
+        """Check if the request is for the changelist (including its actions)."""
+        match = request.resolver_match
+        opts = self.model._meta
+        return bool(match) and match.url_name == f'{opts.app_label}_{opts.model_name}_changelist'
+
+
+class EstimatedCountMixin:
+    """
+    Opt a changelist into approximate counts for large tables: the paginator
+    uses planner estimates and the extra unfiltered count is switched off.
+    """
+    
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
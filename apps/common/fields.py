@@ -0,0 +1,88 @@
+import hashlib
+from decimal import Decimal
+from django.db import models
+from django.db.models import Func, Value
+
+
+class NextVal(Func):
+    """Allocate the next value of a PostgreSQL sequence."""
+    
+    function = 'nextval'
+    output_field = models.BigIntegerField()
+    
+    def __init__(self, sequence_name):
+        super().__init__(Value(sequence_name))
+
+
+class SequenceField(models.PositiveIntegerField):
+    """
+    Integer column populated from a database sequence on insert.
+    
+    The value is allocated by nextval() inside the INSERT itself and read back
+    with RETURNING, so there is no extra round trip and no MAX() + 1 race
+    between concurrent inserts. The sequence is named like a serial column's
+    (<table>_<column>_seq) and must be created by a migration.
+    """
+    
+    db_returning = True
+    
+    @property
+    def sequence_name(self):
+        return f'{self.model._meta.db_table}_{self.column}_seq'
+    
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.attname)
+        if add and value is None:
+            return NextVal(self.sequence_name)
+        return value
+
+
+class FingerprintField(models.CharField):
+    """
+    SHA-256 digest of other fields of the same row, computed on insert.
+    
+    A unique index on the digest enforces uniqueness of the whole tuple in
+    one O(log n) lookup, including nullable columns, which a multi-column
+    unique constraint treats as always distinct. Values are joined with a
+    unit separator; NULL is encoded as \\N and decimals are formatted with
+    the field's decimal places, matching their PostgreSQL text form.
+    """
+    
+    separator = '\x1f'
+    null_marker = '\\N'
+    
+    def __init__(self, *args, source_fields=(), **kwargs):
+        self.source_fields = tuple(source_fields)
+        kwargs['max_length'] = 64
+        kwargs['editable'] = False
+        super().__init__(*args, **kwargs)
+    
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        del kwargs['max_length']
+        del kwargs['editable']
+        kwargs['source_fields'] = self.source_fields
+        return name, path, args, kwargs
+    
+    def compute(self, values):
+        """Return the digest for a mapping of source field values."""
+        parts = []
+        for name in self.source_fields:
+            value = values[name]
+            if value is None:
+                parts.append(self.null_marker)
+                continue
+            field = self.model._meta.get_field(name)
+            if isinstance(field, models.DecimalField):
+                value = Decimal(value).quantize(Decimal(1).scaleb(-field.decimal_places))
+            parts.append(str(value))
+        return hashlib.sha256(self.separator.join(parts).encode()).hexdigest()
+    
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.attname)
+        if add and value is None:
+            value = self.compute({
+                name: getattr(model_instance, name) for name in self.source_fields
+            })
+            setattr(model_instance, self.attname, value)
+        return value
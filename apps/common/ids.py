@@ -0,0 +1,44 @@
+import os
+import threading
+import time
+import uuid
+
+
+_RANDOM_BITS = 74
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_random = 0
+
+
+def uuid7():
+    """
+    Return a time-ordered UUID (version 7, RFC 9562).
+    The first 48 bits are the Unix time in milliseconds and the remaining 74
+    bits are random, so keys generated later sort after earlier ones and new
+    rows are appended to the right edge of the primary key index instead of
+    landing on random pages. Keys generated by this process within the same
+    millisecond continue from the previous one with a random increment, so
+    they stay ordered too. The value is an ordinary uuid.UUID and is stored in
+    the same uuid column as the existing version 4 keys.
+    """
+    global _last_timestamp_ms, _last_random
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if timestamp_ms > _last_timestamp_ms:
+            random_bits = int.from_bytes(os.urandom(10), 'big') >> (80 - _RANDOM_BITS)
+        else:
+            # Same millisecond, or the clock went back: keep counting from the last key
+            timestamp_ms = _last_timestamp_ms
+            random_bits = _last_random + 1 + int.from_bytes(os.urandom(4), 'big')
+            if random_bits >> _RANDOM_BITS:
+                timestamp_ms += 1
+                random_bits &= (1 << _RANDOM_BITS) - 1
+        _last_timestamp_ms, _last_random = timestamp_ms, random_bits
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                                  # version
+    value |= (random_bits >> 62) << 64                  # rand_a
+    value |= 0b10 << 62                                 # variant
+    value |= random_bits & 0x3FFF_FFFF_FFFF_FFFF        # rand_b
+    return uuid.UUID(int=value)
@@ -0,0 +1,35 @@
+from django.db import connection
+from django.db.transaction import TransactionManagementError
+
+
+# First key of the two-key advisory lock form, one per kind of locked object
+SHIPMENT_LOCK_NAMESPACE = 1
+
+
+def advisory_xact_lock(namespace, keys, shared=False):
+    """
+    Take transaction-scoped PostgreSQL advisory locks on keys.
+    Shared locks do not block each other; an exclusive lock waits for every
+    holder of the same key and blocks new ones until the transaction ends.
+    Keys are hashed to int4 with hashtext() and locked in sorted order with a
+    single statement, so concurrent callers cannot deadlock on each other.
+    """
+    if not connection.in_atomic_block:
+        raise TransactionManagementError('Advisory locks must be taken inside a transaction')
+
+    function = 'pg_advisory_xact_lock_shared' if shared else 'pg_advisory_xact_lock'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT {function}(%s, hashtext(key)) FROM unnest(%s::text[]) AS key',
+            [namespace, sorted({str(key) for key in keys})]
+        )
+
+
+def lock_shipments(shipment_ids, shared=False):
+    """
+    Lock shipments for the rest of the transaction.
+    Bid submissions take shared locks so they run side by side; status
+    changes that close a shipment take an exclusive lock, which waits for
+    in-flight submissions and makes later ones see the new status.
+    """
+    advisory_xact_lock(SHIPMENT_LOCK_NAMESPACE, shipment_ids, shared=shared)
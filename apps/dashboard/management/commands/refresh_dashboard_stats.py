@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apps.dashboard.models import DailyStats
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the daily dashboard rollups of the last --days days from the '
+        'shipments and bids tables. Safe to re-run; meant to be scheduled (e.g. '
+        'cron every few minutes). Run once with --days 30 to backfill.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.DASHBOARD_REFRESH_DAYS,
+            help='Number of days, today included, to recompute'
+        )
+
+    def handle(self, *args, **options):
+        rows = DailyStats.objects.refresh(days=options['days'])
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(rows)} days refreshed ({rows[0].day} - {rows[-1].day})'
+        ))
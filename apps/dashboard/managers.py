@@ -0,0 +1,155 @@
+from collections import Counter
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db import models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+ROLLUP_FIELDS = [
+    'shipments_created', 'shipments_completed', 'shipments_cancelled', 'active_shipments',
+    'bids_created', 'bids_accepted', 'bids_rejected', 'bid_count_histogram', 'updated_at',
+]
+
+
+def histogram_median(histogram):
+    """Return the median of the values counted in histogram ({value: count}), or None if empty."""
+    total = sum(histogram.values())
+    if not total:
+        return None
+    
+    # Positions of the middle value(s) in the sorted, expanded list
+    middle = [(total - 1) // 2, total // 2]
+    values = []
+    seen = 0
+    for value, count in sorted(histogram.items()):
+        while middle and middle[0] < seen + count:
+            values.append(value)
+            middle.pop(0)
+        seen += count
+    return sum(values) / len(values)
+
+
+class DailyStatsManager(models.Manager):
+    """Manager for maintaining and reading the daily dashboard rollups."""
+    
+    def refresh(self, days=None, today=None):
+        """
+        Recompute the rows of the last days days, today included, and return
+        them. Each source table is read once over that window only, so the
+        cost follows recent activity rather than table size. Days before the
+        window keep their rows; the window has to cover the time in which
+        bids are still decided on a shipment.
+        """
+        from apps.shipments.models import Shipment
+        from apps.bids.models import Bid
+        
+        days = days or settings.DASHBOARD_REFRESH_DAYS
+        today = today or timezone.localdate()
+        first_day = today - timedelta(days=days - 1)
+        start = timezone.make_aware(datetime.combine(first_day, time.min))
+        
+        rows = {
+            first_day + timedelta(days=offset): self.model(day=first_day + timedelta(days=offset))
+            for offset in range(days)
+        }
+        histograms = {day: Counter() for day in rows}
+        
+        bids = (
+            Bid.objects.filter(created_at__gte=start)
+            .annotate(day=TruncDate('created_at'))
+            .values('day')
+            .annotate(
+                total=Count('pk'),
+                accepted=Count('pk', filter=Q(status='accepted')),
+                rejected=Count('pk', filter=Q(status='rejected'))
+            )
+            .order_by()
+        )
+        for bid_row in bids:
+            row = rows.get(bid_row['day'])
+            if row:
+                row.bids_created = bid_row['total']
+                row.bids_accepted = bid_row['accepted']
+                row.bids_rejected = bid_row['rejected']
+        
+        shipments = (
+            Shipment.objects.filter(created_at__gte=start)
+            .annotate(day=TruncDate('created_at'), bid_total=Count('bids'))
+            .values_list('day', 'bid_total')
+            .order_by()
+        )
+        for day, bid_total in shipments:
+            if day in rows:
+                rows[day].shipments_created += 1
+                histograms[day][bid_total] += 1
+        
+        for status, field in (('completed', 'completed_at'), ('cancelled', 'cancelled_at')):
+            closed = (
+                Shipment.objects.filter(status=status, **{f'{field}__gte': start})
+                .annotate(day=TruncDate(field))
+                .values('day')
+                .annotate(total=Count('pk'))
+                .order_by()
+            )
+            for closed_row in closed:
+                row = rows.get(closed_row['day'])
+                if row:
+                    setattr(row, f'shipments_{status}', closed_row['total'])
+        
+        # Active shipments are a snapshot: earlier days keep the value last taken on them
+        snapshots = dict(self.filter(day__in=rows).values_list('day', 'active_shipments'))
+        for day, row in rows.items():
+            row.active_shipments = snapshots.get(day, 0)
+            row.bid_count_histogram = {str(count): total for count, total in sorted(histograms[day].items())}
+        rows[today].active_shipments = Shipment.objects.active().count()
+        
+        return self.bulk_create(
+            rows.values(),
+            update_conflicts=True,
+            unique_fields=['day'],
+            update_fields=ROLLUP_FIELDS
+        )
+    
+    def dashboard(self, days=30, today=None):
+        """
+        Return the dashboard KPIs and the daily series of the last days days.
+        Only the rollup rows are read, so the cost does not depend on how
+        many shipments and bids there are.
+        """
+        today = today or timezone.localdate()
+        first_day = today - timedelta(days=days - 1)
+        stored = {row.day: row for row in self.filter(day__gte=first_day, day__lte=today)}
+        series = [
+            stored.get(first_day + timedelta(days=offset)) or self.model(day=first_day + timedelta(days=offset))
+            for offset in range(days)
+        ]
+        
+        histogram = Counter()
+        for row in series:
+            histogram.update({int(count): total for count, total in row.bid_count_histogram.items()})
+        accepted = sum(row.bids_accepted for row in series)
+        decided = accepted + sum(row.bids_rejected for row in series)
+        week_bids = sum(row.bids_created for row in series[-7:])
+        
+        peak = max([row.bids_created for row in series] + [1])
+        points = [
+            {
+                'day': row.day,
+                'bids_created': row.bids_created,
+                'shipments_created': row.shipments_created,
+                'height': round(row.bids_created * 100 / peak),
+            }
+            for row in series
+        ]
+        
+        latest = max(stored.values(), key=lambda row: row.day, default=None)
+        return {
+            'active_shipments': latest.active_shipments if latest else 0,
+            'bids_per_hour': round(week_bids / (7 * 24), 1),
+            'acceptance_rate': round(accepted * 100 / decided) if decided else None,
+            'median_bids_per_shipment': histogram_median(histogram),
+            'stats_series': points,
+            'stats_updated_at': latest.updated_at if latest else None,
+        }
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.28 on 2026-10-19 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(unique=True, verbose_name='დღე')),
+                ('shipments_created', models.PositiveIntegerField(default=0, verbose_name='შექმნილი განაცხადები')),
+                ('shipments_completed', models.PositiveIntegerField(default=0, verbose_name='დასრულებული განაცხადები')),
+                ('shipments_cancelled', models.PositiveIntegerField(default=0, verbose_name='გაუქმებული განაცხადები')),
+                ('active_shipments', models.PositiveIntegerField(default=0, help_text='აქტიური განაცხადების რაოდენობა ბოლო განახლებისას', verbose_name='აქტიური განაცხადები')),
+                ('bids_created', models.PositiveIntegerField(default=0, verbose_name='შემოსული ბიდები')),
+                ('bids_accepted', models.PositiveIntegerField(default=0, verbose_name='მიღებული ბიდები')),
+                ('bids_rejected', models.PositiveIntegerField(default=0, verbose_name='უარყოფილი ბიდები')),
+                ('bid_count_histogram', models.JSONField(default=dict, help_text='დღის განმავლობაში შექმნილი განაცხადების რაოდენობა ბიდების რაოდენობის მიხედვით', verbose_name='ბიდების განაწილება')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='განახლების თარიღი')),
+            ],
+            options={
+                'verbose_name': 'დღიური სტატისტიკა',
+                'verbose_name_plural': 'დღიური სტატისტიკა',
+                'db_table': 'daily_stats',
+                'ordering': ['-day'],
+            },
+        ),
+    ]
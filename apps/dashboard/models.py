@@ -0,0 +1,64 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from .managers import DailyStatsManager
+
+
+class DailyStats(models.Model):
+    """
+    Shipment and bid activity of one day, kept up to date by
+    refresh_dashboard_stats. The admin dashboard reads these rows instead of
+    aggregating the shipments and bids tables on every page view.
+    """
+    day = models.DateField(
+        _('დღე'),
+        unique=True
+    )
+    shipments_created = models.PositiveIntegerField(
+        _('შექმნილი განაცხადები'),
+        default=0
+    )
+    shipments_completed = models.PositiveIntegerField(
+        _('დასრულებული განაცხადები'),
+        default=0
+    )
+    shipments_cancelled = models.PositiveIntegerField(
+        _('გაუქმებული განაცხადები'),
+        default=0
+    )
+    active_shipments = models.PositiveIntegerField(
+        _('აქტიური განაცხადები'),
+        default=0,
+        help_text=_('აქტიური განაცხადების რაოდენობა ბოლო განახლებისას')
+    )
+    bids_created = models.PositiveIntegerField(
+        _('შემოსული ბიდები'),
+        default=0
+    )
+    bids_accepted = models.PositiveIntegerField(
+        _('მიღებული ბიდები'),
+        default=0
+    )
+    bids_rejected = models.PositiveIntegerField(
+        _('უარყოფილი ბიდები'),
+        default=0
+    )
+    bid_count_histogram = models.JSONField(
+        _('ბიდების განაწილება'),
+        default=dict,
+        help_text=_('დღის განმავლობაში შექმნილი განაცხადების რაოდენობა ბიდების რაოდენობის მიხედვით')
+    )
+    updated_at = models.DateTimeField(
+        _('განახლების თარიღი'),
+        auto_now=True
+    )
+    
+    objects = DailyStatsManager()
+
+    class Meta:
+        verbose_name = _('დღიური სტატისტიკა')
+        verbose_name_plural = _('დღიური სტატისტიკა')
+        db_table = 'daily_stats'
+        ordering = ['-day']
+    
+    def __str__(self):
+        return str(self.day)
@@ -1,6 +1,8 @@
+from collections import Counter
 from django.contrib import admin
 from unfold.admin import ModelAdmin
 from unfold.decorators import display
+from apps.shipments.models import Shipment
 from .models import CargoType, TransportType, VolumeUnit, Currency
 
 
@@ -29,26 +31,28 @@ class BaseMetadataAdmin(ModelAdmin):
     def is_active_badge(self, obj):
         return obj.is_active
     
+    def get_usage_counts(self, request):
+        """
+        Return active shipment counts per metadata id. They are computed once
+        per request, with one grouped query per shipment field pointing at this
+        model, because Django asks for the delete permission of every object
+        it renders or deletes.
+        """
+        usage = request.__dict__.setdefault('_metadata_usage_counts', {})
+        label = self.model._meta.label
+        if label not in usage:
+            counts = Counter()
+            for relation in self.model._meta.related_objects:
+                if relation.related_model is Shipment:
+                    counts.update(Shipment.objects.active().usage_counts(relation.field.name))
+            usage[label] = counts
+        return usage[label]
+    
     def has_delete_permission(self, request, obj=None):
         """Prevent deletion if used in active shipments."""
         if obj is None:
             return True
-        
-        # Check if this metadata is used in any shipments
-        if hasattr(obj, 'shipments_cargo'):
-            if obj.shipments_cargo.filter(status='active').exists():
-                return False
-        if hasattr(obj, 'shipments_transport'):
-            if obj.shipments_transport.filter(status='active').exists():
-                return False
-        if hasattr(obj, 'shipments_volume'):
-            if obj.shipments_volume.filter(status='active').exists():
-                return False
-        if hasattr(obj, 'shipments_currency'):
-            if obj.shipments_currency.filter(status='active').exists():
-                return False
-        
-        return True
+        return not self.get_usage_counts(request)[obj.pk]
 
 
 @admin.register(CargoType)
@@ -6,129 +6,22 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from django.contrib import messages
 from django.urls import reverse, path
-from django.shortcuts import redirect, get_object_or_404
+from django.shortcuts import redirect, get_object_or_404, render
+from django.core.exceptions import PermissionDenied
 from django.contrib.auth import get_user_model
-from unfold.admin import ModelAdmin, TabularInline
+from unfold.admin import ModelAdmin
 from unfold.decorators import display, action
+from apps.accounts.filters import UserAutocompleteFilter
+from apps.common.admin_mixins import ChangelistQuerysetMixin, EstimatedCountMixin
 from .models import Shipment
 from apps.bids.models import Bid
 
 User = get_user_model()
 
 
-class ShipmentUserFilter(admin.SimpleListFilter):
+class ShipmentUserFilter(UserAutocompleteFilter):
     """Filter shipments by the user who made the listing. Admin only."""
-    title = _('განმცხადებელი')
-    parameter_name = 'applicant'
-
-    def lookups(self, request, model_admin):
-        user_ids = Shipment.objects.values_list('user', flat=True).distinct()
-        users = User.objects.filter(id__in=user_ids, is_deleted=False).order_by('first_name', 'last_name')
-        return [(u.id, str(u)) for u in users]
-
-    def queryset(self, request, queryset):
-        if self.value():
-            return queryset.filter(user_id=self.value())
-        return queryset
-
-
-class BidInline(TabularInline):
-    """Inline display of bids for a shipment."""
-    
-    model = Bid
-    extra = 0
-    can_delete = False
-    
-    fields = ['display_id', 'platform_link', 'company_name', 'price_display', 'estimated_delivery_time', 
-              'contact_info', 'status_badge', 'created_at', 'actions_buttons']
-    readonly_fields = ['display_id', 'platform_link', 'company_name', 'price_display', 'estimated_delivery_time', 
-                       'contact_info', 'status_badge', 'created_at', 'actions_buttons']
-    
-    verbose_name = _('შეთავაზება')
-    verbose_name_plural = _('შეთავაზებები')
-    
-    def has_add_permission(self, request, obj=None):
-        """Bids can only be created via API."""
-        return False
-    
-    def has_view_permission(self, request, obj=None):
-        """Users can view bids for their shipments."""
-        return True
-    
-    def has_change_permission(self, request, obj=None):
-        """Bids cannot be edited directly in admin."""
-        return False
-    
-    def has_delete_permission(self, request, obj=None):
-        """Bids cannot be deleted directly in admin."""
-        return False
-    
-    def get_queryset(self, request):
-        """Filter bids to exclude soft-deleted ones."""
-        qs = super().get_queryset(request)
-        return qs.filter(is_deleted=False)
-
-    def get_formset(self, request, obj=None, **kwargs):
-        """Store request so actions_buttons can hide Accept/Reject for admins."""
-        self._request = request
-        return super().get_formset(request, obj, **kwargs)
-
-    @display(description=_('პლათფორმა'))
-    def platform_link(self, obj):
-        """Display platform name (as text for clients, as link for admins)."""
-        if obj.platform:
-            # Just return the company name as text - no link to avoid permission issues
-            return obj.platform.company_name
-        return '-'
-    
-    @display(description=_('ფასი'))
-    def price_display(self, obj):
-        return f"{obj.price} {obj.currency.symbol}"
-    
-    @display(description=_('საკონტაქტო'))
-    def contact_info(self, obj):
-        return format_html('{}<br>{}', obj.contact_person, obj.contact_phone)
-    
-    @display(description=_('სტატუსი'))
-    def status_badge(self, obj):
-        labels = {
-            'pending': _('მოლოდინში'),
-            'accepted': _('მიღებული'),
-            'rejected': _('უარყოფილი'),
-        }
-        
-        text_colors = {
-            'pending': 'text-amber-600 dark:text-amber-400',
-            'accepted': 'text-green-600 dark:text-green-400',
-            'rejected': 'text-red-600 dark:text-red-400',
-        }
-        
-        label = labels.get(obj.status, obj.status)
-        text_color = text_colors.get(obj.status, 'text-gray-600 dark:text-gray-400')
-        
-        return format_html(
-            '<div class="flex justify-center">'
-            '<span class="inline-flex items-center justify-center px-3 py-1.5 rounded-md text-xs font-medium bg-gray-100 dark:bg-gray-800 {}" style="min-width: 100px; display: inline-flex; align-items: center;">{}</span>'
-            '</div>',
-            text_color,
-            label
-        )
-    
-    @display(description=_('მოქმედებები'))
-    def actions_buttons(self, obj):
-        request = getattr(self, '_request', None)
-        # Admins and superusers cannot accept or reject bids - show status only
-        if request and (request.user.is_superuser or getattr(request.user, 'role', '') == 'admin'):
-            return obj.get_status_display()
-        if obj.status == 'pending' and obj.shipment.status == 'active':
-            accept_url = reverse('admin:shipment_accept_bid', args=[obj.shipment.pk, obj.pk])
-            reject_url = reverse('admin:shipment_reject_bid', args=[obj.shipment.pk, obj.pk])
-            return format_html(
-                '<a href="{}">მიღება</a> | <a href="{}">უარყოფა</a>',
-                accept_url, reject_url
-            )
-        return obj.get_status_display()
-
+    user_field = 'user'
 
 
 class ShipmentAdminForm(forms.ModelForm):
@@ -152,7 +45,7 @@ class ShipmentAdminForm(forms.ModelForm):
 
 
 @admin.register(Shipment)
-class ShipmentAdmin(ModelAdmin):
+class ShipmentAdmin(EstimatedCountMixin, ChangelistQuerysetMixin, ModelAdmin):
     """Admin interface for Shipment model."""
     
     form = ShipmentAdminForm
@@ -191,7 +84,17 @@ class ShipmentAdmin(ModelAdmin):
     )
     
     readonly_fields = ['id', 'created_at', 'updated_at', 'completed_at', 'cancelled_at', 'selected_bid', 'status']
-    inlines = [BidInline]
+    
+    # The bids of a shipment are shown in a panel loaded from bids_panel_view
+    change_form_template = 'admin/shipments/shipment/change_form.html'
+    bids_panel_page_size = 25
+    bids_panel_orderings = {
+        '-created': ('-created_at', '-id'),
+        'price': ('price', 'id'),
+        '-price': ('-price', '-id'),
+        'eta': ('estimated_delivery_time', 'id'),
+        '-eta': ('-estimated_delivery_time', '-id'),
+    }
     
     def get_form(self, request, obj=None, **kwargs):
         """
@@ -235,12 +138,6 @@ class ShipmentAdmin(ModelAdmin):
         # Change view - show all fieldsets including დამატებითი ინფორმაცია
         return self.fieldsets
     
-    def get_inlines(self, request, obj=None):
-        """Only show შეთავაზებები (BidInline) for existing shipments."""
-        if obj is None:
-            return []  # No inlines for add view
-        return [BidInline]
-    
     actions = ['cancel_shipments', 'reject_all_bids_action']
 
     def get_actions(self, request):
@@ -287,10 +184,11 @@ class ShipmentAdmin(ModelAdmin):
         }
         return status_map.get(obj.status, obj.status)
     
-    @display(description=_('ბიდები'))
+    @display(description=_('ბიდები'), ordering='bid_total')
     def bids_count_display(self, obj):
-        total = obj.bids_count
-        pending = obj.pending_bids_count
+        # Annotated by get_queryset, so listing a page costs no query per row
+        total = obj.bid_total
+        pending = obj.pending_bid_total
         if pending > 0:
             return f"{total} ({pending} მოლოდინში)"
         return str(total)
@@ -330,6 +228,9 @@ class ShipmentAdmin(ModelAdmin):
             path('<uuid:shipment_pk>/reject-bid/<uuid:bid_pk>/', 
                  self.admin_site.admin_view(self.reject_bid_view), 
                  name='shipment_reject_bid'),
+            path('<uuid:shipment_pk>/bids/',
+                 self.admin_site.admin_view(self.bids_panel_view),
+                 name='shipment_bids_panel'),
         ]
         return custom_urls + urls
     
@@ -366,6 +267,45 @@ class ShipmentAdmin(ModelAdmin):
         
         return super().change_view(request, object_id, form_url, extra_context)
     
+    def bids_panel_view(self, request, shipment_pk):
+        """
+        Return one page of a shipment's bids as an HTML fragment for the change page.
+        The page is read with a single query on the bids shipment index; one row
+        more than the page size is fetched to tell whether a next page exists,
+        so no COUNT is needed.
+        """
+        shipment = get_object_or_404(self.get_queryset(request), pk=shipment_pk)
+        if not self.has_view_permission(request, shipment):
+            raise PermissionDenied
+        
+        sort = request.GET.get('sort')
+        if sort not in self.bids_panel_orderings:
+            sort = '-created'
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        
+        size = self.bids_panel_page_size
+        offset = (page - 1) * size
+        bids = list(
+            Bid.objects.filter(shipment=shipment, is_deleted=False)
+            .select_related('platform', 'currency')
+            .order_by(*self.bids_panel_orderings[sort])[offset:offset + size + 1]
+        )
+        
+        is_admin = request.user.is_superuser or getattr(request.user, 'role', '') == 'admin'
+        return render(request, 'admin/shipments/shipment/bids_panel.html', {
+            'shipment': shipment,
+            'bids': bids[:size],
+            'sort': sort,
+            'page': page,
+            'has_previous': page > 1,
+            'has_next': len(bids) > size,
+            # Only the owner of an active shipment accepts or rejects; admins only see statuses
+            'can_decide': not is_admin and shipment.status == 'active' and shipment.user_id == request.user.pk,
+        })
+    
     def accept_bid_view(self, request, shipment_pk, bid_pk):
         """Accept a specific bid. Only the shipment owner (client) can accept; admins cannot."""
         shipment = get_object_or_404(Shipment, pk=shipment_pk)
@@ -436,12 +376,9 @@ class ShipmentAdmin(ModelAdmin):
     @action(description=_('ყველა ბიდის უარყოფა'))
     def reject_all_bids_action(self, request, queryset):
         """Reject all pending bids for selected shipments."""
-        count = 0
-        for shipment in queryset.filter(status='active'):
-            pending_count = shipment.pending_bids_count
-            if pending_count > 0:
-                shipment.reject_all_pending_bids()
-                count += pending_count
+        count, cached = Bid.objects.filter(
+            shipment__in=queryset.filter(status='active')
+        ).reject_pending()
         
         self.message_user(request, _(f'{count} ბიდი უარყოფილია'), messages.SUCCESS)
     
@@ -458,13 +395,14 @@ class ShipmentAdmin(ModelAdmin):
             'cargo_type',
             'volume_unit',
             'transport_type',
-            'preferred_currency',
-            'selected_bid'
-        ).prefetch_related(
-            'bids',
-            'bids__platform',
-            'bids__currency'
+            'preferred_currency'
         )
+        if self.is_changelist_request(request):
+            # The changelist only shows bid counts, never the bids themselves
+            qs = qs.with_bid_counts()
+        else:
+            # The bids of the change page are loaded separately by bids_panel_view
+            qs = qs.select_related('selected_bid__currency')
         
         # Exclude shipments from soft-deleted users
         qs = qs.filter(user__is_deleted=False)
@@ -539,15 +477,21 @@ class ShipmentAdmin(ModelAdmin):
         readonly = list(self.readonly_fields)
         return readonly
     
+    def get_autocomplete_fields(self, request):
+        """Admins pick the shipment owner with a search box instead of a list of all users."""
+        if not request.user.is_superuser and getattr(request.user, 'role', '') == 'client':
+            return []
+        return ['user']
+    
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """Filter user field based on permissions and exclude deleted users."""
         if db_field.name == 'user':
             if not request.user.is_superuser and request.user.role == 'client':
                 # Regular users can only select themselves
-                kwargs['queryset'] = User.objects.filter(pk=request.user.pk, is_deleted=False)
+                kwargs['queryset'] = User.objects.filter(pk=request.user.pk, is_deleted=False).only('id', 'first_name', 'last_name')
                 kwargs['initial'] = request.user.pk
             else:
-                # Admins see all non-deleted users
+                # Admins search non-deleted users; only the selected one is rendered
                 kwargs['queryset'] = User.objects.filter(is_deleted=False)
         
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -0,0 +1,83 @@
+import logging
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.shipments.models import Shipment
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        'Cancels active shipments whose pickup date has passed and rejects their '
+        'pending bids, in chunks. Safe to re-run; meant to be scheduled (e.g. cron) '
+        'or kept running with --follow.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Shipments cancelled per transaction'
+        )
+        parser.add_argument(
+            '--grace-hours',
+            type=float,
+            default=0,
+            help='Only expire shipments whose pickup date passed at least this long ago'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many shipments would be cancelled'
+        )
+        parser.add_argument(
+            '--follow',
+            action='store_true',
+            help='Keep running, repeating every --interval seconds'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=300,
+            help='Seconds between runs with --follow'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.expire(options)
+            if not options['follow']:
+                break
+            time.sleep(options['interval'])
+
+    def expire(self, options):
+        cutoff = timezone.now() - timedelta(hours=options['grace_hours'])
+
+        if options['dry_run']:
+            count = Shipment.objects.expired(cutoff).count()
+            self.stdout.write(f'{count} shipments would be cancelled')
+            return
+
+        started = time.monotonic()
+        chunks = cancelled_total = rejected_total = 0
+        while True:
+            cancelled, rejected = Shipment.objects.cancel_expired(cutoff, limit=options['chunk_size'])
+            if not cancelled and not Shipment.objects.expired(cutoff).exists():
+                break
+            chunks += 1
+            cancelled_total += cancelled
+            rejected_total += rejected
+            self.stdout.write(f'Chunk {chunks}: {cancelled} shipments cancelled, {rejected} bids rejected')
+
+        duration_ms = round((time.monotonic() - started) * 1000)
+        logger.info(
+            'expire_shipments cancelled=%d bids_rejected=%d chunks=%d duration_ms=%d',
+            cancelled_total, rejected_total, chunks, duration_ms
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'{cancelled_total} shipments cancelled, {rejected_total} bids rejected '
+            f'in {chunks} chunks ({duration_ms}ms)'
+        ))
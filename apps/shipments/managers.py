@@ -1,8 +1,40 @@
-from django.db import models
+from collections import Counter
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from apps.common.locks import lock_shipments
 
 
-class ShipmentManager(models.Manager):
+class ShipmentQuerySet(models.QuerySet):
+    """QuerySet for Shipment model."""
+    
+    def with_bid_counts(self):
+        """
+        Annotate every shipment with bid_total and pending_bid_total.
+        The counts are correlated subqueries on the bids shipment index, so
+        only the rows actually fetched (one changelist page) are counted,
+        instead of grouping the whole bids table.
+        """
+        from apps.bids.models import Bid
+        
+        bids = Bid.objects.filter(shipment=OuterRef('pk')).order_by().values('shipment')
+        return self.annotate(
+            bid_total=Coalesce(
+                Subquery(bids.annotate(count=Count('pk')).values('count')), 0
+            ),
+            pending_bid_total=Coalesce(
+                Subquery(bids.annotate(count=Count('pk', filter=Q(status='pending'))).values('count')), 0
+            )
+        )
+    
+    def usage_counts(self, field):
+        """Return a Counter of shipments per value of a foreign key, from one grouped query."""
+        rows = self.order_by().values(field).annotate(total=Count('pk'))
+        return Counter({row[field]: row['total'] for row in rows})
+
+
+class ShipmentManager(models.Manager.from_queryset(ShipmentQuerySet)):
     """Custom manager for Shipment model."""
     
     def active(self):
@@ -23,3 +55,43 @@ class ShipmentManager(models.Manager):
             status='active',
             pickup_date__gt=timezone.now()
         )
+    
+    def expired(self, cutoff=None):
+        """Return active shipments whose pickup date is at or before cutoff (default now)."""
+        return self.filter(
+            status='active',
+            pickup_date__lte=cutoff or timezone.now()
+        )
+    
+    def cancel_expired(self, cutoff=None, limit=500):
+        """
+        Cancel up to limit expired shipments, oldest pickup first, and reject
+        their pending bids with the set-based rejection path.
+        The chunk runs in one transaction under the exclusive shipment locks,
+        so it cannot race with bid submissions or acceptance. Finished chunks
+        stay committed, so an interrupted run resumes where it stopped.
+        Returns (cancelled: int, rejected: int)
+        """
+        from apps.bids.models import Bid
+        
+        cutoff = cutoff or timezone.now()
+        with transaction.atomic():
+            shipment_ids = list(
+                self.expired(cutoff).order_by('pickup_date').values_list('pk', flat=True)[:limit]
+            )
+            if not shipment_ids:
+                return 0, 0
+            
+            # Re-check under the locks; a shipment may have been closed meanwhile
+            lock_shipments(shipment_ids)
+            shipment_ids = list(self.expired(cutoff).filter(pk__in=shipment_ids).values_list('pk', flat=True))
+            
+            now = timezone.now()
+            cancelled = self.filter(pk__in=shipment_ids).update(
+                status='cancelled',
+                cancelled_at=now,
+                updated_at=now
+            )
+            rejected, cached = Bid.objects.filter(shipment_id__in=shipment_ids).reject_pending(cache=False)
+        
+        return cancelled, rejected
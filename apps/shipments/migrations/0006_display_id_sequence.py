@@ -0,0 +1,45 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:13
+
+import apps.common.fields
+from django.db import migrations
+
+
+# Number any rows still missing a display_id in one statement (instead of
+# saving row by row), then start the sequence after the current maximum.
+CREATE_SEQUENCE_SQL = """
+UPDATE shipments SET display_id = numbered.max_id + numbered.row_number
+FROM (
+    SELECT id,
+           row_number() OVER (ORDER BY created_at, id) AS row_number,
+           (SELECT COALESCE(MAX(display_id), 0) FROM shipments) AS max_id
+    FROM shipments
+    WHERE display_id IS NULL
+) AS numbered
+WHERE shipments.id = numbered.id;
+
+CREATE SEQUENCE IF NOT EXISTS shipments_display_id_seq OWNED BY shipments.display_id;
+
+SELECT setval(
+    'shipments_display_id_seq',
+    (SELECT COALESCE(MAX(display_id), 0) + 1 FROM shipments),
+    false
+);
+"""
+
+DROP_SEQUENCE_SQL = "DROP SEQUENCE IF EXISTS shipments_display_id_seq;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shipments', '0005_shipment_deleted_at_shipment_deleted_by_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SEQUENCE_SQL, DROP_SEQUENCE_SQL),
+        migrations.AlterField(
+            model_name='shipment',
+            name='display_id',
+            field=apps.common.fields.SequenceField(editable=False, null=True, unique=True, verbose_name='Display ID'),
+        ),
+    ]
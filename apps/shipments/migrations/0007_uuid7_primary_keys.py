@@ -0,0 +1,19 @@
+# Generated by Django 4.2.28 on 2026-10-19 06:40
+
+import apps.common.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shipments', '0006_display_id_sequence'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='shipment',
+            name='id',
+            field=models.UUIDField(default=apps.common.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.28 on 2026-10-19 07:09
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shipments', '0007_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='shipment',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='shipments_created_at_brin'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bids', '0023_platformdeletionjob_updated_at'),
+        ('shipments', '0008_shipment_shipments_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='shipment',
+            name='selected_bid',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='selected_for_shipment', to='bids.bid', verbose_name='არჩეული ბიდი'),
+        ),
+    ]
@@ -1,10 +1,12 @@
-import uuid
 from django.db import models, transaction
-from django.db.models import Max
+from django.contrib.postgres.indexes import BrinIndex
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 from django.conf import settings
+from apps.common.fields import SequenceField
+from apps.common.ids import uuid7
+from apps.common.locks import lock_shipments
 from .validators import validate_future_date, validate_positive_decimal
 from .managers import ShipmentManager
 
@@ -22,10 +24,10 @@ class Shipment(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
-    display_id = models.PositiveIntegerField(
+    display_id = SequenceField(
         _('Display ID'),
         editable=False,
         null=True,
@@ -93,11 +95,13 @@ class Shipment(models.Model):
         choices=STATUS_CHOICES,
         default='active'
     )
+    # bids is partitioned, so the reference is checked against bid_keys
     selected_bid = models.ForeignKey(
         'bids.Bid',
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
+        db_constraint=False,
         related_name='selected_for_shipment',
         verbose_name=_('არჩეული ბიდი')
     )
@@ -146,6 +150,10 @@ class Shipment(models.Model):
         verbose_name_plural = _('განაცხადები')
         db_table = 'shipments'
         ordering = ['-created_at']
+        indexes = [
+            # Small, append-friendly index for created_at range scans (dashboard rollups)
+            BrinIndex(fields=['created_at'], name='shipments_created_at_brin'),
+        ]
     
     def __str__(self):
         return f"{self.pickup_location} → {self.delivery_location}"
@@ -171,11 +179,15 @@ class Shipment(models.Model):
         validate_future_date(self.pickup_date)
         validate_positive_decimal(self.cargo_volume)
 
-    def save(self, *args, **kwargs):
-        if self.display_id is None:
-            max_id = Shipment.objects.aggregate(Max('display_id'))['display_id__max']
-            self.display_id = (max_id or 0) + 1
-        super().save(*args, **kwargs)
+    def lock_for_status_change(self):
+        """
+        Take the exclusive shipment lock and return the current status.
+        Waits for in-flight bid submissions, which hold the shared lock, to
+        commit; submissions arriving later wait for this transaction and then
+        see the new status. Must be called inside a transaction.
+        """
+        lock_shipments([self.pk])
+        return type(self)._base_manager.filter(pk=self.pk).values_list('status', flat=True).get()
     
     @transaction.atomic
     def mark_completed(self, bid):
@@ -185,7 +197,8 @@ class Shipment(models.Model):
         2. Set selected_bid
         3. Accept the selected bid
         4. Reject all other pending bids
-        5. Create RejectedBidCache entries
+        The statuses are checked under the exclusive shipment lock, so no
+        pending bid can be inserted after the others were rejected.
         """
         from apps.bids.models import Bid
         
@@ -193,8 +206,12 @@ class Shipment(models.Model):
         if bid.shipment_id != self.id:
             raise ValueError(_('ბიდი არ ეკუთვნის ამ განაცხადს'))
         
+        # Validate shipment is still active
+        if self.lock_for_status_change() != 'active':
+            raise ValueError(_('ბიდის მიღება მხოლოდ აქტიურ განაცხადზეა შესაძლებელი'))
+        
         # Validate bid is pending
-        if bid.status != 'pending':
+        if Bid.objects.filter(pk=bid.pk).values_list('status', flat=True).get() != 'pending':
             raise ValueError(_('მხოლოდ მოლოდინში მყოფი ბიდის მიღებაა შესაძლებელი'))
         
         # Mark shipment as completed
@@ -206,10 +223,8 @@ class Shipment(models.Model):
         # Accept the selected bid
         bid.accept()
         
-        # Reject all other pending bids
-        pending_bids = self.bids.filter(status='pending').exclude(id=bid.id)
-        for pending_bid in pending_bids:
-            pending_bid.reject()
+        # Reject all other pending bids (no cache entries: the shipment is closed)
+        self.bids.exclude(id=bid.id).reject_pending(cache=False)
     
     @transaction.atomic
     def mark_cancelled(self):
@@ -217,9 +232,9 @@ class Shipment(models.Model):
         Mark shipment as cancelled.
         1. Set status to 'cancelled'
         2. Reject all pending bids
-        3. Create RejectedBidCache entries
+        The status is checked under the exclusive shipment lock (see mark_completed).
         """
-        if self.status != 'active':
+        if self.lock_for_status_change() != 'active':
             raise ValueError(_('მხოლოდ აქტიური განაცხადის გაუქმებაა შესაძლებელი'))
         
         # Mark shipment as cancelled
@@ -227,17 +242,15 @@ class Shipment(models.Model):
         self.cancelled_at = timezone.now()
         self.save(update_fields=['status', 'cancelled_at', 'updated_at'])
         
-        # Reject all pending bids
-        pending_bids = self.bids.filter(status='pending')
-        for pending_bid in pending_bids:
-            pending_bid.reject()
+        # Reject all pending bids (no cache entries: the shipment is closed)
+        self.bids.reject_pending(cache=False)
     
     @transaction.atomic
     def reject_all_pending_bids(self):
         """
         Reject all pending bids without changing shipment status.
         Useful when user wants to clear current bids but keep shipment active.
+        Returns the number of rejected bids.
         """
-        pending_bids = self.bids.filter(status='pending')
-        for pending_bid in pending_bids:
-            pending_bid.reject()
+        rejected, cached = self.bids.reject_pending()
+        return rejected
@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third party apps
     'django_flatpickr',
@@ -53,6 +54,8 @@ INSTALLED_APPS = [
     'apps.shipments',
     'apps.bids',
     'apps.api',
+    'apps.archive',
+    'apps.dashboard',
 ]
 
 MIDDLEWARE = [
@@ -189,6 +192,29 @@ REST_FRAMEWORK = {
     'DATETIME_FORMAT': '%Y-%m-%dT%H:%M:%SZ',
 }
 
+# How long a stored Idempotency-Key response is replayed (seconds)
+API_IDEMPOTENCY_KEY_TTL = env.int('API_IDEMPOTENCY_KEY_TTL', default=86400)
+
+# Bid ingestion: 'sync' creates bids in the request, 'async' queues them for
+# the process_bid_queue command and answers 202 with a tracking ID
+BID_INGESTION_MODE = env('BID_INGESTION_MODE', default='sync')
+
+# Platform soft deletes rejecting more pending bids than this run as a
+# background job (run_platform_deletion_jobs) instead of in the admin request
+PLATFORM_SOFT_DELETE_SYNC_LIMIT = env.int('PLATFORM_SOFT_DELETE_SYNC_LIMIT', default=2000)
+
+# maintain_bid_partitions keeps monthly bids partitions ready for the current
+# month and this many after it
+BID_PARTITIONS_AHEAD = env.int('BID_PARTITIONS_AHEAD', default=3)
+
+# Completed and cancelled shipments closed longer than this many days are
+# moved with their bids to the archive tables (archive_closed_shipments)
+ARCHIVE_AFTER_DAYS = env.int('ARCHIVE_AFTER_DAYS', default=90)
+
+# refresh_dashboard_stats recomputes the dashboard rollups of this many recent
+# days; it should cover the time in which bids on a shipment are still decided
+DASHBOARD_REFRESH_DAYS = env.int('DASHBOARD_REFRESH_DAYS', default=7)
+
 # Django Unfold settings
 UNFOLD = {
     "SITE_TITLE": "ტვირთების პლატფორმა",
@@ -277,6 +303,11 @@ UNFOLD = {
                         "icon": "gavel",
                         "link": "/admin/bids/bid/",
                     },
+                    {
+                        "title": "არქივი",
+                        "icon": "inventory_2",
+                        "link": "/admin/archive/archivedshipment/",
+                    },
                 ],
             },
             # Configuration section - visible only to admins
@@ -0,0 +1,129 @@
+from apps.bids.models import Bid, Platform, PlatformAPIKey, RejectedBidCache
+from tests.test_shipment_admin import ShipmentAdminTestCase
+
+
+class BidChangelistTestCase(ShipmentAdminTestCase):
+    """Test the bid and rejected bid cache changelists."""
+
+    changelist_url = '/admin/bids/bid/'
+    cache_changelist_url = '/admin/bids/rejectedbidcache/'
+
+    def create_rows(self, shipments):
+        """Create shipments with a pending and a rejected bid each, caching the rejected one."""
+        for _ in range(shipments):
+            shipment = self.create_shipment()
+            self.create_bids(shipment, 1)
+            for bid in self.create_bids(shipment, 1, status='rejected'):
+                RejectedBidCache.for_bid(bid).save()
+
+    def assert_constant_queries(self, url, expected):
+        """Assert the page costs expected queries however many rows it lists."""
+        self.create_rows(2)
+        self.count_queries(url)
+        response, queries = self.count_queries(url)
+        self.assertEqual(queries, expected)
+
+        self.create_rows(20)
+        response, queries = self.count_queries(url)
+        self.assertEqual(queries, expected)
+        return response
+
+    def test_bid_changelist_query_count(self):
+        """Test listing bids costs a fixed number of queries."""
+        response = self.assert_constant_queries(self.changelist_url, 7)
+
+        self.assertContains(response, 'Tbilisi → Batumi')
+        self.assertContains(response, '100.00 ₾')
+
+    def test_rejected_bid_cache_changelist_query_count(self):
+        """Test listing rejected bid cache entries costs a fixed number of queries."""
+        response = self.assert_constant_queries(self.cache_changelist_url, 7)
+
+        self.assertContains(response, 'Test Platform')
+
+    def test_change_view_is_not_restricted(self):
+        """Test the bid change page still shows columns the list does not load."""
+        bid = self.create_bids(self.create_shipment(), 1)[0]
+
+        response = self.client.get(f'/admin/bids/bid/{bid.pk}/change/')
+
+        self.assertContains(response, bid.contact_person)
+
+
+class PlatformChangelistTestCase(ShipmentAdminTestCase):
+    """Test the platform changelist."""
+
+    changelist_url = '/admin/bids/platform/'
+
+    def create_platform(self, index):
+        """Create a platform with two API keys, one of them inactive."""
+        platform = Platform.objects.create(
+            company_name=f'Platform {index}',
+            contact_email=f'platform-{index}@test.com',
+            contact_phone='+995555999888'
+        )
+        for is_active in (True, False):
+            key = PlatformAPIKey(platform=platform, is_active=is_active)
+            key.set_key(PlatformAPIKey.generate_key())
+            key.save()
+        return platform
+
+    def test_stats_columns(self):
+        """Test key counts, bid counts and win rate come out right."""
+        shipment = self.create_shipment()
+        self.create_bids(shipment, 2)
+        self.create_bids(shipment, 1, status='accepted')
+        self.create_bids(shipment, 3, status='rejected')
+        self.create_platform(1)
+
+        response = self.client.get(self.changelist_url)
+
+        self.assertContains(response, '2 (1 აქტიური)')
+        self.assertContains(response, f'?platform__id__exact={self.platform.pk}">6</a>')
+        self.assertContains(response, '2 / 1')
+        self.assertContains(response, '25%')
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """Test listing more platforms does not cost more queries."""
+        self.create_platform(1)
+        self.count_queries(self.changelist_url)
+        response, baseline = self.count_queries(self.changelist_url)
+
+        for index in range(2, 12):
+            self.create_platform(index)
+        response, queries = self.count_queries(self.changelist_url)
+
+        self.assertEqual(queries, baseline)
+
+    def test_actions_run_on_annotated_queryset(self):
+        """Test a changelist action still updates the selected platforms."""
+        platform = self.create_platform(1)
+
+        self.client.post(self.changelist_url, {
+            'action': 'deactivate_platforms',
+            '_selected_action': [str(platform.pk)],
+        })
+
+        platform.refresh_from_db()
+        self.assertFalse(platform.is_active)
+
+
+class BidSoftDeleteTestCase(ShipmentAdminTestCase):
+    """Test the bid soft delete action."""
+
+    changelist_url = '/admin/bids/bid/'
+
+    def test_soft_delete_does_not_cache_parameters(self):
+        """Test deleted bids are rejected without blocking their parameters from resubmission."""
+        bids = self.create_bids(self.create_shipment(), 2)
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_login(self.user)
+
+        self.client.post(self.changelist_url, {
+            'action': 'soft_delete_bids',
+            '_selected_action': [str(bid.pk) for bid in bids],
+        })
+
+        self.assertEqual(Bid._base_manager.filter(pk__in=[bid.pk for bid in bids], is_deleted=True, status='rejected').count(), 2)
+        self.assertFalse(RejectedBidCache.objects.exists())
@@ -0,0 +1,521 @@
+from unittest import mock
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import timedelta
+from decimal import Decimal
+from rest_framework.test import APIClient
+from rest_framework import status
+from apps.accounts.models import User
+from apps.metadata.models import Currency, CargoType, TransportType, VolumeUnit
+from apps.bids import managers
+from apps.bids.models import Platform, PlatformAPIKey, Bid, BidSubmission
+from apps.shipments.models import Shipment
+from apps.api.models import IdempotencyKey
+from apps.api.v1.views import PlatformBidStatusAPIView
+from apps.archive.models import ArchivedShipment
+
+
+class BidAPITestCase(TestCase):
+    """Base test case for bid API tests."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            email='user@test.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User',
+            personal_id='12345678901',
+            mobile='+995555123456'
+        )
+
+        self.currency = Currency.objects.create(code='GEL', name='Lari', symbol='₾')
+        self.cargo_type = CargoType.objects.create(name='Food')
+        self.transport_type = TransportType.objects.create(name='Truck')
+        self.volume_unit = VolumeUnit.objects.create(name='Kilogram', abbreviation='kg')
+
+        self.platform = Platform.objects.create(
+            company_name='Test Platform',
+            contact_email='platform@test.com',
+            contact_phone='+995555999888'
+        )
+
+        self.raw_api_key = PlatformAPIKey.generate_key()
+        self.api_key = PlatformAPIKey(platform=self.platform)
+        self.api_key.set_key(self.raw_api_key)
+        self.api_key.save()
+
+        self.shipment = self.create_shipment()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.raw_api_key}')
+
+    def create_shipment(self, **kwargs):
+        """Create an active shipment with default metadata."""
+        data = {
+            'user': self.user,
+            'pickup_location': 'Tbilisi',
+            'pickup_date': timezone.now() + timedelta(days=1),
+            'delivery_location': 'Batumi',
+            'cargo_type': self.cargo_type,
+            'cargo_volume': Decimal('100'),
+            'volume_unit': self.volume_unit,
+            'transport_type': self.transport_type,
+            'preferred_currency': self.currency,
+        }
+        data.update(kwargs)
+        return Shipment.objects.create(**data)
+
+    def create_bid(self, **kwargs):
+        """Create a pending bid from the test platform."""
+        data = {
+            'shipment': self.shipment,
+            'platform': self.platform,
+            'company_name': 'Test Company',
+            'price': Decimal('250.00'),
+            'currency': self.currency,
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'external_user_id': 'driver-001',
+        }
+        data.update(kwargs)
+        return Bid.objects.create(**data)
+
+
+class BidCreateAPITestCase(BidAPITestCase):
+    """Test single bid submission."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = f'/api/v1/shipments/{self.shipment.id}/bids/'
+        self.bid_data = {
+            'company_name': 'Test Transport Ltd',
+            'price': '250.00',
+            'currency': 'GEL',
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'driver_id': 'driver-001'
+        }
+
+    def test_create_bid_query_budget(self):
+        """Test a submission costs the shipment lookup, the lock, one admission check and the INSERT."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, data=self.bid_data, format='json')
+        statements = [
+            query['sql'] for query in context.captured_queries
+            if 'SAVEPOINT' not in query['sql']
+        ]
+
+        # Two queries authenticate the API key
+        self.assertEqual(len(statements), 6, statements)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        bid = Bid.objects.get(id=response.data['data']['bid_id'])
+        self.assertEqual(bid.currency, self.currency)
+        self.assertIsNotNone(bid.display_id)
+
+    def test_create_bid_unknown_and_mismatching_currency(self):
+        """Test unknown and mismatching currencies are told apart."""
+        Currency.objects.create(code='USD', name='Dollar', symbol='$')
+
+        response = self.client.post(self.url, data={**self.bid_data, 'currency': 'XXX'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error']['message']['currency'], ['Invalid currency code'])
+
+        response = self.client.post(self.url, data={**self.bid_data, 'currency': 'USD'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['error']['message']['currency'],
+            ['Currency must match shipment preferred currency']
+        )
+
+    def test_exact_duplicate_conflict(self):
+        """Test resubmitting the same bid returns a conflict."""
+        response = self.client.post(self.url, data=self.bid_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(self.url, data=self.bid_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['error']['code'], 'BID_EXACT_DUPLICATE')
+
+
+class IdempotencyKeyAPITestCase(BidAPITestCase):
+    """Test Idempotency-Key handling on bid submission."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = f'/api/v1/shipments/{self.shipment.id}/bids/'
+        self.bid_data = {
+            'company_name': 'Test Transport Ltd',
+            'price': '250.00',
+            'currency': 'GEL',
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'driver_id': 'driver-001'
+        }
+
+    def post(self, data, key='retry-key-1'):
+        return self.client.post(self.url, data=data, format='json', HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_first_response(self):
+        """Test a retry gets the stored response without creating another bid."""
+        first = self.post(self.bid_data)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        with CaptureQueriesContext(connection) as context:
+            retry = self.post(self.bid_data)
+
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(retry.data['data']['bid_id'], first.data['data']['bid_id'])
+        self.assertEqual(Bid.objects.count(), 1)
+        self.assertFalse(any('bids' in query['sql'] for query in context.captured_queries))
+
+    def test_key_reused_for_different_request(self):
+        """Test a key cannot be reused with another body."""
+        self.post(self.bid_data)
+
+        response = self.post({**self.bid_data, 'price': '240.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(response.data['error']['code'], 'IDEMPOTENCY_KEY_REUSED')
+
+    def test_request_in_progress(self):
+        """Test a retry while the first request is unfinished is refused."""
+        self.post(self.bid_data)
+        IdempotencyKey.objects.update(response_status=None, response_body=None)
+
+        response = self.post(self.bid_data)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['error']['code'], 'IDEMPOTENCY_REQUEST_IN_PROGRESS')
+
+    def test_key_released_during_reservation(self):
+        """Test a key released by a failed competing request is claimed again instead of failing."""
+        self.post(self.bid_data)
+        IdempotencyKey.objects.update(response_status=None, response_body=None)
+        original_get = IdempotencyKey.objects.get
+
+        def release_then_get(*args, **kwargs):
+            # The competing request fails and deletes its reservation right before the lookup
+            IdempotencyKey.objects.all().delete()
+            return original_get(*args, **kwargs)
+
+        with mock.patch.object(IdempotencyKey.objects, 'get', side_effect=release_then_get):
+            response = self.post({**self.bid_data, 'price': '240.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+    def test_expired_key_runs_again(self):
+        """Test a key past its TTL is taken over by a new request."""
+        self.post(self.bid_data)
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        response = self.post({**self.bid_data, 'price': '240.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Bid.objects.count(), 2)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+
+class BidBatchCreateAPITestCase(BidAPITestCase):
+    """Test batch bid submission."""
+
+    url = '/api/v1/bids/batch/'
+
+    def bid_item(self, shipment=None, **kwargs):
+        data = {
+            'shipment_id': str((shipment or self.shipment).id),
+            'company_name': 'Test Transport Ltd',
+            'price': '250.00',
+            'currency': 'GEL',
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'driver_id': 'driver-001'
+        }
+        data.update(kwargs)
+        return data
+
+    def test_results_per_item(self):
+        """Test every bid of a batch gets its own result and error code."""
+        closed = self.create_shipment(status='completed')
+        self.create_bid(company_name='Test Transport Ltd', price=Decimal('300.00'))
+
+        response = self.client.post(self.url, data={'bids': [
+            self.bid_item(),
+            self.bid_item(),
+            self.bid_item(price='300.00'),
+            self.bid_item(shipment=closed),
+            self.bid_item(shipment_id='00000000-0000-0000-0000-000000000000'),
+            self.bid_item(currency='XXX', driver_id='driver-002'),
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['data']['results']
+        self.assertTrue(results[0]['success'])
+        codes = [result['error']['code'] for result in results[1:]]
+        self.assertEqual(codes, [
+            'BID_EXACT_DUPLICATE',
+            'BID_EXACT_DUPLICATE',
+            'SHIPMENT_NOT_ACTIVE',
+            'VALIDATION_ERROR',
+            'VALIDATION_ERROR',
+        ])
+        self.assertEqual(results[5]['error']['message']['currency'], ['Invalid currency code'])
+        self.assertEqual(response.data['data']['created'], 1)
+        self.assertEqual(Bid.objects.filter(id=results[0]['bid_id']).count(), 1)
+
+    def test_shipment_deleted_before_submission(self):
+        """Test a shipment removed after it was resolved refuses only its own bids."""
+        removed = self.create_shipment()
+        lock_shipments = managers.lock_shipments
+
+        def delete_then_lock(shipment_ids, **kwargs):
+            Shipment.objects.filter(pk=removed.pk).delete()
+            return lock_shipments(shipment_ids, **kwargs)
+
+        with mock.patch.object(managers, 'lock_shipments', side_effect=delete_then_lock):
+            response = self.client.post(self.url, data={'bids': [
+                self.bid_item(),
+                self.bid_item(shipment=removed),
+            ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['data']['results']
+        self.assertTrue(results[0]['success'])
+        self.assertEqual(results[1]['error']['code'], 'SHIPMENT_NOT_ACTIVE')
+        self.assertEqual(Bid.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_batch(self):
+        """Test a batch costs the same statements whatever its size."""
+        other_shipment = self.create_shipment()
+        items = [
+            self.bid_item(shipment=shipment, driver_id=f'driver-{number}')
+            for number in range(20)
+            for shipment in (self.shipment, other_shipment)
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, data={'bids': items}, format='json')
+        statements = [
+            query['sql'] for query in context.captured_queries
+            if 'SAVEPOINT' not in query['sql']
+        ]
+
+        # Auth (2), shipments, currencies, shipment locks, status re-read,
+        # three rule queries and the INSERT
+        self.assertEqual(len(statements), 10, statements)
+        self.assertEqual(response.data['data']['created'], 40)
+        self.assertEqual(Bid.objects.count(), 40)
+
+    def test_batch_size_limit(self):
+        """Test an oversized batch is rejected as a whole."""
+        response = self.client.post(self.url, data={
+            'bids': [self.bid_item(driver_id=f'driver-{number}') for number in range(101)]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Bid.objects.count(), 0)
+
+
+@override_settings(BID_INGESTION_MODE='async')
+class AsyncBidIngestionTestCase(BidAPITestCase):
+    """Test queued bid submission in async ingestion mode."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = f'/api/v1/shipments/{self.shipment.id}/bids/'
+        self.bid_data = {
+            'company_name': 'Test Transport Ltd',
+            'price': '250.00',
+            'currency': 'GEL',
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'driver_id': 'driver-001'
+        }
+
+    def test_submission_is_queued_then_processed(self):
+        """Test a bid is queued with 202 and created by the consumer."""
+        response = self.client.post(self.url, data=self.bid_data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(Bid.objects.count(), 0)
+        status_url = f"/api/v1/bid-submissions/{response.data['data']['tracking_id']}/"
+        self.assertEqual(self.client.get(status_url).data['data']['status'], 'queued')
+
+        self.assertEqual(BidSubmission.objects.process_batch(), 1)
+
+        data = self.client.get(status_url).data['data']
+        self.assertEqual(data['status'], 'created')
+        self.assertEqual(data['bid_status'], 'pending')
+        bid = Bid.objects.get(id=data['bid_id'])
+        self.assertEqual(bid.price, Decimal('250.00'))
+        self.assertEqual(bid.external_user_id, 'driver-001')
+
+    def test_rules_apply_when_processed(self):
+        """Test queued duplicates fail with the synchronous error codes."""
+        self.client.post(self.url, data=self.bid_data, format='json')
+        response = self.client.post(self.url, data=self.bid_data, format='json')
+        tracking_id = response.data['data']['tracking_id']
+
+        BidSubmission.objects.process_batch()
+
+        submission = BidSubmission.objects.get(id=tracking_id)
+        self.assertEqual(submission.status, 'failed')
+        self.assertEqual(submission.error_code, 'BID_EXACT_DUPLICATE')
+        self.assertEqual(Bid.objects.count(), 1)
+
+    def test_deleted_platform_submissions_fail(self):
+        """Test submissions of a platform deleted after queueing create no bids."""
+        response = self.client.post(self.url, data=self.bid_data, format='json')
+        Platform.objects.filter(pk=self.platform.pk).soft_delete(self.user)
+
+        BidSubmission.objects.process_batch()
+
+        submission = BidSubmission.objects.get(id=response.data['data']['tracking_id'])
+        self.assertEqual(submission.status, 'failed')
+        self.assertEqual(submission.error_code, 'PLATFORM_INACTIVE')
+        self.assertEqual(Bid.objects.count(), 0)
+
+    def test_deleted_owner_submissions_fail(self):
+        """Test submissions on a shipment whose owner was deleted after queueing create no bids."""
+        response = self.client.post(self.url, data=self.bid_data, format='json')
+        User.objects.filter(pk=self.user.pk).update(is_deleted=True)
+
+        BidSubmission.objects.process_batch()
+
+        submission = BidSubmission.objects.get(id=response.data['data']['tracking_id'])
+        self.assertEqual(submission.status, 'failed')
+        self.assertEqual(submission.error_code, 'SHIPMENT_NOT_FOUND')
+        self.assertEqual(Bid.objects.count(), 0)
+
+    def test_other_platform_cannot_track(self):
+        """Test a tracking ID is only visible to the submitting platform."""
+        response = self.client.post(self.url, data=self.bid_data, format='json')
+        other_platform = Platform.objects.create(
+            company_name='Other Platform',
+            contact_email='other@test.com',
+            contact_phone='+995555999777'
+        )
+        raw_key = PlatformAPIKey.generate_key()
+        api_key = PlatformAPIKey(platform=other_platform)
+        api_key.set_key(raw_key)
+        api_key.save()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {raw_key}')
+
+        response = self.client.get(f"/api/v1/bid-submissions/{response.data['data']['tracking_id']}/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class BidStatusAPITestCase(BidAPITestCase):
+    """Test the batch bid status endpoint."""
+
+    url = '/api/v1/my-bids/status/'
+
+    def test_requires_filter(self):
+        """Test that an empty lookup is rejected."""
+        response = self.client.post(self.url, data={}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error']['code'], 'VALIDATION_ERROR')
+
+    def test_lookup_by_ids_and_drivers(self):
+        """Test looking up bids by ID and by driver ID."""
+        first = self.create_bid()
+        second = self.create_bid(external_user_id='driver-002', price=Decimal('200.00'))
+        self.create_bid(external_user_id='driver-003', price=Decimal('150.00'))
+        first.reject()
+
+        response = self.client.post(self.url, data={
+            'bid_ids': [str(first.id)],
+            'driver_ids': ['driver-002'],
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statuses = {item['id']: item['status'] for item in response.data['data']['bids']}
+        self.assertEqual(statuses, {str(first.id): 'rejected', str(second.id): 'pending'})
+        self.assertFalse(response.data['data']['has_more'])
+
+    def test_changed_since_excludes_other_platforms(self):
+        """Test changed_since only returns recent bids of the calling platform."""
+        other_platform = Platform.objects.create(
+            company_name='Other Platform',
+            contact_email='other@test.com',
+            contact_phone='+995555999777'
+        )
+        old_bid = self.create_bid()
+        Bid.objects.filter(pk=old_bid.pk).update(updated_at=timezone.now() - timedelta(days=2))
+        recent_bid = self.create_bid(external_user_id='driver-002', price=Decimal('200.00'))
+        self.create_bid(platform=other_platform, external_user_id='driver-004')
+
+        response = self.client.post(self.url, data={
+            'changed_since': (timezone.now() - timedelta(days=1)).isoformat(),
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [item['id'] for item in response.data['data']['bids']]
+        self.assertEqual(ids, [str(recent_bid.id)])
+
+
+    def test_cursor_pages_through_bids_sharing_a_timestamp(self):
+        """Test paging terminates and returns every bid once when a bulk update gave them one updated_at."""
+        for index in range(5):
+            self.create_bid(external_user_id=f'driver-{index:03d}', price=Decimal(100 + index))
+        Bid.objects.update(updated_at=timezone.now())
+
+        seen = []
+        data = {'changed_since': (timezone.now() - timedelta(days=1)).isoformat()}
+        with mock.patch.object(PlatformBidStatusAPIView, 'max_results', 2):
+            for _ in range(5):
+                response = self.client.post(self.url, data=data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                seen += [item['id'] for item in response.data['data']['bids']]
+                if not response.data['data']['has_more']:
+                    break
+                data['cursor'] = response.data['data']['next_cursor']
+
+        self.assertFalse(response.data['data']['has_more'])
+        self.assertIsNone(response.data['data']['next_cursor'])
+        self.assertEqual(sorted(seen), sorted(str(bid_id) for bid_id in Bid.objects.values_list('id', flat=True)))
+        self.assertEqual(len(seen), 5)
+
+    def test_invalid_cursor(self):
+        """Test a tampered cursor is rejected."""
+        response = self.client.post(self.url, data={
+            'changed_since': timezone.now().isoformat(),
+            'cursor': 'not-a-cursor',
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error']['code'], 'VALIDATION_ERROR')
+
+
+class BidHistoryAPITestCase(BidAPITestCase):
+    """Test the archived bid history endpoint."""
+
+    def test_lists_archived_bids(self):
+        """Test bids of archived shipments move from my-bids to my-bids/history."""
+        bid = self.create_bid()
+        self.shipment.mark_completed(bid)
+        ArchivedShipment.objects.archive_batch(cutoff=timezone.now())
+
+        response = self.client.get('/api/v1/my-bids/')
+        self.assertEqual(response.data['data']['bids'], [])
+
+        response = self.client.get('/api/v1/my-bids/history/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        bids = response.data['data']['bids']
+        self.assertEqual([item['id'] for item in bids], [str(bid.id)])
+        self.assertEqual(bids[0]['status'], 'accepted')
+        self.assertEqual(bids[0]['shipment_id'], self.shipment.id)
+        self.assertEqual(response.data['data']['pagination']['total_items'], 1)
@@ -0,0 +1,651 @@
+import threading
+import time
+from io import StringIO
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.transaction import TransactionManagementError
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from apps.accounts.models import User
+from apps.metadata.models import Currency, CargoType, TransportType, VolumeUnit
+from apps.bids.models import Platform, Bid, BidKey, RejectedBidCache, PlatformDeletionJob
+from apps.bids.partitions import DEFAULT_PARTITION, ensure_partitions, existing_partitions
+from apps.shipments.models import Shipment
+from apps.common.ids import uuid7
+from apps.common.locks import lock_shipments
+
+
+class BidFixturesMixin:
+    """Shared fixtures for bid model tests."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='user@test.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User',
+            personal_id='12345678901',
+            mobile='+995555123456'
+        )
+
+        self.currency = Currency.objects.create(code='GEL', name='Lari', symbol='₾')
+        self.cargo_type = CargoType.objects.create(name='Food')
+        self.transport_type = TransportType.objects.create(name='Truck')
+        self.volume_unit = VolumeUnit.objects.create(name='Kilogram', abbreviation='kg')
+
+        self.platform = Platform.objects.create(
+            company_name='Test Platform',
+            contact_email='platform@test.com',
+            contact_phone='+995555999888'
+        )
+
+        self.shipment = self.create_shipment()
+
+    def create_shipment(self, **kwargs):
+        """Create an active shipment with default metadata."""
+        data = {
+            'user': self.user,
+            'pickup_location': 'Tbilisi',
+            'pickup_date': timezone.now() + timedelta(days=1),
+            'delivery_location': 'Batumi',
+            'cargo_type': self.cargo_type,
+            'cargo_volume': Decimal('100'),
+            'volume_unit': self.volume_unit,
+            'transport_type': self.transport_type,
+            'preferred_currency': self.currency,
+        }
+        data.update(kwargs)
+        return Shipment.objects.create(**data)
+
+    def build_bid(self, **kwargs):
+        """Build an unsaved pending bid from the test platform."""
+        data = {
+            'shipment': self.shipment,
+            'platform': self.platform,
+            'company_name': 'Test Company',
+            'price': Decimal('250.00'),
+            'currency': self.currency,
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'external_user_id': 'driver-001',
+        }
+        data.update(kwargs)
+        return Bid(**data)
+
+    def create_bid(self, **kwargs):
+        """Create a pending bid from the test platform."""
+        bid = self.build_bid(**kwargs)
+        bid.save()
+        return bid
+
+
+class BidModelTestCase(BidFixturesMixin, TestCase):
+    """Base test case for bid model tests."""
+
+
+class DisplayIdTestCase(BidModelTestCase):
+    """Test sequence-backed display IDs."""
+
+    def test_display_id_allocated_on_insert(self):
+        """Test display IDs are allocated in order and returned by the INSERT."""
+        first = self.create_bid()
+        second = self.create_bid(price=Decimal('200.00'))
+
+        self.assertIsNotNone(first.display_id)
+        self.assertEqual(second.display_id, first.display_id + 1)
+        self.assertEqual(Bid.objects.get(pk=second.pk).display_id, second.display_id)
+
+        shipment = self.create_shipment()
+        self.assertEqual(shipment.display_id, self.shipment.display_id + 1)
+
+    def test_display_id_allocated_on_bulk_create(self):
+        """Test bulk_create assigns a distinct display ID to every bid."""
+        bids = Bid.objects.bulk_create([
+            self.build_bid(price=Decimal(price)) for price in ('100.00', '110.00', '120.00')
+        ])
+
+        display_ids = [bid.display_id for bid in bids]
+        self.assertNotIn(None, display_ids)
+        self.assertEqual(len(set(display_ids)), 3)
+
+    def test_existing_display_id_is_kept(self):
+        """Test an explicitly set display ID is not overwritten."""
+        bid = self.create_bid(display_id=999999)
+
+        self.assertEqual(Bid.objects.get(pk=bid.pk).display_id, 999999)
+
+
+class TimeOrderedIdTestCase(BidModelTestCase):
+    """Test time-ordered (version 7) primary keys."""
+
+    def test_new_rows_get_ordered_uuid7_keys(self):
+        """Test new bids get version 7 keys that sort in creation order."""
+        bids = [self.create_bid(price=Decimal(price)) for price in ('100.00', '110.00', '120.00')]
+        bids += Bid.objects.bulk_create([self.build_bid(price=Decimal('130.00'))])
+
+        self.assertEqual({bid.id.version for bid in bids}, {7})
+        self.assertEqual(self.shipment.id.version, 7)
+        self.assertEqual(
+            list(Bid.objects.order_by('id').values_list('id', flat=True)),
+            [bid.id for bid in bids]
+        )
+
+    def test_uuid7_is_monotonic(self):
+        """Test keys generated within the same millisecond still increase."""
+        keys = [uuid7() for _ in range(1000)]
+
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(len(set(keys)), 1000)
+
+
+class AdmissionRulesTestCase(BidModelTestCase):
+    """Test BidManager.can_submit_bid rules."""
+
+    def can_submit(self, **kwargs):
+        data = {
+            'shipment': self.shipment,
+            'platform': self.platform,
+            'price': Decimal('250.00'),
+            'estimated_delivery_time': 6,
+            'currency': self.currency,
+            'company_name': 'Test Company',
+            'external_user_id': 'driver-001',
+        }
+        data.update(kwargs)
+        return Bid.objects.can_submit_bid(**data)
+
+    def test_rules_run_in_one_query(self):
+        """Test the duplicate and same-price checks share one query."""
+        self.create_bid()
+
+        with self.assertNumQueries(1):
+            can_submit, error_code, error_message = self.can_submit(price=Decimal('240.00'))
+
+        self.assertTrue(can_submit)
+        self.assertIsNone(error_code)
+
+    def test_rejected_duplicate(self):
+        """Test a rejected bid cannot be resubmitted, even by another company."""
+        self.create_bid().reject()
+
+        can_submit, error_code, error_message = self.can_submit(company_name='Other Company')
+
+        self.assertFalse(can_submit)
+        self.assertEqual(error_code, 'BID_DUPLICATE')
+
+    def test_exact_duplicate(self):
+        """Test an identical pending bid is refused."""
+        self.create_bid()
+
+        can_submit, error_code, error_message = self.can_submit()
+
+        self.assertFalse(can_submit)
+        self.assertEqual(error_code, 'BID_EXACT_DUPLICATE')
+
+    def test_same_price_requires_faster_delivery(self):
+        """Test a repeated price is only accepted with a shorter delivery time."""
+        self.create_bid()
+
+        can_submit, error_code, error_message = self.can_submit(estimated_delivery_time=8)
+        self.assertFalse(can_submit)
+        self.assertEqual(error_code, 'BID_PRICE_DUPLICATE')
+
+        can_submit, error_code, error_message = self.can_submit(estimated_delivery_time=4)
+        self.assertTrue(can_submit)
+
+    def test_closed_shipment_needs_no_query(self):
+        """Test bids on a closed shipment are refused without a query."""
+        self.shipment.status = 'completed'
+
+        with self.assertNumQueries(0):
+            can_submit, error_code, error_message = self.can_submit()
+
+        self.assertFalse(can_submit)
+        self.assertEqual(error_code, 'SHIPMENT_NOT_ACTIVE')
+
+
+class FingerprintTestCase(BidModelTestCase):
+    """Test duplicate detection through stored fingerprints."""
+
+    def test_fingerprint_ignores_decimal_formatting(self):
+        """Test equal prices written differently share a fingerprint."""
+        bid = self.create_bid()
+        values = {
+            'shipment_id': self.shipment.pk,
+            'platform_id': self.platform.pk,
+            'price': Decimal('250'),
+            'estimated_delivery_time': 6,
+            'currency_id': self.currency.pk,
+            'company_name': 'Test Company',
+            'external_user_id': 'driver-001',
+        }
+
+        self.assertEqual(Bid.fingerprint_for(values), bid.fingerprint)
+        self.assertNotEqual(Bid.fingerprint_for({**values, 'external_user_id': None}), bid.fingerprint)
+
+    def test_concurrent_duplicate_maps_to_error_code(self):
+        """Test an identical insert that slipped past the checks is refused by the index."""
+        self.create_bid()
+
+        bid, error_code, error_message = Bid.objects.create_bid(
+            shipment=self.shipment,
+            platform=self.platform,
+            company_name='Test Company',
+            price=Decimal('250.00'),
+            currency=self.currency,
+            estimated_delivery_time=6,
+            contact_person='John Doe',
+            contact_phone='+995555999888',
+            external_user_id='driver-001'
+        )
+
+        self.assertIsNone(bid)
+        self.assertEqual(error_code, 'BID_EXACT_DUPLICATE')
+        self.assertEqual(Bid.objects.count(), 1)
+
+    def test_other_integrity_errors_are_raised(self):
+        """Test conflicts on other constraints are not reported as duplicates."""
+        existing = self.create_bid()
+
+        with self.assertRaises(IntegrityError):
+            Bid.objects.create_bid(
+                shipment=self.shipment,
+                platform=self.platform,
+                company_name='Test Company',
+                price=Decimal('240.00'),
+                currency=self.currency,
+                estimated_delivery_time=6,
+                contact_person='John Doe',
+                contact_phone='+995555999888',
+                external_user_id='driver-001',
+                display_id=existing.display_id
+            )
+
+        with self.assertRaises(IntegrityError):
+            Bid.objects.create_bids([self.build_bid(price=Decimal('230.00'), display_id=existing.display_id)])
+
+    def test_rejected_cache_deduplicates_null_driver(self):
+        """Test rejecting identical bids without a driver ID caches them once."""
+        self.create_bid(external_user_id=None, company_name='First Company').reject()
+        self.create_bid(external_user_id=None, company_name='Second Company').reject()
+
+        self.assertEqual(RejectedBidCache.objects.count(), 1)
+
+
+class BatchAdmissionTestCase(BidModelTestCase):
+    """Test BidManager.can_submit_bids and create_bids."""
+
+    def candidate(self, **kwargs):
+        data = {
+            'shipment': self.shipment,
+            'price': Decimal('250.00'),
+            'estimated_delivery_time': 6,
+            'currency': self.currency,
+            'company_name': 'Test Company',
+            'external_user_id': 'driver-001',
+        }
+        data.update(kwargs)
+        return data
+
+    def test_batch_rules_match_single_rules(self):
+        """Test the batch check returns the same codes as can_submit_bid."""
+        self.create_bid().reject()
+        self.create_bid(price=Decimal('200.00'))
+        candidates = [
+            self.candidate(),
+            self.candidate(company_name='Other Company'),
+            self.candidate(price=Decimal('200.00'), estimated_delivery_time=8),
+            self.candidate(price=Decimal('200.00'), estimated_delivery_time=4),
+            self.candidate(external_user_id=None),
+        ]
+
+        with self.assertNumQueries(3):
+            results = Bid.objects.can_submit_bids(self.platform, candidates)
+
+        expected = [
+            Bid.objects.can_submit_bid(platform=self.platform, **candidate)
+            for candidate in candidates
+        ]
+        self.assertEqual([result[1] for result in results], [result[1] for result in expected])
+
+    def test_batch_checks_earlier_candidates(self):
+        """Test a candidate is checked against earlier candidates of its batch."""
+        results = Bid.objects.can_submit_bids(self.platform, [
+            self.candidate(),
+            self.candidate(),
+            self.candidate(estimated_delivery_time=8),
+            self.candidate(estimated_delivery_time=4),
+        ])
+
+        self.assertEqual(
+            [result[1] for result in results],
+            [None, 'BID_EXACT_DUPLICATE', 'BID_PRICE_DUPLICATE', None]
+        )
+
+    def test_create_bids_falls_back_on_conflict(self):
+        """Test a conflicting bid only fails itself when the bulk insert trips the index."""
+        self.create_bid()
+
+        results = Bid.objects.create_bids([
+            self.build_bid(price=Decimal('240.00')),
+            self.build_bid(),
+        ])
+
+        self.assertIsNotNone(results[0][0])
+        self.assertIsNotNone(results[0][0].display_id)
+        self.assertEqual(results[1][:2], (None, 'BID_EXACT_DUPLICATE'))
+        self.assertEqual(Bid.objects.count(), 2)
+
+
+class BulkRejectionTestCase(BidModelTestCase):
+    """Test set-based rejection of pending bids."""
+
+    def test_reject_pending_statement_count(self):
+        """Test rejecting many bids costs a constant number of statements."""
+        for number in range(30):
+            self.create_bid(external_user_id=f'driver-{number}')
+        accepted = self.create_bid(price=Decimal('100.00'))
+        accepted.accept()
+
+        with CaptureQueriesContext(connection) as context:
+            rejected, cached = self.shipment.bids.reject_pending()
+        statements = [
+            query['sql'] for query in context.captured_queries
+            if 'SAVEPOINT' not in query['sql']
+        ]
+
+        # Lock and read, UPDATE, cache INSERT
+        self.assertEqual(len(statements), 3)
+
+        self.assertEqual((rejected, cached), (30, 30))
+        self.assertEqual(self.shipment.bids.filter(status='rejected').count(), 30)
+        self.assertEqual(Bid.objects.get(pk=accepted.pk).status, 'accepted')
+        self.assertEqual(RejectedBidCache.objects.count(), 30)
+
+    def test_reject_pending_deduplicates_cache_entries(self):
+        """Test identical parameter sets are cached once, also across calls."""
+        self.create_bid(external_user_id=None, company_name='First Company').reject()
+        self.create_bid(external_user_id=None, company_name='Second Company')
+        self.create_bid(external_user_id=None, company_name='Third Company')
+
+        rejected, cached = self.shipment.bids.reject_pending()
+
+        self.assertEqual((rejected, cached), (2, 1))
+        self.assertEqual(RejectedBidCache.objects.count(), 1)
+
+    def test_mark_completed_rejects_other_bids(self):
+        """Test completing a shipment accepts one bid and rejects the rest."""
+        selected = self.create_bid()
+        other = self.create_bid(external_user_id='driver-002')
+
+        self.shipment.mark_completed(selected)
+
+        self.assertEqual(Bid.objects.get(pk=selected.pk).status, 'accepted')
+        self.assertEqual(Bid.objects.get(pk=other.pk).status, 'rejected')
+        # The shipment is closed, so no cache entries are written
+        self.assertFalse(RejectedBidCache.objects.exists())
+
+
+class PlatformSoftDeleteTestCase(BidModelTestCase):
+    """Test set-based platform soft delete and background deletion jobs."""
+
+    def setUp(self):
+        super().setUp()
+        self.other_platform = Platform.objects.create(
+            company_name='Other Platform',
+            contact_email='other@test.com',
+            contact_phone='+995555999777'
+        )
+        for number in range(5):
+            self.create_bid(external_user_id=f'driver-{number}')
+        self.create_bid(platform=self.other_platform)
+
+    def test_pending_counts_in_one_query(self):
+        """Test pending bid counts of a selection are grouped in one query."""
+        with self.assertNumQueries(1):
+            counts = {
+                platform.pk: platform.pending_count
+                for platform in Platform.objects.with_pending_bids_count()
+            }
+
+        self.assertEqual(counts, {self.platform.pk: 5, self.other_platform.pk: 1})
+
+    def test_soft_delete(self):
+        """Test soft delete rejects pending bids and updates only the selection."""
+        deleted, rejected = Platform.objects.filter(pk=self.platform.pk).soft_delete(self.user)
+
+        self.assertEqual((deleted, rejected), (1, 5))
+        self.platform.refresh_from_db()
+        self.assertTrue(self.platform.is_deleted)
+        self.assertFalse(self.platform.is_active)
+        self.assertEqual(self.platform.deleted_by, self.user)
+        self.assertFalse(Bid.objects.filter(platform=self.platform, status='pending').exists())
+        self.assertTrue(Bid.objects.filter(platform=self.other_platform, status='pending').exists())
+
+    def test_deletion_job_rejects_in_chunks(self):
+        """Test a background job rejects all bids and reports its progress."""
+        job = PlatformDeletionJob.objects.create(requested_by=self.user, total_bids=5)
+        job.platforms.set([self.platform])
+
+        job.run(chunk_size=2)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.rejected_bids, 5)
+        self.assertEqual(job.progress, 100)
+        self.assertTrue(Platform.objects.get(pk=self.platform.pk).is_deleted)
+        self.assertEqual(RejectedBidCache.objects.count(), 5)
+
+    def test_interrupted_job_is_resumed(self):
+        """Test the command takes over a running job only once it stopped making progress."""
+        job = PlatformDeletionJob.objects.create(requested_by=self.user, total_bids=5)
+        job.platforms.set([self.platform])
+        started_at = timezone.now() - timedelta(hours=1)
+        # A worker rejected two bids, then died
+        Bid.objects.filter(pk__in=list(
+            Bid.objects.filter(platform=self.platform).values_list('pk', flat=True)[:2]
+        )).reject_pending()
+        PlatformDeletionJob.objects.filter(pk=job.pk).update(
+            status='running', started_at=started_at, rejected_bids=2, updated_at=timezone.now()
+        )
+
+        call_command('run_platform_deletion_jobs', stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'running')
+
+        PlatformDeletionJob.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(minutes=30))
+        out = StringIO()
+        call_command('run_platform_deletion_jobs', stdout=out)
+
+        job.refresh_from_db()
+        self.assertIn(f'Job {job.pk} completed, 5 bids rejected', out.getvalue())
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.started_at, started_at)
+        self.assertFalse(Bid.objects.filter(platform=self.platform, status='pending').exists())
+        self.assertTrue(Platform.objects.get(pk=self.platform.pk).is_deleted)
+
+
+class BidPartitioningTestCase(BidModelTestCase):
+    """Test the monthly partitions of bids and the keys kept unique across them."""
+
+    january = datetime(2025, 1, 15, tzinfo=dt_timezone.utc)
+
+    def partition_of(self, bid):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT tableoid::regclass::text FROM bids WHERE id = %s', [bid.pk])
+            return cursor.fetchone()[0]
+
+    def test_keys_are_unique_across_partitions(self):
+        """Test a bid moved to another month still refuses its exact duplicate."""
+        bid = self.create_bid()
+        Bid.objects.filter(pk=bid.pk).update(created_at=self.january)
+
+        self.assertEqual(self.partition_of(bid), DEFAULT_PARTITION)
+        self.assertEqual(BidKey.objects.get().bid_id, bid.pk)
+        duplicate, error_code, error_message = Bid.objects.create_bid(
+            shipment=self.shipment,
+            platform=self.platform,
+            company_name='Test Company',
+            price=Decimal('250.00'),
+            currency=self.currency,
+            estimated_delivery_time=6,
+            contact_person='John Doe',
+            contact_phone='+995555999888',
+            external_user_id='driver-001'
+        )
+        self.assertIsNone(duplicate)
+        self.assertEqual(error_code, 'BID_EXACT_DUPLICATE')
+
+    def test_selected_bid_reference_is_enforced(self):
+        """Test shipments can select bids of any partition, but no missing bid."""
+        bid = self.create_bid()
+        self.shipment.mark_completed(bid)
+        Bid.objects.filter(pk=bid.pk).update(created_at=self.january)
+        connection.check_constraints()
+
+        self.assertEqual(Shipment.objects.get(pk=self.shipment.pk).selected_bid, bid)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Shipment.objects.filter(pk=self.shipment.pk).update(selected_bid_id=uuid7())
+            connection.check_constraints()
+
+    def test_partition_takes_rows_from_default(self):
+        """Test creating a month's partition moves its rows out of the default partition."""
+        bid = self.create_bid()
+        Bid.objects.filter(pk=bid.pk).update(created_at=self.january)
+
+        self.assertEqual(ensure_partitions([self.january]), ['bids_p2025_01'])
+
+        self.assertEqual(self.partition_of(bid), 'bids_p2025_01')
+        self.assertEqual(BidKey.objects.get().bid_id, bid.pk)
+        self.assertEqual(ensure_partitions([self.january]), [])
+
+    def test_command_creates_and_drops_partitions(self):
+        """Test the command adds the coming months and drops only expired empty months."""
+        bid = self.create_bid()
+        Bid.objects.filter(pk=bid.pk).update(created_at=self.january)
+        ensure_partitions([self.january, datetime(2025, 2, 1, tzinfo=dt_timezone.utc)])
+        out = StringIO()
+
+        call_command('maintain_bid_partitions', ahead=14, stdout=out)
+
+        partitions = existing_partitions()
+        self.assertIn('Dropped bids_p2025_02', out.getvalue())
+        self.assertNotIn('bids_p2025_02', partitions)
+        self.assertIn('bids_p2025_01', partitions)
+        self.assertIn(f'bids_p{timezone.now() + timedelta(days=400):%Y_%m}', partitions)
+        self.assertIn('1 kept because they still hold bids', out.getvalue())
+        self.assertEqual(Bid.objects.get().pk, bid.pk)
+
+
+class ShipmentLockingTestCase(BidFixturesMixin, TransactionTestCase):
+    """Test the shipment lock protocol between submissions and status changes."""
+
+    def submit(self, **kwargs):
+        data = {
+            'shipment': self.shipment,
+            'platform': self.platform,
+            'company_name': 'Test Company',
+            'price': Decimal('250.00'),
+            'currency': self.currency,
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'external_user_id': 'driver-001',
+        }
+        data.update(kwargs)
+        return Bid.objects.submit_bid(**data)
+
+    def run_in_thread(self, target):
+        """Run target in a thread with its own connection and return the thread."""
+        def run():
+            try:
+                target()
+            finally:
+                connection.close()
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def test_submission_waits_for_completion(self):
+        """Test a submission during completion waits and then sees the closed shipment."""
+        locked = threading.Event()
+
+        def complete():
+            with transaction.atomic():
+                self.shipment.lock_for_status_change()
+                Shipment.objects.filter(pk=self.shipment.pk).update(status='completed')
+                locked.set()
+                time.sleep(0.3)
+
+        thread = self.run_in_thread(complete)
+        self.assertTrue(locked.wait(5))
+        started = time.monotonic()
+        bid, error_code, error_message = self.submit()
+        waited = time.monotonic() - started
+        thread.join()
+
+        self.assertIsNone(bid)
+        self.assertEqual(error_code, 'SHIPMENT_NOT_ACTIVE')
+        self.assertGreater(waited, 0.1)
+        self.assertEqual(Bid.objects.count(), 0)
+
+    def test_submissions_do_not_block_each_other(self):
+        """Test a submission goes through while another one holds the shared lock."""
+        locked = threading.Event()
+        done = threading.Event()
+
+        def hold_shared_lock():
+            with transaction.atomic():
+                lock_shipments([self.shipment.pk], shared=True)
+                locked.set()
+                done.wait(5)
+
+        thread = self.run_in_thread(hold_shared_lock)
+        self.assertTrue(locked.wait(5))
+        started = time.monotonic()
+        bid, error_code, error_message = self.submit()
+        waited = time.monotonic() - started
+        done.set()
+        thread.join()
+
+        self.assertIsNotNone(bid)
+        self.assertLess(waited, 2)
+
+    def test_lock_requires_transaction(self):
+        """Test advisory locks cannot be taken in autocommit mode."""
+        with self.assertRaises(TransactionManagementError):
+            lock_shipments([self.shipment.pk])
+
+
+class RejectedBidCachePruningTestCase(BidModelTestCase):
+    """Test pruning cache entries of shipments that no longer accept bids."""
+
+    def test_prune_only_closed_shipments(self):
+        """Test entries are pruned in batches and only for non-active shipments."""
+        closed = self.create_shipment()
+        for number in range(3):
+            self.create_bid(shipment=closed, external_user_id=f'driver-{number}').reject()
+        self.create_bid().reject()
+        Shipment.objects.filter(pk=closed.pk).update(status='cancelled')
+
+        self.assertEqual(RejectedBidCache.objects.prune_batch(batch_size=2), 2)
+        self.assertEqual(RejectedBidCache.objects.prune_batch(batch_size=2), 1)
+        self.assertEqual(RejectedBidCache.objects.prune_batch(batch_size=2), 0)
+        self.assertEqual(list(RejectedBidCache.objects.values_list('shipment_id', flat=True)), [self.shipment.pk])
+
+    def test_command_reports_size(self):
+        """Test the command reports rows and table size before and after."""
+        closed = self.create_shipment(status='completed')
+        self.create_bid(shipment=closed).reject()
+        out = StringIO()
+
+        call_command('prune_rejected_bid_cache', stdout=out)
+
+        self.assertIn('Rows: 1 -> 0', out.getvalue())
+        self.assertIn('Table size:', out.getvalue())
+        self.assertFalse(RejectedBidCache.objects.exists())
@@ -0,0 +1,116 @@
+from io import StringIO
+from datetime import timedelta
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from apps.bids.models import Bid
+from apps.shipments.models import Shipment
+from apps.dashboard.managers import histogram_median
+from apps.dashboard.models import DailyStats
+from tests.test_shipment_admin import ShipmentAdminTestCase
+
+
+class DailyStatsTestCase(ShipmentAdminTestCase):
+    """Test the dashboard rollups and the admin dashboard."""
+
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.localdate()
+
+        self.create_shipment()
+        second = self.create_shipment()
+        self.create_bids(second, 1)
+        self.create_bids(second, 1, status='accepted')
+        third = self.create_shipment(status='completed', completed_at=timezone.now())
+        self.create_bids(third, 2)
+        self.create_bids(third, 1, status='rejected')
+
+        # A shipment from three days ago with one bid
+        old = self.create_shipment()
+        self.create_bids(old, 1, status='rejected')
+        three_days_ago = timezone.now() - timedelta(days=3)
+        Shipment.objects.filter(pk=old.pk).update(created_at=three_days_ago)
+        Bid.objects.filter(shipment=old).update(created_at=three_days_ago)
+
+    def test_refresh_rolls_up_days(self):
+        """Test refresh counts shipments, bids and bid distribution per day."""
+        DailyStats.objects.refresh(days=7)
+
+        today = DailyStats.objects.get(day=self.today)
+        self.assertEqual(today.shipments_created, 3)
+        self.assertEqual(today.shipments_completed, 1)
+        self.assertEqual(today.active_shipments, 3)
+        self.assertEqual((today.bids_created, today.bids_accepted, today.bids_rejected), (5, 1, 1))
+        self.assertEqual(today.bid_count_histogram, {'0': 1, '2': 1, '3': 1})
+
+        earlier = DailyStats.objects.get(day=self.today - timedelta(days=3))
+        self.assertEqual((earlier.shipments_created, earlier.bids_created), (1, 1))
+        self.assertEqual(DailyStats.objects.count(), 7)
+
+    def test_refresh_keeps_earlier_snapshots(self):
+        """Test re-running refresh updates rows in place and keeps past active counts."""
+        DailyStats.objects.create(day=self.today - timedelta(days=1), active_shipments=9)
+
+        DailyStats.objects.refresh(days=7)
+        DailyStats.objects.refresh(days=7)
+
+        self.assertEqual(DailyStats.objects.count(), 7)
+        self.assertEqual(DailyStats.objects.get(day=self.today - timedelta(days=1)).active_shipments, 9)
+
+    def test_dashboard_kpis(self):
+        """Test the KPIs are derived from the stored rows."""
+        DailyStats.objects.refresh(days=7)
+
+        with CaptureQueriesContext(connection) as queries:
+            stats = DailyStats.objects.dashboard()
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(stats['active_shipments'], 3)
+        self.assertEqual(stats['acceptance_rate'], 33)
+        self.assertEqual(stats['median_bids_per_shipment'], 1.5)
+        self.assertEqual(stats['bids_per_hour'], round(6 / 168, 1))
+        self.assertEqual(len(stats['stats_series']), 30)
+        self.assertEqual(stats['stats_series'][-1]['height'], 100)
+
+    def test_histogram_median(self):
+        """Test the median of a value histogram."""
+        self.assertIsNone(histogram_median({}))
+        self.assertEqual(histogram_median({0: 1, 2: 1, 3: 1}), 2)
+        self.assertEqual(histogram_median({1: 2, 4: 2}), 2.5)
+
+    def test_admin_index_shows_dashboard(self):
+        """Test the admin index renders the KPIs without touching shipments or bids."""
+        DailyStats.objects.refresh(days=7)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'აქტიური განაცხადები')
+        self.assertContains(response, '33%')
+        self.assertFalse([query for query in queries if 'FROM "bids"' in query['sql'] or 'FROM "shipments"' in query['sql']])
+
+    def test_client_index_has_no_dashboard(self):
+        """Test clients do not see the platform-wide KPIs."""
+        DailyStats.objects.refresh(days=7)
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_login(self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('stats_series', response.context)
+        self.assertNotContains(response, 'აქტიური განაცხადები')
+        self.assertFalse([query for query in queries if 'FROM "daily_stats"' in query['sql']])
+
+    def test_command(self):
+        """Test the refresh command reports the refreshed range."""
+        out = StringIO()
+
+        call_command('refresh_dashboard_stats', '--days', '30', stdout=out)
+
+        self.assertIn('30 days refreshed', out.getvalue())
+        self.assertEqual(DailyStats.objects.count(), 30)
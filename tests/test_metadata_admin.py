@@ -0,0 +1,51 @@
+from django.contrib.admin import site
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from apps.metadata.models import CargoType, Currency
+from tests.test_shipment_admin import ShipmentAdminTestCase
+
+
+class MetadataDeletePermissionTestCase(ShipmentAdminTestCase):
+    """Test metadata can only be deleted when no active shipment uses it."""
+
+    def setUp(self):
+        super().setUp()
+        self.request = RequestFactory().get('/admin/metadata/cargotype/')
+        self.request.user = self.admin
+
+    def test_used_metadata_cannot_be_deleted(self):
+        """Test metadata of an active shipment is protected, the rest is not."""
+        unused = CargoType.objects.create(name='Furniture')
+        completed_only = CargoType.objects.create(name='Fuel')
+        self.create_shipment()
+        self.create_shipment(cargo_type=completed_only, status='completed')
+        admin = site._registry[CargoType]
+
+        self.assertFalse(admin.has_delete_permission(self.request, self.cargo_type))
+        self.assertTrue(admin.has_delete_permission(self.request, unused))
+        self.assertTrue(admin.has_delete_permission(self.request, completed_only))
+
+    def test_one_grouped_query_per_request(self):
+        """Test checking many objects counts usage once per metadata type."""
+        cargo_types = [CargoType.objects.create(name=f'Cargo {index}') for index in range(5)]
+        for cargo_type in cargo_types:
+            self.create_shipment(cargo_type=cargo_type)
+        cargo_admin = site._registry[CargoType]
+        currency_admin = site._registry[Currency]
+
+        with CaptureQueriesContext(connection) as queries:
+            for cargo_type in cargo_types:
+                self.assertFalse(cargo_admin.has_delete_permission(self.request, cargo_type))
+            self.assertFalse(currency_admin.has_delete_permission(self.request, self.currency))
+            self.assertFalse(currency_admin.has_delete_permission(self.request, self.currency))
+
+        self.assertEqual(len(queries), 2)
+
+    def test_delete_view_is_forbidden_for_used_metadata(self):
+        """Test the delete page refuses metadata used by an active shipment."""
+        self.create_shipment()
+
+        response = self.client.get(f'/admin/metadata/cargotype/{self.cargo_type.pk}/delete/')
+
+        self.assertEqual(response.status_code, 403)
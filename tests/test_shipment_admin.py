@@ -0,0 +1,401 @@
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.contrib.admin import site
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import timedelta
+from decimal import Decimal
+from apps.accounts.models import User
+from apps.metadata.models import Currency, CargoType, TransportType, VolumeUnit
+from apps.bids.models import Platform, Bid
+from apps.common.paginators import EstimatedCountPaginator
+from apps.shipments.admin import ShipmentUserFilter
+from apps.shipments.models import Shipment
+
+
+class ShipmentAdminTestCase(TestCase):
+    """Base test case for shipment admin tests."""
+
+    changelist_url = '/admin/shipments/shipment/'
+
+    def setUp(self):
+        """Set up test data."""
+        self.admin = User.objects.create_superuser(
+            email='admin@test.com',
+            password='TestPass123!',
+            first_name='Admin',
+            last_name='User',
+            personal_id='10987654321'
+        )
+        self.user = User.objects.create_user(
+            email='user@test.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User',
+            personal_id='12345678901',
+            mobile='+995555123456'
+        )
+
+        self.currency = Currency.objects.create(code='GEL', name='Lari', symbol='₾')
+        self.cargo_type = CargoType.objects.create(name='Food')
+        self.transport_type = TransportType.objects.create(name='Truck')
+        self.volume_unit = VolumeUnit.objects.create(name='Kilogram', abbreviation='kg')
+
+        self.platform = Platform.objects.create(
+            company_name='Test Platform',
+            contact_email='platform@test.com',
+            contact_phone='+995555999888'
+        )
+        self.client.force_login(self.admin)
+
+    def create_shipment(self, **kwargs):
+        """Create an active shipment with default metadata."""
+        data = {
+            'user': self.user,
+            'pickup_location': 'Tbilisi',
+            'pickup_date': timezone.now() + timedelta(days=1),
+            'delivery_location': 'Batumi',
+            'cargo_type': self.cargo_type,
+            'cargo_volume': Decimal('100'),
+            'volume_unit': self.volume_unit,
+            'transport_type': self.transport_type,
+            'preferred_currency': self.currency,
+        }
+        data.update(kwargs)
+        return Shipment.objects.create(**data)
+
+    def create_bids(self, shipment, count, status='pending'):
+        """Create count bids from the test platform."""
+        return Bid.objects.bulk_create([
+            Bid(
+                shipment=shipment,
+                platform=self.platform,
+                company_name='Test Company',
+                price=Decimal(100 + index),
+                currency=self.currency,
+                estimated_delivery_time=6,
+                contact_person='John Doe',
+                contact_phone='+995555999888',
+                external_user_id=f'{status}-driver-{index}',
+                status=status
+            )
+            for index in range(count)
+        ])
+
+    def create_users(self, count, start=0):
+        """Create count client users with shipments."""
+        for index in range(start, start + count):
+            user = User.objects.create_user(
+                email=f'client-{index}@test.com',
+                password='TestPass123!',
+                first_name=f'Client{index}',
+                last_name='Owner',
+                personal_id=f'{index:011d}'
+            )
+            self.create_shipment(user=user)
+
+    def count_queries(self, url):
+        """Return the response and number of queries of a GET, without savepoints."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len([query for query in queries if 'SAVEPOINT' not in query['sql']])
+
+
+class ShipmentChangelistTestCase(ShipmentAdminTestCase):
+    """Test the shipment changelist."""
+
+    def test_bid_counts_are_annotated(self):
+        """Test the bid column shows total and pending counts."""
+        shipment = self.create_shipment()
+        self.create_bids(shipment, 2)
+        self.create_bids(shipment, 1, status='rejected')
+
+        response = self.client.get(self.changelist_url)
+
+        self.assertContains(response, '3 (2 მოლოდინში)')
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """Test listing more shipments does not cost more queries."""
+        for _ in range(2):
+            self.create_bids(self.create_shipment(), 3)
+        response, baseline = self.count_queries(self.changelist_url)
+
+        for _ in range(5):
+            self.create_bids(self.create_shipment(), 3)
+        response, queries = self.count_queries(self.changelist_url)
+
+        self.assertEqual(queries, baseline)
+
+    def test_bids_are_not_loaded(self):
+        """Test a shipment with thousands of bids lists without loading any bid rows."""
+        self.create_bids(self.create_shipment(), 3000)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.changelist_url)
+
+        self.assertContains(response, '3000 (3000 მოლოდინში)')
+        # Bid columns are only selected when bid rows are fetched; the counts are subqueries
+        self.assertFalse([query for query in queries if '"bids"."price"' in query['sql']])
+
+
+class ShipmentBidsPanelTestCase(ShipmentAdminTestCase):
+    """Test the paginated bids panel of the shipment change page."""
+
+    def setUp(self):
+        super().setUp()
+        self.shipment = self.create_shipment()
+        self.bids = self.create_bids(self.shipment, 30)
+
+    def panel_url(self, shipment=None, **params):
+        url = f'/admin/shipments/shipment/{(shipment or self.shipment).pk}/bids/'
+        if params:
+            url += '?' + '&'.join(f'{key}={value}' for key, value in params.items())
+        return url
+
+    def test_change_page_loads_panel_lazily(self):
+        """Test the change page renders the panel placeholder without any bid rows."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/admin/shipments/shipment/{self.shipment.pk}/change/')
+
+        self.assertContains(response, self.panel_url())
+        self.assertFalse([query for query in queries if 'FROM "bids"' in query['sql']])
+
+    def test_pages_are_sorted_by_price(self):
+        """Test pages follow the requested sort and link to the next page."""
+        first = self.client.get(self.panel_url(sort='-price'))
+        second = self.client.get(self.panel_url(sort='-price', page=2))
+
+        self.assertEqual(
+            [bid.price for bid in first.context['bids']],
+            sorted((bid.price for bid in self.bids), reverse=True)[:25]
+        )
+        self.assertTrue(first.context['has_next'])
+        self.assertEqual(len(second.context['bids']), 5)
+        self.assertFalse(second.context['has_next'])
+
+    def test_single_bid_query_per_page(self):
+        """Test a page costs one bid query however many bids the shipment has."""
+        self.create_bids(self.create_shipment(), 1)
+        response, baseline = self.count_queries(self.panel_url(sort='eta'))
+
+        self.create_bids(self.shipment, 200, status='rejected')
+        response, queries = self.count_queries(self.panel_url(sort='eta'))
+
+        self.assertEqual(queries, baseline)
+
+    def test_owner_gets_decision_links(self):
+        """Test only the shipment owner sees accept and reject links."""
+        response = self.client.get(self.panel_url())
+        self.assertNotContains(response, '/accept-bid/')
+
+        self.client.force_login(self.user)
+        response = self.client.get(self.panel_url())
+        self.assertContains(response, '/accept-bid/')
+
+    def test_other_clients_cannot_read_panel(self):
+        """Test a client cannot load the bids of someone else's shipment."""
+        other = User.objects.create_user(
+            email='other@test.com',
+            password='TestPass123!',
+            first_name='Other',
+            last_name='User',
+            personal_id='12345678902'
+        )
+        self.client.force_login(other)
+
+        response = self.client.get(self.panel_url())
+
+        self.assertEqual(response.status_code, 404)
+
+
+class ShipmentUserFilterTestCase(ShipmentAdminTestCase):
+    """Test the autocomplete user filter and the user lookup endpoint."""
+
+    lookup_url = '/admin/accounts/user/lookup/'
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_changelist_does_not_list_users(self):
+        """Test the filter does not load users, however many have shipments."""
+        self.create_users(2)
+        self.count_queries(self.changelist_url)
+        response, baseline = self.count_queries(self.changelist_url)
+
+        self.create_users(18, start=2)
+        response, queries = self.count_queries(self.changelist_url)
+
+        self.assertEqual(queries, baseline)
+        spec = next(spec for spec in response.context['cl'].filter_specs if isinstance(spec, ShipmentUserFilter))
+        self.assertEqual(spec.lookup_choices, [])
+        self.assertContains(response, 'data-user-filter')
+
+    def test_filter_by_selected_user(self):
+        """Test the selected user is shown and the list is filtered."""
+        own_shipment = self.create_shipment()
+        self.create_users(1)
+
+        response = self.client.get(f'{self.changelist_url}?applicant={self.user.pk}')
+
+        self.assertContains(response, 'Test User')
+        self.assertEqual(
+            [shipment.pk for shipment in response.context['cl'].result_list],
+            [own_shipment.pk]
+        )
+
+    def test_lookup_matches_prefixes(self):
+        """Test every word of the term has to start a name, email or company."""
+        self.create_users(2)
+
+        response = self.client.get(self.lookup_url, {'term': 'client1 OWN'})
+
+        self.assertEqual(response.json()['results'], [{
+            'id': str(User.objects.get(email='client-1@test.com').pk),
+            'text': 'Client1 Owner (client-1@test.com)',
+        }])
+        self.assertEqual(self.client.get(self.lookup_url, {'term': 'lient'}).json()['results'], [])
+
+    def test_lookup_is_cached(self):
+        """Test a repeated term is answered without querying users."""
+        self.create_users(2)
+        self.client.get(self.lookup_url, {'term': 'client'})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.lookup_url, {'term': ' Client '})
+
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertFalse([query for query in queries if 'FROM "users"' in query['sql'] and 'LIKE' in query['sql']])
+
+    def test_lookup_ignores_short_terms(self):
+        """Test one-letter terms return nothing without searching."""
+        self.create_users(1)
+
+        response = self.client.get(self.lookup_url, {'term': 'c'})
+
+        self.assertEqual(response.json()['results'], [])
+
+    def test_prefix_search_uses_index(self):
+        """Test the prefix condition can be answered from the lower(column) indexes."""
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            sql, params = User.objects.search_prefix('client').query.sql_with_params()
+            cursor.execute(f'EXPLAIN {sql}', params)
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+        self.assertIn('users_first_name_prefix_idx', plan)
+
+
+class EstimatedCountTestCase(ShipmentAdminTestCase):
+    """Test changelist counts switch to planner estimates on large results."""
+
+    def setUp(self):
+        super().setUp()
+        for _ in range(30):
+            self.create_shipment()
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE shipments')
+
+    def count_statements(self, url):
+        """Return the response and the COUNT statements run for a GET."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in queries if 'COUNT(*)' in query['sql']]
+
+    def test_small_results_are_counted_exactly(self):
+        """Test results below the threshold show the exact count."""
+        response, counts = self.count_statements(self.changelist_url)
+
+        self.assertEqual(response.context['cl'].result_count, 30)
+        self.assertFalse(response.context['cl'].paginator.is_estimate)
+        self.assertNotContains(response, 'დაახლოებით')
+        self.assertEqual(len(counts), 1)
+
+    def test_large_results_use_estimate(self):
+        """Test results above the threshold skip COUNT(*) and show an estimate."""
+        with mock.patch.object(EstimatedCountPaginator, 'estimate_threshold', 10):
+            response, counts = self.count_statements(f'{self.changelist_url}?status__exact=active')
+
+        self.assertTrue(response.context['cl'].paginator.is_estimate)
+        self.assertContains(response, 'დაახლოებით')
+        self.assertEqual(counts, [])
+
+    def test_estimate_follows_filters(self):
+        """Test the estimate is for the filtered query, not the whole table."""
+        paginator = EstimatedCountPaginator(Shipment.objects.filter(status='closed'), 25)
+
+        self.assertLess(paginator.estimated_count(), 30)
+        self.assertEqual(paginator.count, 0)
+
+
+class ShipmentUserAutocompleteTestCase(ShipmentAdminTestCase):
+    """Test the user field on the shipment form is an autocomplete."""
+
+    autocomplete_url = '/admin/autocomplete/'
+
+    def search(self, term):
+        """Query the admin autocomplete endpoint for the shipment user field."""
+        return self.client.get(self.autocomplete_url, {
+            'app_label': 'shipments',
+            'model_name': 'shipment',
+            'field_name': 'user',
+            'term': term,
+        })
+
+    def render_user_field(self, user):
+        """Render the shipment form's user field as the given user; return html and query count."""
+        request = RequestFactory().get('/admin/shipments/shipment/add/')
+        request.user = user
+        form = site._registry[Shipment].get_form(request)()
+        with CaptureQueriesContext(connection) as queries:
+            html = str(form['user'])
+        return html, len(queries)
+
+    def test_admin_form_does_not_list_users(self):
+        """Test the user field renders no options, however many users exist."""
+        self.create_users(2)
+        html, baseline = self.render_user_field(self.admin)
+
+        self.create_users(18, start=2)
+        html, queries = self.render_user_field(self.admin)
+
+        self.assertEqual(queries, baseline)
+        self.assertIn('admin-autocomplete', html)
+        self.assertNotIn('Client19', html)
+
+    def test_client_keeps_own_user_choice(self):
+        """Test clients still get a plain select holding only themselves."""
+        self.create_users(2)
+
+        html, queries = self.render_user_field(self.user)
+
+        self.assertNotIn('admin-autocomplete', html)
+        self.assertIn('Test User', html)
+        self.assertNotIn('Client1', html)
+
+    def test_autocomplete_matches_prefixes(self):
+        """Test the autocomplete returns users whose name or email starts with the term."""
+        self.create_users(12)
+
+        response = self.search('client1')
+
+        self.assertEqual(
+            sorted(result['text'] for result in response.json()['results']),
+            ['Client1 Owner', 'Client10 Owner', 'Client11 Owner']
+        )
+
+    def test_autocomplete_reads_only_displayed_columns(self):
+        """Test encrypted columns are not selected for the dropdown."""
+        self.create_users(2)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.search('client')
+
+        user_queries = [query['sql'] for query in queries if 'FROM "users"' in query['sql'] and 'LIKE' in query['sql']]
+        self.assertTrue(user_queries)
+        for sql in user_queries:
+            self.assertNotIn('personal_id', sql)
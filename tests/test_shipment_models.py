@@ -0,0 +1,205 @@
+from io import StringIO
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import timedelta
+from decimal import Decimal
+from apps.accounts.models import User
+from apps.metadata.models import Currency, CargoType, TransportType, VolumeUnit
+from apps.bids.models import Platform, Bid, RejectedBidCache
+from apps.shipments.models import Shipment
+from apps.archive.models import ArchivedShipment, ArchivedBid
+
+
+class ShipmentModelTestCase(TestCase):
+    """Base test case for shipment model tests."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email='user@test.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User',
+            personal_id='12345678901',
+            mobile='+995555123456'
+        )
+
+        self.currency = Currency.objects.create(code='GEL', name='Lari', symbol='₾')
+        self.cargo_type = CargoType.objects.create(name='Food')
+        self.transport_type = TransportType.objects.create(name='Truck')
+        self.volume_unit = VolumeUnit.objects.create(name='Kilogram', abbreviation='kg')
+
+        self.platform = Platform.objects.create(
+            company_name='Test Platform',
+            contact_email='platform@test.com',
+            contact_phone='+995555999888'
+        )
+
+    def create_shipment(self, **kwargs):
+        """Create an active shipment with default metadata."""
+        data = {
+            'user': self.user,
+            'pickup_location': 'Tbilisi',
+            'pickup_date': timezone.now() + timedelta(days=1),
+            'delivery_location': 'Batumi',
+            'cargo_type': self.cargo_type,
+            'cargo_volume': Decimal('100'),
+            'volume_unit': self.volume_unit,
+            'transport_type': self.transport_type,
+            'preferred_currency': self.currency,
+        }
+        data.update(kwargs)
+        return Shipment.objects.create(**data)
+
+    def create_bid(self, shipment, **kwargs):
+        """Create a pending bid from the test platform."""
+        data = {
+            'shipment': shipment,
+            'platform': self.platform,
+            'company_name': 'Test Company',
+            'price': Decimal('250.00'),
+            'currency': self.currency,
+            'estimated_delivery_time': 6,
+            'contact_person': 'John Doe',
+            'contact_phone': '+995555999888',
+            'external_user_id': 'driver-001',
+        }
+        data.update(kwargs)
+        return Bid.objects.create(**data)
+
+
+class ShipmentExpiryTestCase(ShipmentModelTestCase):
+    """Test cancelling shipments whose pickup date has passed."""
+
+    def setUp(self):
+        super().setUp()
+        self.expired = [
+            self.create_shipment(pickup_date=timezone.now() - timedelta(hours=hours))
+            for hours in (1, 2, 3)
+        ]
+        self.upcoming = self.create_shipment()
+        for shipment in self.expired + [self.upcoming]:
+            self.create_bid(shipment)
+
+    def test_cancel_expired_in_chunks(self):
+        """Test expired shipments are cancelled oldest first, one chunk at a time."""
+        cancelled, rejected = Shipment.objects.cancel_expired(limit=2)
+
+        self.assertEqual((cancelled, rejected), (2, 2))
+        self.assertEqual(
+            set(Shipment.objects.filter(status='cancelled').values_list('pk', flat=True)),
+            {self.expired[1].pk, self.expired[2].pk}
+        )
+        # Closed shipments accept no bids, so nothing is cached for them
+        self.assertEqual(RejectedBidCache.objects.count(), 0)
+
+    def test_command_is_idempotent(self):
+        """Test the command cancels every expired shipment and a re-run does nothing."""
+        call_command('expire_shipments', chunk_size=2, stdout=StringIO())
+
+        self.assertFalse(Shipment.objects.expired().exists())
+        self.assertEqual(Shipment.objects.get(pk=self.upcoming.pk).status, 'active')
+        self.assertEqual(Bid.objects.filter(status='pending').count(), 1)
+
+        out = StringIO()
+        call_command('expire_shipments', stdout=out)
+        self.assertIn('0 shipments cancelled', out.getvalue())
+
+    def test_grace_period(self):
+        """Test shipments inside the grace period stay active."""
+        call_command('expire_shipments', grace_hours=2.5, stdout=StringIO())
+
+        self.assertEqual(Shipment.objects.filter(status='cancelled').get().pk, self.expired[2].pk)
+
+
+class ShipmentArchivalTestCase(ShipmentModelTestCase):
+    """Test moving closed shipments and their bids to the archive tables."""
+
+    def setUp(self):
+        super().setUp()
+        closed_at = timezone.now() - timedelta(days=settings.ARCHIVE_AFTER_DAYS + 1)
+        self.completed = self.create_shipment()
+        accepted = self.create_bid(self.completed)
+        self.create_bid(self.completed, external_user_id='driver-002', price=Decimal('300.00'))
+        self.completed.mark_completed(accepted)
+        Shipment.objects.filter(pk=self.completed.pk).update(completed_at=closed_at)
+        self.accepted = accepted
+
+        self.cancelled = self.create_shipment()
+        self.create_bid(self.cancelled)
+        self.cancelled.mark_cancelled()
+        Shipment.objects.filter(pk=self.cancelled.pk).update(cancelled_at=closed_at)
+
+        self.recent = self.create_shipment()
+        self.create_bid(self.recent)
+        self.recent.mark_cancelled()
+        self.active = self.create_shipment()
+        self.create_bid(self.active)
+
+    def test_archive_batch_moves_shipments_with_bids(self):
+        """Test old closed shipments move to the archive with ids and bids intact."""
+        shipments, bids = ArchivedShipment.objects.archive_batch()
+
+        self.assertEqual((shipments, bids), (2, 3))
+        self.assertEqual(
+            set(Shipment.objects.values_list('pk', flat=True)),
+            {self.recent.pk, self.active.pk}
+        )
+        self.assertEqual(Bid.objects.count(), 2)
+
+        archived = ArchivedShipment.objects.get(pk=self.completed.pk)
+        self.assertEqual(archived.display_id, self.completed.display_id)
+        self.assertEqual(archived.status, 'completed')
+        self.assertEqual(archived.selected_bid_id, self.accepted.pk)
+        self.assertEqual(archived.selected_bid.status, 'accepted')
+        self.assertEqual(
+            sorted(archived.bids.values_list('status', flat=True)),
+            ['accepted', 'rejected']
+        )
+
+    def test_archive_batch_statement_count(self):
+        """Test a batch costs the same statements whatever the number of bids."""
+        for number in range(10):
+            bid = self.create_bid(self.cancelled, external_user_id=f'driver-1{number:02}', status='rejected')
+            RejectedBidCache.for_bid(bid).save()
+
+        with CaptureQueriesContext(connection) as context:
+            shipments, bids = ArchivedShipment.objects.archive_batch()
+        statements = [
+            query['sql'] for query in context.captured_queries
+            if 'SAVEPOINT' not in query['sql']
+        ]
+
+        # Shipment selection, two copies, selected bid reset and four deletes
+        self.assertEqual(len(statements), 8, statements)
+        self.assertEqual((shipments, bids), (2, 13))
+        self.assertFalse(Bid._base_manager.filter(shipment__in=[self.completed, self.cancelled]).exists())
+        self.assertFalse(RejectedBidCache.objects.filter(shipment=self.cancelled).exists())
+
+    def test_archive_batch_respects_limit(self):
+        """Test a batch moves at most limit shipments."""
+        self.assertEqual(ArchivedShipment.objects.archive_batch(limit=1)[0], 1)
+        self.assertEqual(ArchivedShipment.objects.count(), 1)
+
+    def test_command_is_idempotent(self):
+        """Test the command archives everything due and a re-run does nothing."""
+        call_command('archive_closed_shipments', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(ArchivedShipment.objects.count(), 2)
+        self.assertEqual(ArchivedBid.objects.count(), 3)
+
+        out = StringIO()
+        call_command('archive_closed_shipments', stdout=out)
+        self.assertIn('0 shipments and 0 bids archived', out.getvalue())
+
+    def test_dry_run(self):
+        """Test --dry-run only counts archivable shipments."""
+        out = StringIO()
+        call_command('archive_closed_shipments', dry_run=True, stdout=out)
+
+        self.assertIn('2 shipments would be archived', out.getvalue())
+        self.assertEqual(ArchivedShipment.objects.count(), 0)